@@ -62,6 +62,11 @@ def clone(
         "-b",
         help="備份衝突檔案後再覆蓋。",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="只處理上次同步後有變動的資源（無同步紀錄時退回完整掃描）。",
+    ),
     only: str | None = typer.Option(None, "--only", help="僅執行指定 phase"),
     skip: str | None = typer.Option(None, "--skip", help="跳過指定 phase"),
     target: str | None = typer.Option(None, "--target", help="限制分發 target"),
@@ -85,4 +90,5 @@ def clone(
         force=force,
         skip_conflicts=skip_conflicts,
         backup=backup,
+        incremental=incremental,
     )
@@ -22,7 +22,11 @@ from ..utils.mem_sync import (
     api_request,
     append_pulled_hashes,
     compute_content_hash,
+    find_local_content_hashes,
+    get_duplicate_hash_groups,
+    get_hash_index_stats,
     get_indexed_observation_ids,
+    get_observation_hashes,
     import_to_local_db,
     load_pulled_hashes,
     load_server_config,
@@ -36,6 +40,9 @@ from ..utils.mem_sync import (
 app = typer.Typer(help="管理 claude-mem 跨裝置同步（HTTP API backend）")
 console = Console()
 
+PULL_KEYS = ("sessions", "observations", "summaries", "prompts")
+PULL_PAGE_SIZE = 500
+
 
 def _normalize_summaries_for_push(
     summaries: list[dict[str, Any]],
@@ -178,8 +185,13 @@ def push() -> None:
     )
 
     pulled_hashes = load_pulled_hashes()
+    indexed_hashes = get_observation_hashes(
+        [o["id"] for o in observations if o.get("id") is not None]
+    )
     for obs in observations:
-        obs["sync_content_hash"] = compute_content_hash(obs)
+        obs["sync_content_hash"] = indexed_hashes.get(
+            obs.get("id")
+        ) or compute_content_hash(obs)
 
     observations_before_dedup = len(observations)
     observations = [
@@ -258,6 +270,75 @@ def push() -> None:
     )
 
 
+def _dedup_pulled_observations(
+    observations: list[dict[str, Any]],
+    seen_hashes: set[str],
+) -> tuple[list[dict[str, Any]], int]:
+    """以 content hash 排除本地已有的 observations，回傳 (保留清單, 排除數)。
+
+    本地是否已有走 sidecar hash 索引查詢；seen_hashes 記錄本次 pull
+    已保留的 hash，排除跨頁重複。
+    """
+    for obs in observations:
+        if not obs.get("sync_content_hash"):
+            obs["sync_content_hash"] = compute_content_hash(obs)
+    local_hashes = find_local_content_hashes(
+        list({obs["sync_content_hash"] for obs in observations})
+    )
+
+    kept: list[dict[str, Any]] = []
+    for obs in observations:
+        sync_hash = obs["sync_content_hash"]
+        if sync_hash in local_hashes or sync_hash in seen_hashes:
+            continue
+
+        seen_hashes.add(sync_hash)
+        kept.append(obs)
+    return kept, len(observations) - len(kept)
+
+
+def _import_pull_page(
+    page: dict[str, list],
+    import_methods: list[str],
+) -> dict[str, int]:
+    """匯入單頁 pull 資料（優先 HTTP API，fallback 直接寫 SQLite）。
+
+    worker 不可達後，同一次 pull 的後續頁面都直接寫 SQLite。
+    import_methods 紀錄每頁使用的方式，供最後摘要顯示。
+    """
+    import_payload = {
+        "sessions": page["sessions"],
+        "summaries": page["summaries"],
+        "observations": page["observations"],
+        "prompts": page["prompts"],
+    }
+
+    if "sqlite" not in import_methods:
+        try:
+            req = urllib.request.Request(
+                "http://localhost:37777/api/import",
+                data=json.dumps(import_payload).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            with urllib.request.urlopen(req, timeout=120) as resp:
+                import_result = json.loads(resp.read().decode("utf-8"))
+            import_methods.append("api")
+            return import_result.get("stats", {})
+        except urllib.error.URLError:
+            console.print(
+                "[yellow]claude-mem worker 未啟動，改用直接寫入 SQLite...[/yellow]"
+            )
+
+    try:
+        import_result = import_to_local_db(import_payload)
+    except FileNotFoundError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
+    import_methods.append("sqlite")
+    return import_result.get("stats", {})
+
+
 @app.command()
 def pull(
     reindex: bool = typer.Option(
@@ -271,62 +352,71 @@ def pull(
         help="拉取完成後清理本地重複 observations",
     ),
 ) -> None:
-    """從 sync server 拉取其他裝置的新資料。"""
+    """從 sync server 拉取其他裝置的新資料。
+
+    逐頁（每頁 500 筆）去重並匯入，每頁匯入後即寫回 `last_pull_epoch`，
+    中斷後下次從最後完成的頁面續拉；記憶體用量與待拉取筆數無關。
+    """
     config = _load_server_config_or_exit()
-    last_epoch = config.get("last_pull_epoch", 0)
+    since = config.get("last_pull_epoch", 0)
 
-    all_data: dict[str, list] = {
-        "sessions": [],
-        "observations": [],
-        "summaries": [],
-        "prompts": [],
-    }
-    since = last_epoch
-    server_epoch = since
+    seen_hashes: set[str] = set()
+    totals: dict[str, int] = {key: 0 for key in PULL_KEYS}
+    stats: dict[str, int] = {}
+    import_methods: list[str] = []
+    hash_excluded = 0
+    pages = 0
 
     while True:
         result = _api_request_or_exit(
             config,
             "GET",
-            f"/api/sync/pull?since={since}&limit=500",
+            f"/api/sync/pull?since={since}&limit={PULL_PAGE_SIZE}",
         )
-        for key in all_data:
-            all_data[key].extend(result.get(key, []))
-        server_epoch = result.get("server_epoch", server_epoch)
-        if not result.get("has_more"):
-            break
-        since = result.get("next_since", since)
+        page = {key: result.get(key, []) for key in PULL_KEYS}
+        fetched = sum(len(v) for v in page.values())
 
-    fetched_total = sum(len(v) for v in all_data.values())
-
-    local_obs = query_local_db(
-        "SELECT title, narrative, facts, project, type FROM observations"
-    )
-    local_hashes = {compute_content_hash(o) for o in local_obs}
-
-    observations_before_dedup = len(all_data["observations"])
-    filtered_observations: list[dict[str, Any]] = []
-    for obs in all_data["observations"]:
-        sync_hash = obs.get("sync_content_hash")
-        if not sync_hash:
-            sync_hash = compute_content_hash(obs)
-            obs["sync_content_hash"] = sync_hash
-
-        if sync_hash in local_hashes:
-            continue
-
-        local_hashes.add(sync_hash)
-        filtered_observations.append(obs)
+        if page["observations"]:
+            page["observations"], excluded = _dedup_pulled_observations(
+                page["observations"], seen_hashes
+            )
+            hash_excluded += excluded
 
-    hash_excluded = observations_before_dedup - len(filtered_observations)
-    all_data["observations"] = filtered_observations
+        if any(page.values()):
+            pages += 1
+            for key in PULL_KEYS:
+                totals[key] += len(page[key])
+            console.print(
+                f"[dim]第 {pages} 頁：{len(page['sessions'])} sessions, "
+                f"{len(page['observations'])} observations, "
+                f"{len(page['summaries'])} summaries, "
+                f"{len(page['prompts'])} prompts[/dim]"
+            )
+            page_stats = _import_pull_page(page, import_methods)
+            for key, value in page_stats.items():
+                stats[key] = stats.get(key, 0) + value
+            # 匯入成功後才記錄 pulled-hashes（避免失敗時誤記）
+            append_pulled_hashes(
+                [
+                    o["sync_content_hash"]
+                    for o in page["observations"]
+                    if o.get("sync_content_hash")
+                ]
+            )
 
-    total = sum(len(v) for v in all_data.values())
-    if total == 0:
-        if fetched_total > 0:
-            config["last_pull_epoch"] = server_epoch
+        has_more = bool(result.get("has_more"))
+        checkpoint = result.get("next_since", since) if has_more else result.get(
+            "server_epoch", since
+        )
+        # 每頁完成即寫回 checkpoint，中斷後可續拉
+        if fetched > 0:
+            config["last_pull_epoch"] = checkpoint
             save_server_config(config)
+        if not has_more:
+            break
+        since = checkpoint
 
+    if pages == 0:
         if hash_excluded > 0:
             console.print(
                 f"[green]無新資料需要拉取[/green] "
@@ -337,50 +427,18 @@ def pull(
         return
 
     console.print(
-        f"[cyan]拉取到：{len(all_data['sessions'])} sessions, "
-        f"{len(all_data['observations'])} observations, "
-        f"{len(all_data['summaries'])} summaries, "
-        f"{len(all_data['prompts'])} prompts[/cyan]"
+        f"[cyan]拉取到：{totals['sessions']} sessions, "
+        f"{totals['observations']} observations, "
+        f"{totals['summaries']} summaries, "
+        f"{totals['prompts']} prompts[/cyan]"
     )
     if hash_excluded > 0:
         console.print(f"[dim]hash 去重排除 {hash_excluded} observations[/dim]")
 
-    # 匯入到本地 claude-mem（優先 HTTP API，fallback 直接寫 SQLite）
-    import_payload = {
-        "sessions": all_data["sessions"],
-        "summaries": all_data["summaries"],
-        "observations": all_data["observations"],
-        "prompts": all_data["prompts"],
-    }
-
-    import_result: dict[str, Any] = {}
-    import_method = "api"
-
-    try:
-        req = urllib.request.Request(
-            "http://localhost:37777/api/import",
-            data=json.dumps(import_payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            import_result = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.URLError:
-        console.print(
-            "[yellow]claude-mem worker 未啟動，改用直接寫入 SQLite...[/yellow]"
-        )
-        import_method = "sqlite"
-        try:
-            import_result = import_to_local_db(import_payload)
-        except FileNotFoundError as e:
-            console.print(f"[bold red]{e}[/bold red]")
-            raise typer.Exit(code=1)
-
-    config["last_pull_epoch"] = server_epoch
-    save_server_config(config)
-
-    stats = import_result.get("stats", {})
-    method_label = "SQLite" if import_method == "sqlite" else "API"
+    method_label = "+".join(
+        "SQLite" if method == "sqlite" else "API"
+        for method in dict.fromkeys(import_methods)
+    )
     console.print(
         f"[bold green]Pull 完成[/bold green] ({method_label}) "
         f"imported: {stats.get('sessionsImported', 0)}s "
@@ -393,15 +451,6 @@ def pull(
         f"{stats.get('promptsSkipped', 0)}p"
     )
 
-    # 匯入成功後才記錄 pulled-hashes（避免失敗時誤記）
-    append_pulled_hashes(
-        [
-            o["sync_content_hash"]
-            for o in all_data["observations"]
-            if o.get("sync_content_hash")
-        ]
-    )
-
     # 顯式 post-process：reindex / cleanup 不再隱含執行
     obs_imported = stats.get("observationsImported", 0)
     did_cleanup = False
@@ -446,15 +495,7 @@ def status() -> None:
     config = _load_server_config_or_exit()
     result = _api_request_or_exit(config, "GET", "/api/sync/status")
 
-    local_obs = query_local_db(
-        "SELECT id, title, narrative, facts, project, type FROM observations"
-    )
-    hash_counts: dict[str, int] = {}
-    for obs in local_obs:
-        content_hash = compute_content_hash(obs)
-        hash_counts[content_hash] = hash_counts.get(content_hash, 0) + 1
-
-    local_duplicates = sum(count - 1 for count in hash_counts.values() if count > 1)
+    local_stats = get_hash_index_stats()
     pulled_count = len(load_pulled_hashes())
 
     table = Table(title="claude-mem Sync Status")
@@ -466,8 +507,8 @@ def status() -> None:
     table.add_row("Server prompts", str(result.get("prompts", 0)))
     table.add_row("Server devices", str(result.get("devices", 0)))
     table.add_row("───", "───")
-    table.add_row("Local observations", str(len(local_obs)))
-    table.add_row("Local duplicates", str(local_duplicates))
+    table.add_row("Local observations", str(local_stats["observations"]))
+    table.add_row("Local duplicates", str(local_stats["duplicates"]))
     table.add_row("Pulled hashes tracked", str(pulled_count))
     console.print(table)
 
@@ -485,21 +526,16 @@ def _cleanup_duplicates() -> int:
     優先保留已被 ChromaDB 索引的記錄；若都未索引則保留最小 ID。
     """
     observations = query_local_db(
-        "SELECT id, title, narrative, text, facts, project, type FROM observations ORDER BY id"
+        "SELECT id, title, narrative, text, project FROM observations ORDER BY id"
     )
     if not observations:
         return 0
 
     indexed_ids = get_indexed_observation_ids()
 
-    # Phase 1: content hash 分組（精確重複）
-    hash_groups: dict[str, list[int]] = {}
-    for obs in observations:
-        content_hash = compute_content_hash(obs)
-        hash_groups.setdefault(content_hash, []).append(obs["id"])
-
+    # Phase 1: content hash 分組（精確重複；由 sidecar hash 索引直接分組）
     duplicate_ids: list[int] = []
-    for ids in hash_groups.values():
+    for ids in get_duplicate_hash_groups():
         if len(ids) <= 1:
             continue
         indexed_in_group = [i for i in ids if i in indexed_ids]
@@ -716,13 +716,85 @@ def reconcile(
     ),
     force: bool = typer.Option(False, "--force", "-f", help="強制覆蓋衝突項目"),
     backup: bool = typer.Option(False, "--backup", help="備份衝突項目後覆蓋"),
+    all_projects: bool = typer.Option(
+        False, "--all", help="收斂 projection manifest 目錄下所有已追蹤專案"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="--all 時同時處理的專案數"
+    ),
+    json_output: bool = typer.Option(False, "--json", help="--all 時輸出 JSON 摘要"),
 ):
     """比對並收斂專案意圖、projection manifest 與實際生成檔。"""
     from script.utils.project_projection import reconcile_project
 
+    if all_projects:
+        if target:
+            console.print("[red]--all 不可與目標目錄同時使用[/red]")
+            raise typer.Exit(code=2)
+        _run_fleet_reconcile(force, backup, jobs, json_output)
+        return
+    if jobs is not None or json_output:
+        console.print("[red]--jobs / --json 僅適用於 --all[/red]")
+        raise typer.Exit(code=2)
+
     _run_project_projection("reconcile", reconcile_project, target, force, backup)
 
 
+def _run_fleet_reconcile(
+    force: bool, backup: bool, jobs: Optional[int], json_output: bool
+) -> None:
+    """收斂所有已追蹤專案並輸出摘要；有專案失敗時以 exit code 1 結束。"""
+    from script.utils.project_projection import reconcile_all_projects
+
+    template_dir = get_project_template_dir()
+    results = reconcile_all_projects(
+        template_dir=template_dir,
+        on_conflict=_resolve_conflict_mode(force, backup),
+        max_workers=jobs,
+        prepare=lambda project_dir: _ensure_project_exclude_config(project_dir, template_dir),
+    )
+
+    counts = {status: 0 for status in ("ok", "conflict", "missing", "error")}
+    for item in results:
+        counts[item.status] += 1
+
+    if json_output:
+        typer.echo(
+            json.dumps(
+                {
+                    "template_dir": str(template_dir),
+                    "totals": {"projects": len(results), **counts},
+                    "projects": [item.to_dict() for item in results],
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+    else:
+        styles = {"ok": "green", "conflict": "yellow", "missing": "dim", "error": "red"}
+        for item in results:
+            style = styles[item.status]
+            detail = item.error or ""
+            if item.result is not None:
+                detail = (
+                    f"生成 {len(item.result.generated)}、跳過 {len(item.result.skipped)}、"
+                    f"移除 {len(item.result.removed)}、衝突 {len(item.result.conflicts)}"
+                )
+            console.print(
+                f"[{style}]{item.status:<8}[/{style}] {item.project_id} "
+                f"[dim]{item.project_root or ''}[/dim] {detail}"
+            )
+        console.print()
+        console.print(
+            f"[green]reconcile --all 完成：{len(results)} 個專案[/green]"
+            f"（正常 {counts['ok']}、衝突 {counts['conflict']}、"
+            f"略過 {counts['missing']}、失敗 {counts['error']}）"
+        )
+
+    if counts["error"]:
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def doctor(
     target: Optional[str] = typer.Argument(
@@ -23,8 +23,8 @@ from rich.panel import Panel
 from rich.tree import Tree
 
 from ..utils.shared import (
-    disable_resource,
-    enable_resource,
+    apply_toggle_batch,
+    ToggleChange,
     get_target_path,
     list_disabled_resources,
 )
@@ -240,6 +240,19 @@ def compute_disabled_items(overlaps: dict, profile: dict) -> set:
     return to_disable
 
 
+def _profile_toggle_changes(target: str, plan: dict[str, tuple[set, set]]) -> list:
+    """將 {type: (要停用, 要啟用)} 轉成批次切換用的 ToggleChange 列表。"""
+    changes = []
+    for resource_type, (to_disable, to_enable) in plan.items():
+        changes.extend(
+            ToggleChange(target, resource_type, name, False) for name in sorted(to_disable)
+        )
+        changes.extend(
+            ToggleChange(target, resource_type, name, True) for name in sorted(to_enable)
+        )
+    return changes
+
+
 def sync_resources(disabled: dict, target: str = "claude", dry_run: bool = False) -> dict:
     """根據 disabled.yaml 同步實際的檔案狀態
 
@@ -300,51 +313,18 @@ def sync_resources(disabled: dict, target: str = "claude", dry_run: bool = False
             }
             return result
 
-        # 執行操作（靜默模式，避免每個操作都印出訊息）
-        success_count = 0
-        fail_count = 0
-
-        # 停用 skills
-        for name in skills_to_actually_disable:
-            if disable_resource(target, 'skills', name, quiet=True):
-                success_count += 1
-            else:
-                fail_count += 1
-
-        # 啟用 skills
-        for name in skills_to_enable:
-            if enable_resource(target, 'skills', name, quiet=True):
-                success_count += 1
-            else:
-                fail_count += 1
-
-        # 停用 commands
-        for name in commands_to_actually_disable:
-            if disable_resource(target, 'commands', name, quiet=True):
-                success_count += 1
-            else:
-                fail_count += 1
-
-        # 啟用 commands
-        for name in commands_to_enable:
-            if enable_resource(target, 'commands', name, quiet=True):
-                success_count += 1
-            else:
-                fail_count += 1
-
-        # 停用 agents
-        for name in agents_to_actually_disable:
-            if disable_resource(target, 'agents', name, quiet=True):
-                success_count += 1
-            else:
-                fail_count += 1
-
-        # 啟用 agents
-        for name in agents_to_enable:
-            if enable_resource(target, 'agents', name, quiet=True):
-                success_count += 1
-            else:
-                fail_count += 1
+        # 批次執行：並行搬移、只寫一次 toggle 配置，失敗時整批還原
+        changes = _profile_toggle_changes(
+            target,
+            {
+                'skills': (skills_to_actually_disable, skills_to_enable),
+                'commands': (commands_to_actually_disable, commands_to_enable),
+                'agents': (agents_to_actually_disable, agents_to_enable),
+            },
+        )
+        batch = apply_toggle_batch(changes)
+        success_count = len(batch.applied) + len(batch.skipped)
+        fail_count = len(changes) - success_count
 
         result['success'] = True
         result['disabled_count'] = len(skills_to_actually_disable) + len(commands_to_actually_disable) + len(agents_to_actually_disable)
@@ -750,50 +730,21 @@ def sync(
     console.print()
     console.print("[bold]執行同步...[/bold]")
 
-    success_count = 0
-    fail_count = 0
-
-    # 停用 skills
-    for name in skills_to_actually_disable:
-        if disable_resource(target, 'skills', name, quiet=True):
-            success_count += 1
-        else:
-            fail_count += 1
-
-    # 啟用 skills
-    for name in skills_to_enable:
-        if enable_resource(target, 'skills', name, quiet=True):
-            success_count += 1
-        else:
-            fail_count += 1
-
-    # 停用 commands
-    for name in commands_to_actually_disable:
-        if disable_resource(target, 'commands', name, quiet=True):
-            success_count += 1
-        else:
-            fail_count += 1
-
-    # 啟用 commands
-    for name in commands_to_enable:
-        if enable_resource(target, 'commands', name, quiet=True):
-            success_count += 1
-        else:
-            fail_count += 1
-
-    # 停用 agents
-    for name in agents_to_actually_disable:
-        if disable_resource(target, 'agents', name, quiet=True):
-            success_count += 1
-        else:
-            fail_count += 1
-
-    # 啟用 agents
-    for name in agents_to_enable:
-        if enable_resource(target, 'agents', name, quiet=True):
-            success_count += 1
-        else:
-            fail_count += 1
+    changes = _profile_toggle_changes(
+        target,
+        {
+            'skills': (skills_to_actually_disable, skills_to_enable),
+            'commands': (commands_to_actually_disable, commands_to_enable),
+            'agents': (agents_to_actually_disable, agents_to_enable),
+        },
+    )
+    batch = apply_toggle_batch(changes)
+    success_count = len(batch.applied) + len(batch.skipped)
+    fail_count = len(changes) - success_count
+    for change, reason in batch.failed:
+        console.print(f"  [red]✗ {change.resource_type}/{change.name}: {reason}[/red]")
+    if batch.rolled_back:
+        console.print("[red]同步過程發生錯誤，已還原本次所有變更[/red]")
 
     console.print()
     console.print(f"[green]✓ 同步完成: {success_count} 成功, {fail_count} 失敗[/green]")
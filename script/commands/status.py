@@ -7,6 +7,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ..utils.paths import get_project_root
+from ..utils.repo_probe import probe_repos
 from ..utils.shared import REPOS
 
 app = typer.Typer()
@@ -93,31 +94,28 @@ def _render_repo_status() -> None:
         "everything_claude_code": "everything-claude-code",
     }
 
-    for repo_key, (_, path_fn) in REPOS.items():
-        display_name = repo_display_names.get(repo_key, repo_key.replace("_", "-"))
-        path = path_fn()
+    repos = [
+        (repo_display_names.get(repo_key, repo_key.replace("_", "-")), path_fn())
+        for repo_key, (_, path_fn) in REPOS.items()
+    ]
+    git_paths = [path for _, path in repos if (path / ".git").exists()]
+    probes = dict(zip(git_paths, probe_repos(git_paths)))
+
+    for display_name, path in repos:
         if not path.exists():
             repo_table.add_row(display_name, "[red]未安裝[/red]")
             continue
-        if not (path / ".git").exists():
+        if path not in probes:
             repo_table.add_row(display_name, "目錄存在 (非 Git)")
             continue
 
-        try:
-            local_head = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                cwd=str(path), text=True, stderr=subprocess.DEVNULL,
-            ).strip()
-            remote_head = subprocess.check_output(
-                ["git", "rev-parse", "origin/main"],
-                cwd=str(path), text=True, stderr=subprocess.DEVNULL,
-            ).strip()
-            if local_head == remote_head:
-                repo_table.add_row(display_name, "[green]✓ 最新[/green]")
-            else:
-                repo_table.add_row(display_name, "[yellow]↑ 有可用更新[/yellow]")
-        except Exception:
+        probe = probes[path]
+        if not probe.ok or probe.in_sync_with_upstream is None:
             repo_table.add_row(display_name, "Git 儲存庫 (正常)")
+        elif probe.has_upstream_updates:
+            repo_table.add_row(display_name, "[yellow]↑ 有可用更新[/yellow]")
+        else:
+            repo_table.add_row(display_name, "[green]✓ 最新[/green]")
 
     console.print(repo_table)
     console.print()
@@ -159,6 +157,21 @@ def _render_upstream_sync_status() -> None:
     sync_table.add_column("同步於", style="dim")
     sync_table.add_column("狀態", style="green")
 
+    probe_paths = sorted(
+        {
+            sources_map[name]
+            for name, entry in last_sync.items()
+            if name in sources_map
+            and sources_map[name].exists()
+            and (entry or {}).get("commit")
+        }
+    )
+    heads = {
+        probe.path: probe.head
+        for probe in probe_repos(probe_paths)
+        if probe.ok
+    }
+
     for name in sorted(last_sync.keys()):
         entry = last_sync[name]
         sync_commit = entry.get("commit", "")
@@ -180,29 +193,26 @@ def _render_upstream_sync_status() -> None:
             sync_table.add_row(name, date_display, "[dim]? 無 commit 記錄[/dim]")
             continue
 
-        try:
-            current_head = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                cwd=str(repo_path), text=True, stderr=subprocess.DEVNULL,
-            ).strip()
-            if current_head == sync_commit:
-                sync_table.add_row(name, date_display, "[green]✓ 同步[/green]")
-            else:
-                try:
-                    count_output = subprocess.check_output(
-                        ["git", "rev-list", "--count", f"{sync_commit}..HEAD"],
-                        cwd=str(repo_path), text=True, stderr=subprocess.DEVNULL,
-                    ).strip()
-                    behind_count = int(count_output)
-                    sync_table.add_row(
-                        name,
-                        date_display,
-                        f"[yellow]⚠ 落後 {behind_count} 個 commit[/yellow]",
-                    )
-                except Exception:
-                    sync_table.add_row(name, date_display, "[yellow]⚠ 落後[/yellow]")
-        except Exception:
+        current_head = heads.get(repo_path)
+        if not current_head:
             sync_table.add_row(name, date_display, "[dim]? 無法比對[/dim]")
+        elif current_head == sync_commit:
+            sync_table.add_row(name, date_display, "[green]✓ 同步[/green]")
+        else:
+            # 只有 HEAD 不同時才需要額外計算落後的 commit 數
+            try:
+                count_output = subprocess.check_output(
+                    ["git", "rev-list", "--count", f"{sync_commit}..HEAD"],
+                    cwd=str(repo_path), text=True, stderr=subprocess.DEVNULL,
+                ).strip()
+                behind_count = int(count_output)
+                sync_table.add_row(
+                    name,
+                    date_display,
+                    f"[yellow]⚠ 落後 {behind_count} 個 commit[/yellow]",
+                )
+            except Exception:
+                sync_table.add_row(name, date_display, "[yellow]⚠ 落後[/yellow]")
 
     console.print(sync_table)
 
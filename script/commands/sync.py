@@ -39,6 +39,7 @@ from ..utils.sync_config import (
     to_tilde_path,
     write_gitattributes,
     write_gitignore,
+    write_sync_snapshots,
 )
 
 app = typer.Typer(help="管理跨裝置同步（Git backend）")
@@ -284,6 +285,7 @@ def init(
         "directories": directories,
     }
     save_sync_config(config)
+    write_sync_snapshots(config)
 
     console.print("[bold green]sync 初始化完成[/bold green]")
     console.print(f"[dim]repo 狀態：{action}[/dim]")
@@ -357,6 +359,7 @@ def push(
     committed = git_add_commit(repo_dir, generate_sync_commit_message())
 
     if not committed and not force:
+        write_sync_snapshots(config)
         console.print("[green]無變更需要同步[/green]")
         return
 
@@ -371,6 +374,7 @@ def push(
 
     config["last_sync"] = now_iso8601()
     save_sync_config(config)
+    write_sync_snapshots(config)
 
     console.print("[bold green]sync push 完成[/bold green]")
     console.print(
@@ -418,6 +422,7 @@ def pull(
     expand_paths_in_local(config)
     config["last_sync"] = now_iso8601()
     save_sync_config(config)
+    write_sync_snapshots(config)
 
     console.print("[bold green]sync pull 完成[/bold green]")
     console.print(
@@ -394,6 +394,13 @@ def update(
     skip: str | None = typer.Option(None, "--skip", help="跳過指定 phase"),
     target: str | None = typer.Option(None, "--target", help="限制分發 target"),
     dry_run: bool = typer.Option(False, "--dry-run", help="只顯示執行計畫，不實際寫入"),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="同時更新的儲存庫數量上限（預設 8）。",
+    ),
 ):
     """更新工具與拉取儲存庫。"""
     manifest = build_command_manifest()
@@ -408,4 +415,4 @@ def update(
         )
     except ValueError as exc:
         raise typer.BadParameter(str(exc)) from exc
-    execute_update_plan(plan)
+    execute_update_plan(plan, repo_jobs=jobs)
@@ -0,0 +1,102 @@
+"""比較 skill 樹 hash 的循序路徑與並行引擎。
+
+在暫存目錄產生合成 skill 樹（預設 10k 檔），分別量測：
+
+- legacy：舊版 rglob + 8 KiB 循序讀取
+- sequential：scan_skill_dirs(max_workers=1)，不經快取
+- parallel：scan_skill_dirs 預設並行，不經快取
+- cached：scan_skill_dirs 經 hash 快取（第二輪，全數命中）
+
+    uv run python script/dev_tools/bench_hashing.py --files 10000 --skills 200
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from script.utils import manifest as M  # noqa: E402
+from script.utils.hash_cache import FileHashCache  # noqa: E402
+
+
+def _build_tree(base: Path, files: int, skills: int, size: int) -> list[Path]:
+    per_skill = max(1, files // skills)
+    payload = os.urandom(size)
+    skill_dirs = []
+    for i in range(skills):
+        skill = base / f"skill-{i:04d}"
+        (skill / "references").mkdir(parents=True)
+        for j in range(per_skill):
+            sub = skill / "references" if j % 2 else skill
+            (sub / f"file-{j:04d}.md").write_bytes(payload + f"{i}-{j}".encode())
+        skill_dirs.append(skill)
+    # 拉開 mtime，讓快取可寫入（避開 racy 視窗）
+    past = time.time() - 60
+    for path in base.rglob("*"):
+        os.utime(path, (past, past))
+    return skill_dirs
+
+
+def _legacy_dir_hash(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    for file_path in sorted(path.rglob("*"), key=lambda p: str(p.relative_to(path))):
+        if not file_path.is_file():
+            continue
+        file_sha = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(8192), b""):
+                file_sha.update(chunk)
+        sha256.update(str(file_path.relative_to(path)).encode("utf-8"))
+        sha256.update(f"sha256:{file_sha.hexdigest()}".encode("utf-8"))
+    return f"sha256:{sha256.hexdigest()}"
+
+
+def _timed(label: str, fn) -> list[str]:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed * 1000:9.1f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument("--size", type=int, default=16 * 1024, help="每檔 bytes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        skill_dirs = _build_tree(base / "tree", args.files, args.skills, args.size)
+        cache = FileHashCache(base / "cache.json")
+        M.get_hash_cache = lambda: cache  # 隔離使用者的真實快取
+
+        print(
+            f"files={args.files} skills={args.skills} size={args.size}B "
+            f"workers={M.HASH_MAX_WORKERS}"
+        )
+        legacy = _timed("legacy", lambda: [_legacy_dir_hash(p) for p in skill_dirs])
+        seq = _timed(
+            "sequential",
+            lambda: [s.hash for s in M.scan_skill_dirs(skill_dirs, use_cache=False, max_workers=1)],
+        )
+        par = _timed(
+            "parallel",
+            lambda: [s.hash for s in M.scan_skill_dirs(skill_dirs, use_cache=False)],
+        )
+        M.scan_skill_dirs(skill_dirs)  # 暖快取
+        cached = _timed("cached", lambda: [s.hash for s in M.scan_skill_dirs(skill_dirs)])
+
+        assert legacy == seq == par == cached, "hash 結果不一致"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""比較 manifest 各儲存後端的讀寫時間。
+
+預設量測 `~/.config/ai-dev/manifests/` 下既有的 target manifest；沒有時（或
+指定 --entries）改用合成的 v2 manifest：
+
+- legacy：舊版 yaml.safe_load / yaml.dump（純 Python）
+- yaml-c：manifest_store 的 YAML 後端（有 libyaml 時走 CSafeLoader/CSafeDumper）
+- json：manifest_store 的 JSON 後端
+
+    uv run python script/dev_tools/bench_manifest.py
+    uv run python script/dev_tools/bench_manifest.py --entries 20000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from script.utils import manifest_store as S  # noqa: E402
+from script.utils.manifest import FileEntry, get_manifest_dir  # noqa: E402
+
+
+def _synthetic_manifest(entries: int, per_skill: int = 25) -> dict:
+    skills: dict = {}
+    for i in range(entries):
+        name = f"skill-{i // per_skill:04d}"
+        block = skills.setdefault(
+            name, {"hash": f"sha256:{i:064x}", "source": "custom-skills", "files": {}}
+        )
+        block["files"][f"references/file-{i:05d}.md"] = FileEntry(
+            src_hash=f"sha256:{i:064x}",
+            src_commit=f"{i:040x}",
+            src_source="custom-skills",
+            dst_hash_at_sync=f"sha256:{i:064x}",
+            decision="accepted",
+            decided_at="2026-03-01T12:00:00",
+        ).to_dict()
+    return {
+        "managed_by": "ai-dev",
+        "version": "bench",
+        "schema_version": 2,
+        "last_sync": "2026-03-01T12:00:00",
+        "target": "claude",
+        "last_sync_commit_by_source": {"custom-skills": "0" * 40},
+        "files": {"skills": skills, "commands": {}, "agents": {}, "workflows": {}},
+    }
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _legacy_dump(path: Path, data: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+
+
+def _legacy_load(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _bench(label: str, data: dict, tmp: Path, repeat: int) -> None:
+    legacy = tmp / "legacy.yaml"
+    fast_yaml = tmp / "fast.yaml"
+    fast_json = tmp / "fast.json"
+
+    rows = [
+        ("legacy", lambda: _legacy_dump(legacy, data), lambda: _legacy_load(legacy), legacy),
+        ("yaml-c", lambda: S.dump_document(fast_yaml, data), lambda: S.load_document(fast_yaml), fast_yaml),
+        ("json", lambda: S.dump_document(fast_json, data), lambda: S.load_document(fast_json), fast_json),
+    ]
+    print(f"\n{label}")
+    print(f"{'backend':<8} {'write ms':>10} {'read ms':>10} {'size KiB':>10}")
+    for name, write, read, path in rows:
+        write_ms = _best_of(repeat, write)
+        read_ms = _best_of(repeat, read)
+        assert read() == data
+        print(f"{name:<8} {write_ms:10.1f} {read_ms:10.1f} {path.stat().st_size / 1024:10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=0, help="改用 N 筆 FileEntry 的合成 manifest")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"libyaml: {'yes' if S.YamlLoader is not yaml.SafeLoader else 'no'}")
+    datasets: list[tuple[str, dict]] = []
+    if not args.entries:
+        manifest_dir = get_manifest_dir()
+        for stem in S.list_manifest_stems(manifest_dir):
+            path = S.find_manifest_file(manifest_dir, stem)
+            data = S.load_document(path) if path else None
+            if isinstance(data, dict):
+                datasets.append((str(path), data))
+    if not datasets:
+        entries = args.entries or 5000
+        datasets.append((f"synthetic ({entries} entries)", _synthetic_manifest(entries)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, data in datasets:
+            _bench(label, data, Path(tmp), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""比較目錄同步的 rsync、舊版 shutil 與並行引擎。
+
+在暫存目錄產生合成來源樹（預設 5k 檔），對每種引擎量測三個情境：
+
+- cold：目標為空目錄，全部新增
+- noop：目標已同步，只需比對
+- touch：修改 10% 檔案並刪除 5% 檔案後再同步
+
+    uv run python script/dev_tools/bench_sync.py --files 5000 --size 16384
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from script.utils import sync_config as S  # noqa: E402
+
+
+def _build_tree(base: Path, files: int, size: int) -> None:
+    payload = os.urandom(size)
+    for i in range(files):
+        sub = base / f"dir-{i % 50:02d}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"file-{i:05d}.md").write_bytes(payload + str(i).encode())
+
+
+def _mutate(base: Path) -> None:
+    files = sorted(p for p in base.rglob("*") if p.is_file())
+    for path in files[::10]:
+        path.write_bytes(path.read_bytes()[::-1])
+    for path in files[5::20]:
+        path.unlink()
+
+
+def _timed(label: str, fn) -> dict:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<18} {elapsed * 1000:9.1f} ms  "
+        f"+{result['added']} ~{result['updated']} -{result['deleted']}"
+    )
+    return result
+
+
+def _run_engine(name: str, sync, base: Path, src_template: Path) -> list[tuple]:
+    src = base / f"{name}-src"
+    dst = base / f"{name}-dst"
+    shutil.copytree(src_template, src)
+    dst.mkdir()
+    stats = [
+        _timed(f"{name}/cold", lambda: sync(src, dst, [], delete=True)),
+        _timed(f"{name}/noop", lambda: sync(src, dst, [], delete=True)),
+    ]
+    _mutate(src)
+    stats.append(_timed(f"{name}/touch", lambda: sync(src, dst, [], delete=True)))
+    return [(s["added"], s["updated"], s["deleted"]) for s in stats]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5_000)
+    parser.add_argument("--size", type=int, default=16 * 1024, help="每檔 bytes")
+    args = parser.parse_args()
+
+    engines = {
+        "shutil": S._sync_directory_shutil,
+        "parallel": S._sync_directory_parallel,
+    }
+    if shutil.which("rsync"):
+        engines = {"rsync": S._sync_directory_rsync, **engines}
+    else:
+        print("（未安裝 rsync，略過 rsync 量測）")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        template = base / "template"
+        _build_tree(template, args.files, args.size)
+
+        print(
+            f"files={args.files} size={args.size}B workers={S.SYNC_MAX_WORKERS}"
+        )
+        results = {
+            name: _run_engine(name, sync, base, template)
+            for name, sync in engines.items()
+        }
+
+        expected = results["shutil"]
+        for name, stats in results.items():
+            assert stats == expected, f"{name} 統計結果與 shutil 不一致：{stats}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""一次性轉換 `~/.config/ai-dev/manifests/` 下的 target manifest 格式。
+
+轉換後請設定 `AI_DEV_MANIFEST_FORMAT` 為相同格式，否則下一次寫入會再轉回
+預設的 YAML（讀取兩種格式都支援，不會遺失資料）。
+
+    uv run python script/dev_tools/convert_manifests.py --to json
+    uv run python script/dev_tools/convert_manifests.py --to yaml
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from script.utils.manifest import get_manifest_dir  # noqa: E402
+from script.utils.manifest_store import (  # noqa: E402
+    MANIFEST_FORMAT_ENV,
+    MANIFEST_FORMATS,
+    convert_manifests,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--to", choices=MANIFEST_FORMATS, required=True)
+    parser.add_argument("--dir", type=Path, default=None, help="manifest 目錄（預設 ~/.config/ai-dev/manifests）")
+    args = parser.parse_args()
+
+    directory = args.dir or get_manifest_dir()
+    converted = convert_manifests(directory, args.to)
+    for src, dst in converted:
+        print(f"{src.name} -> {dst.name}")
+    print(f"已轉換 {len(converted)} 個 manifest")
+    print(f"請設定 {MANIFEST_FORMAT_ENV}={args.to}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,124 @@
+import importlib
+from typing import Optional
+
 import typer
 from importlib.metadata import version as get_version
+from typer.core import TyperGroup
+
+# 子命令註冊表：名稱 → (模組, 屬性, 補全用簡短說明)。
+# 模組只在該子命令實際被呼叫（或列出完整 --help）時才 import，
+# 讓 `ai-dev --version`、shell 補全與 hooks 不必載入 shared.py / Rich / YAML。
+# 屬性為函式時註冊成單一命令，為 Typer 時註冊成子命令群組。
+LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "install": ("script.commands.install", "install", "首次安裝 AI 開發環境。"),
+    "update": ("script.commands.update", "update", "更新工具與拉取儲存庫。"),
+    "clone": ("script.commands.clone", "clone", "分發 Skills 到各工具目錄。"),
+    "install-npx-skills": (
+        "script.main",
+        "install_npx_skills_cmd",
+        "安裝 upstream/npx-skills.yaml 列出的 skill（等同 install --only npx-skills）。",
+    ),
+    "status": ("script.commands.status", "status", "檢查環境狀態與工具版本。"),
+    "list": (
+        "script.commands.list",
+        "list_resources",
+        "列出已安裝的 Skills、Commands、Agents（包含停用的）。",
+    ),
+    "toggle": ("script.commands.toggle", "toggle", "啟用/停用特定工具的特定資源。"),
+    "add-repo": ("script.commands.add_repo", "add_repo", "新增上游 repo 並開始追蹤。"),
+    "add-custom-repo": (
+        "script.commands.add_custom_repo",
+        "add_custom_repo",
+        "新增自訂 repo 並開始追蹤。",
+    ),
+    "update-custom-repo": (
+        "script.commands.update_custom_repo",
+        "update_custom_repo",
+        "更新所有自訂 repo。",
+    ),
+    "init-from": (
+        "script.commands.init_from",
+        "init_from",
+        "從客製化模板 repo 初始化專案目錄。",
+    ),
+    "test": ("script.commands.test", "test", "執行測試並輸出原始結果。"),
+    "coverage": ("script.commands.coverage", "coverage", "執行覆蓋率分析並輸出原始結果。"),
+    "derive-tests": (
+        "script.commands.derive_tests",
+        "derive_tests",
+        "讀取 OpenSpec specs 檔案內容。",
+    ),
+    "tui": ("script.main", "tui", "啟動互動式 TUI 介面。"),
+    "project": ("script.commands.project", "app", "專案級別的初始化與更新操作"),
+    "standards": ("script.commands.standards", "app", "管理標準體系配置（基於重疊檢測）"),
+    "hooks": ("script.commands.hooks", "app", "ECC Hooks Plugin management commands"),
+    "maintain": ("script.commands.maintain", "app", "維護 custom-skills 專案本身"),
+    "sync": ("script.commands.sync", "app", "管理跨裝置同步（Git backend）"),
+    "mem": (
+        "script.commands.mem",
+        "app",
+        "管理 claude-mem 跨裝置同步（HTTP API backend）",
+    ),
+    "ecc": (
+        "script.commands.ecc",
+        "app",
+        "ECC（everything-claude-code）白名單與 catalog 管理",
+    ),
+}
+
+
+def load_lazy_command(name: str):
+    """import 子命令模組並轉成 click 命令（或群組）。"""
+    module_name, attr, _help = LAZY_COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attr)
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_group(target)
+    else:
+        single = typer.Typer()
+        single.command(name=name)(target)
+        command = typer.main.get_command(single)
+    command.name = name
+    return command
+
+
+class LazyTyperGroup(TyperGroup):
+    """依 `LAZY_COMMANDS` 延遲載入子命令的根群組。"""
 
-from .commands.install import install
-from .commands.update import update
-from .commands.clone import clone
-from .commands.status import status
-from .commands.list import list_resources
-from .commands.toggle import toggle
-from .commands.add_repo import add_repo
-from .commands.add_custom_repo import add_custom_repo
-from .commands.update_custom_repo import update_custom_repo
-from .commands.init_from import init_from
-from .commands.test import test
-from .commands.coverage import coverage
-from .commands.derive_tests import derive_tests
-from .commands import project
-from .commands import standards
-from .commands import hooks
-from .commands import maintain
-from .commands import sync
-from .commands import mem
-from .commands import ecc
+    def list_commands(self, ctx) -> list[str]:
+        return [*self.commands, *(n for n in LAZY_COMMANDS if n not in self.commands)]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in LAZY_COMMANDS:
+            self.commands[cmd_name] = load_lazy_command(cmd_name)
+        return self.commands.get(cmd_name)
+
+    def shell_complete(self, ctx, incomplete: str):
+        # 子命令名稱與說明取自註冊表，不 import 任何子命令模組；
+        # 只借用 Command 層的選項補全，避開 Group.shell_complete 逐一 get_command。
+        from click.shell_completion import CompletionItem
+
+        results = _command_shell_complete(self, ctx, incomplete)
+        results.extend(
+            CompletionItem(name, help=help_text)
+            for name, (_module, _attr, help_text) in LAZY_COMMANDS.items()
+            if name.startswith(incomplete)
+        )
+        return results
+
+
+def _command_shell_complete(command, ctx, incomplete: str) -> list:
+    """呼叫 Command 層的 shell_complete（只補全選項）。
+
+    uv.lock 鎖定的 typer 以 click.Command 為基底；較新的 typer 內建自己的
+    Command 類別，此時改用 TyperGroup MRO 中的 Command。
+    """
+    import click
+
+    if issubclass(TyperGroup, click.Command):
+        base = click.Command
+    else:
+        base = next(cls for cls in TyperGroup.__mro__ if cls.__name__ == "Command")
+    return list(base.shell_complete(command, ctx, incomplete))
 
 
 def get_app_version() -> str:
@@ -39,7 +137,11 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
-app = typer.Typer(help="AI Development Environment Setup CLI", no_args_is_help=True)
+app = typer.Typer(
+    help="AI Development Environment Setup CLI",
+    no_args_is_help=True,
+    cls=LazyTyperGroup,
+)
 
 
 @app.callback()
@@ -57,14 +159,11 @@ def main_callback(
     pass
 
 
-app.command()(install)
-app.command()(update)
-app.command()(clone)
-
-
-@app.command("install-npx-skills")
 def install_npx_skills_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", help="顯示將執行的命令但不實際執行"),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="scope=project 時同時安裝的 package 數（預設 4）"
+    ),
 ) -> None:
     """安裝 upstream/npx-skills.yaml 列出的 skill（等同 install --only npx-skills）。"""
     from script.services.npx_skills import run_npx_skills_phase
@@ -75,26 +174,9 @@ def install_npx_skills_cmd(
         project_yaml=get_npx_skills_project_yaml(),
         user_yaml=get_npx_skills_user_yaml(),
         dry_run=dry_run,
+        max_workers=jobs,
     )
 
-app.command()(status)
-app.command(name="list")(list_resources)
-app.command()(toggle)
-app.command(name="add-repo")(add_repo)
-app.command(name="add-custom-repo")(add_custom_repo)
-app.command(name="update-custom-repo")(update_custom_repo)
-app.command(name="init-from")(init_from)
-app.command()(test)
-app.command()(coverage)
-app.command(name="derive-tests")(derive_tests)
-app.add_typer(project.app, name="project")
-app.add_typer(standards.app, name="standards")
-app.add_typer(hooks.app, name="hooks")
-app.add_typer(maintain.app, name="maintain")
-app.add_typer(sync.app, name="sync")
-app.add_typer(mem.app, name="mem")
-app.add_typer(ecc.app, name="ecc")
-
 
 def tui():
     """啟動互動式 TUI 介面。"""
@@ -104,7 +186,5 @@ def tui():
     app_tui.run()
 
 
-app.command()(tui)
-
 if __name__ == "__main__":
     app()
@@ -5,7 +5,9 @@ from script.services.npx_skills.config import (
     ensure_user_yaml,
 )
 from script.services.npx_skills.install import (
+    NpxEntryResult,
     build_add_command,
+    build_batch_add_command,
     build_update_command,
     run_npx_skills_phase,
 )
@@ -19,7 +21,9 @@ __all__ = [
     "NpxSkillsConfig",
     "SkillEntry",
     "ensure_user_yaml",
+    "NpxEntryResult",
     "build_add_command",
+    "build_batch_add_command",
     "build_update_command",
     "run_npx_skills_phase",
     "cleanup_skills_from_manifests",
@@ -37,7 +37,8 @@ class NpxSkillsConfig:
         defaults = NpxDefaults(
             agents=defaults_raw.get("agents", "*"),
             scope=defaults_raw.get("scope", "global"),
-            yes=bool(defaults_raw.get("yes", True)),
+            # YAML 1.1 會把未加引號的 `yes` 鍵解析成布林 True
+            yes=bool(defaults_raw.get("yes", defaults_raw.get(True, True))),
         )
         entries: list[SkillEntry] = []
         for pkg in data.get("packages") or []:
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+import subprocess
 from typing import Literal
 
 from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
 
 from script.services.npx_skills.config import (
     NpxDefaults,
@@ -11,12 +16,33 @@ from script.services.npx_skills.config import (
     SkillEntry,
     ensure_user_yaml,
 )
-from script.utils.system import check_command_exists, run_command
+from script.utils.system import check_command_exists, get_os, run_command
 
 console = Console()
 
 Mode = Literal["add", "update"]
 
+# 不同 package 各自獨立，可同時執行；同一 package 內仍依序處理
+NPX_MAX_WORKERS = 4
+# 並行時輸出會被收集，失敗時只顯示最後幾行
+_FAILURE_TAIL_LINES = 5
+
+
+@dataclass(frozen=True)
+class NpxEntryResult:
+    """單一 skill 的 npx 執行結果。"""
+
+    entry: SkillEntry
+    returncode: int
+    batched: bool = False
+    output: str = ""
+    # 批次 add 失敗、改為逐個安裝時保留批次呼叫的輸出（含失敗原因）
+    batch_output: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
 
 def build_add_command(entry: SkillEntry, defaults: NpxDefaults) -> list[str]:
     cmd = ["npx", "skills", "add", f"{entry.repo}@{entry.skill}"]
@@ -28,6 +54,19 @@ def build_add_command(entry: SkillEntry, defaults: NpxDefaults) -> list[str]:
     return cmd
 
 
+def build_batch_add_command(
+    repo: str, skills: list[str], defaults: NpxDefaults
+) -> list[str]:
+    """同一 package 的多個 skill 合併為一次 `npx skills add <repo> --skill a b`。"""
+    cmd = ["npx", "skills", "add", repo, "--skill", *skills]
+    if defaults.scope == "global":
+        cmd.append("-g")
+    cmd += ["-a", defaults.agents]
+    if defaults.yes:
+        cmd.append("--yes")
+    return cmd
+
+
 def build_update_command(entry: SkillEntry, defaults: NpxDefaults) -> list[str]:
     # npx skills update 僅支援 -g / -p / -y（不支援 -a）；agents 綁定由安裝時決定。
     cmd = ["npx", "skills", "update", entry.skill]
@@ -38,19 +77,136 @@ def build_update_command(entry: SkillEntry, defaults: NpxDefaults) -> list[str]:
     return cmd
 
 
+def group_entries_by_repo(entries: tuple[SkillEntry, ...]) -> dict[str, list[SkillEntry]]:
+    """依 repo 分組（保留設定檔中的先後順序）。"""
+    groups: dict[str, list[SkillEntry]] = {}
+    for entry in entries:
+        groups.setdefault(entry.repo, []).append(entry)
+    return groups
+
+
+def _run_npx(cmd: list[str], capture: bool) -> tuple[int, str]:
+    """執行 npx 命令；capture=True 時收集輸出，避免並行時交錯顯示。
+
+    收集輸出時 stdin 改接 DEVNULL：`--yes` 是傳給 skills CLI 的，npx 自身在
+    套件未快取時仍會詢問 "Ok to proceed?"；stdin 非 TTY 時 npx 直接視為同意，
+    不會卡在看不到的提示上。
+    """
+    if not capture:
+        return run_command(cmd, check=False).returncode, ""
+    try:
+        result = subprocess.run(
+            cmd,
+            check=False,
+            text=True,
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            shell=get_os() == "windows",
+        )
+    except OSError as exc:
+        return 127, str(exc)
+    return result.returncode, (result.stdout or "") + (result.stderr or "")
+
+
+def _run_package(
+    entries: list[SkillEntry],
+    *,
+    mode: Mode,
+    defaults: NpxDefaults,
+    capture: bool,
+) -> list[NpxEntryResult]:
+    """執行單一 package 的所有 skill。
+
+    add 模式先以一次呼叫安裝整個 package；批次失敗時（例如其中一個 skill
+    名稱已不存在）退回逐個安裝，以取得每個 skill 各自的結果；批次呼叫的
+    輸出記在每筆結果的 batch_output，保留批次失敗的真正原因。
+    """
+    batch_output = ""
+    if mode == "add" and len(entries) > 1:
+        cmd = build_batch_add_command(
+            entries[0].repo, [entry.skill for entry in entries], defaults
+        )
+        returncode, batch_output = _run_npx(cmd, capture)
+        if returncode == 0:
+            return [
+                NpxEntryResult(entry, 0, batched=True, output=batch_output)
+                for entry in entries
+            ]
+        # 無輸出時仍需非空字串，才能標記「批次失敗、已改逐個安裝」
+        batch_output = batch_output or f"退出碼 {returncode}"
+
+    results: list[NpxEntryResult] = []
+    for entry in entries:
+        if mode == "add":
+            cmd = build_add_command(entry, defaults)
+        else:
+            cmd = build_update_command(entry, defaults)
+        returncode, output = _run_npx(cmd, capture)
+        results.append(
+            NpxEntryResult(entry, returncode, output=output, batch_output=batch_output)
+        )
+    return results
+
+
+def _print_tail(output: str) -> None:
+    """顯示收集到的輸出的最後幾行。"""
+    for line in output.strip().splitlines()[-_FAILURE_TAIL_LINES:]:
+        console.print(f"    [dim]{escape(line)}[/dim]", highlight=False)
+
+
+def _failure_hint(mode: Mode, returncode: int) -> str:
+    if mode == "update":
+        return f"退出碼 {returncode}（skill 可能尚未安裝，請先執行 ai-dev install-npx-skills）"
+    return f"退出碼 {returncode}（可能已裝或來源不符）"
+
+
+def _print_summary(mode: Mode, results: list[NpxEntryResult]) -> None:
+    table = Table(title=f"npx-skills {mode} 結果")
+    table.add_column("Skill", style="cyan")
+    table.add_column("Package")
+    table.add_column("結果")
+    for result in results:
+        if result.ok:
+            status = "[green]✓ 完成[/green]" + (" [dim](批次)[/dim]" if result.batched else "")
+        else:
+            status = f"[yellow]⚠ {_failure_hint(mode, result.returncode)}[/yellow]"
+        table.add_row(result.entry.skill, result.entry.repo, status)
+    console.print(table)
+
+    failed = sum(1 for result in results if not result.ok)
+    console.print(
+        f"[bold cyan][npx-skills][/bold cyan] 完成 {len(results) - failed}/{len(results)}"
+        + (f"，[yellow]{failed} 個失敗[/yellow]" if failed else "")
+    )
+
+
 def run_npx_skills_phase(
     *,
     mode: Mode,
     project_yaml: Path,
     user_yaml: Path,
     dry_run: bool = False,
-) -> None:
-    """執行 npx-skills phase。mode=add 用於 install；mode=update 用於 update。"""
+    max_workers: int | None = None,
+) -> list[NpxEntryResult]:
+    """執行 npx-skills phase。mode=add 用於 install；mode=update 用於 update。
+
+    add 模式同一 package 的 skill 合併為一次 `npx skills add`。scope=project
+    且 defaults.yes 為 true 時，第一個 package 單獨執行以預熱 npx 快取，其餘
+    以最多 `max_workers`（預設 NPX_MAX_WORKERS）個並行執行。以下情況一律
+    依序執行並直接顯示輸出：
+
+    - scope=global：每次 `-g` 安裝 / 更新都會改寫 ~/.agents/.skill-lock.json，
+      並行時後寫入者會覆蓋前者的紀錄。
+    - defaults.yes 為 false：npx 可能需要互動。
+
+    Returns:
+        list[NpxEntryResult]: 依設定檔順序的每個 skill 結果（略過或 dry-run 時為空）
+    """
     if not check_command_exists("npx"):
         console.print(
             "[red]✗ npx 未安裝，略過 npx-skills phase。請先安裝 Node.js（或 npm/npx）。[/red]"
         )
-        return
+        return []
 
     if not project_yaml.exists():
         console.print(
@@ -58,44 +214,78 @@ def run_npx_skills_phase(
             "[dim]   custom-skills clone 可能過時，請執行 "
             "`cd ~/.config/custom-skills && git pull` 後重試。[/dim]"
         )
-        return
+        return []
 
     ensure_user_yaml(project_path=project_yaml, user_path=user_yaml)
     config = NpxSkillsConfig.load(user_yaml)
-    total = len(config.entries)
+    groups = group_entries_by_repo(config.entries)
+    total = len(groups)
 
     console.print(
         f"[bold cyan][npx-skills][/bold cyan] 讀取 {user_yaml} "
-        f"({total} 個 skill, {len({e.repo for e in config.entries})} 個 package)"
+        f"({len(config.entries)} 個 skill, {total} 個 package)"
     )
 
-    for idx, entry in enumerate(config.entries, start=1):
-        prefix = f"[{idx}/{total}]"
-        if mode == "add":
-            cmd = build_add_command(entry, config.defaults)
-        else:
-            cmd = build_update_command(entry, config.defaults)
-
-        console.print(f"{prefix} {entry.repo}@{entry.skill}")
-        if dry_run:
-            console.print(f"  [dim][dry-run] {' '.join(cmd)}[/dim]")
-            continue
-        result = run_command(cmd, check=False)
-        if result.returncode == 0:
-            console.print(f"  [green]✓[/green] 完成")
-        elif mode == "update":
-            console.print(
-                f"  [yellow]⚠[/yellow] 退出碼 {result.returncode}"
-                "（skill 可能尚未安裝，請先執行 ai-dev install-npx-skills）"
-            )
-        else:
-            console.print(
-                f"  [yellow]⚠[/yellow] 退出碼 {result.returncode}（可能已裝或來源不符）"
-            )
+    if dry_run:
+        for idx, entries in enumerate(groups.values(), start=1):
+            console.print(f"[{idx}/{total}] {entries[0].repo} ({len(entries)} 個 skill)")
+            if mode == "add" and len(entries) > 1:
+                skills = [entry.skill for entry in entries]
+                cmds = [build_batch_add_command(entries[0].repo, skills, config.defaults)]
+            elif mode == "add":
+                cmds = [build_add_command(entries[0], config.defaults)]
+            else:
+                cmds = [build_update_command(entry, config.defaults) for entry in entries]
+            for cmd in cmds:
+                console.print(f"  [dim][dry-run] {' '.join(cmd)}[/dim]")
+        return []
+
+    workers = max(1, min(max_workers or NPX_MAX_WORKERS, total or 1))
+    if not config.defaults.yes or config.defaults.scope == "global":
+        workers = 1
+    capture = workers > 1
+
+    def _run(item: tuple[int, list[SkillEntry]]) -> list[NpxEntryResult]:
+        idx, entries = item
+        if not capture:
+            console.print(f"[{idx}/{total}] {entries[0].repo} ({len(entries)} 個 skill)")
+        package_results = _run_package(
+            entries, mode=mode, defaults=config.defaults, capture=capture
+        )
+        batch_output = package_results[0].batch_output if package_results else ""
+        if not capture:
+            if batch_output:
+                console.print("  [yellow]⚠[/yellow] 批次安裝失敗，已改為逐個安裝")
+            return package_results
+
+        failed = [result for result in package_results if not result.ok]
+        mark = "[yellow]⚠[/yellow]" if failed or batch_output else "[green]✓[/green]"
+        console.print(f"{mark} [{idx}/{total}] {entries[0].repo} ({len(entries)} 個 skill)")
+        if batch_output:
+            console.print("  [yellow]批次安裝失敗，已改為逐個安裝：[/yellow]")
+            _print_tail(batch_output)
+        for result in failed:
+            console.print(f"  [yellow]{escape(result.entry.skill)}：[/yellow]")
+            _print_tail(result.output)
+        return package_results
+
+    items = list(enumerate(groups.values(), start=1))
+    if workers == 1:
+        per_package = [_run(item) for item in items]
+    else:
+        # 冷快取時多個 npx 會同時下載 skills CLI 而互相干擾，先單獨跑第一個
+        per_package = [_run(items[0])]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_package.extend(executor.map(_run, items[1:]))
+
+    # 依設定檔順序排列結果
+    by_entry = {result.entry: result for batch in per_package for result in batch}
+    results = [by_entry[entry] for entry in config.entries if entry in by_entry]
+    _print_summary(mode, results)
 
     # add 模式執行完畢後，把 npx 接管的 skill 從 ai-dev manifest 移除，
     # 避免 clone 的 conflict 誤判與 upstream prescan 重新記錄。
-    if mode == "add" and not dry_run:
+    if mode == "add":
         from script.services.npx_skills.manifest_sync import cleanup_skills_from_manifests
 
         npx_names = [entry.skill for entry in config.entries]
@@ -106,3 +296,4 @@ def run_npx_skills_phase(
                 f"[dim]已從 {len(removed)} 個 target manifest 移除 "
                 f"{total_removed} 個條目（改由 npx 管理）[/dim]"
             )
+    return results
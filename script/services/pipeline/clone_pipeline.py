@@ -42,6 +42,7 @@ def _build_source_summary(plan: ExecutionPlan) -> list[dict]:
         read_manifest,
         is_v2,
     )
+    from script.utils.manifest_store import list_manifest_stems
 
     sources = _collect_sources()
     if not sources:
@@ -51,8 +52,7 @@ def _build_source_summary(plan: ExecutionPlan) -> list[dict]:
     last_commits: dict[str, str] = {}
     manifest_dir = get_manifest_dir()
     if manifest_dir.exists():
-        for path in manifest_dir.glob("*.yaml"):
-            target_name = path.stem
+        for target_name in list_manifest_stems(manifest_dir):
             m = read_manifest(target_name)
             if not is_v2(m):
                 continue
@@ -92,6 +92,7 @@ def execute_clone_plan(
     force: bool = False,
     skip_conflicts: bool = False,
     backup: bool = False,
+    incremental: bool = False,
 ) -> None:
     migrate_legacy_codex_skills(dry_run=plan.dry_run)
     try:
@@ -127,6 +128,7 @@ def execute_clone_plan(
                 force=force,
                 skip_conflicts=skip_conflicts,
                 backup=backup,
+                incremental=incremental,
             )
         else:
             raise ValueError(f"Unsupported clone phase: {phase}")
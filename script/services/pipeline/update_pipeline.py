@@ -12,7 +12,7 @@ from script.utils.paths import get_npx_skills_project_yaml, get_npx_skills_user_
 console = Console()
 
 
-def execute_update_plan(plan: ExecutionPlan) -> None:
+def execute_update_plan(plan: ExecutionPlan, *, repo_jobs: int | None = None) -> None:
     migrate_legacy_codex_skills(dry_run=plan.dry_run)
 
     if plan.dry_run:
@@ -26,7 +26,7 @@ def execute_update_plan(plan: ExecutionPlan) -> None:
         if phase == "tools":
             run_tools_phase(plan=plan)
         elif phase == "repos":
-            run_repos_phase(plan=plan)
+            run_repos_phase(plan=plan, max_workers=repo_jobs)
         elif phase == "npx-skills":
             run_npx_skills_phase(
                 mode="update",
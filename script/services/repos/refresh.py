@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import io
+import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from rich.console import Console
+from rich.markup import escape
 
 from script.models.execution_plan import ExecutionPlan
 from script.utils.custom_repos import load_custom_repos
+from script.utils.repo_probe import probe_repo
 from script.utils.paths import (
     get_antigravity_config_dir,
     get_claude_agents_dir,
@@ -36,36 +42,18 @@ from script.utils.system import check_command_exists, run_command
 
 console = Console()
 
-def get_current_branch(repo: Path) -> str | None:
-    result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        cwd=str(repo),
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
-    return None
+# `ai-dev update` 同時 fetch 的儲存庫上限；可由 `--jobs` 覆寫
+REPO_REFRESH_MAX_WORKERS = 8
+# 單一儲存庫 fetch / reset 的逾時秒數，避免單一 remote 卡住整個 update
+REPO_REFRESH_TIMEOUT = 180
 
 
-def has_local_changes(repo: Path) -> bool:
-    result = subprocess.run(
-        ["git", "diff", "--name-only", "HEAD"],
-        cwd=str(repo),
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return False
+def get_current_branch(repo: Path) -> str | None:
+    return probe_repo(repo).branch
 
-    staged = subprocess.run(
-        ["git", "diff", "--name-only", "--cached"],
-        cwd=str(repo),
-        capture_output=True,
-        text=True,
-    )
 
-    return bool(result.stdout.strip() or staged.stdout.strip())
+def has_local_changes(repo: Path) -> bool:
+    return probe_repo(repo).dirty
 
 
 def check_for_updates(repo: Path, branch: str | None) -> bool:
@@ -94,7 +82,9 @@ def check_for_updates(repo: Path, branch: str | None) -> bool:
     return local_result.stdout.strip() != remote_result.stdout.strip()
 
 
-def backup_dirty_files(repo: Path, backup_root: Path) -> bool:
+def backup_dirty_files(
+    repo: Path, backup_root: Path, out: Console | None = None
+) -> bool:
     result = subprocess.run(
         ["git", "diff", "--name-only", "HEAD"],
         cwd=str(repo),
@@ -136,7 +126,7 @@ def backup_dirty_files(repo: Path, backup_root: Path) -> bool:
             backed_up += 1
 
     if backed_up > 0:
-        console.print(
+        (out or console).print(
             f"[yellow]已備份 {backed_up} 個已修改檔案到 {backup_dir}[/yellow]"
         )
         return True
@@ -207,7 +197,135 @@ def _run_install_repos_phase() -> None:
                 console.print(f"[yellow]⚠ Clone {repo_name} 失敗，跳過[/yellow]")
 
 
-def _run_update_repos_phase() -> None:
+@dataclass
+class RepoRefreshJob:
+    """單一儲存庫的更新工作（fetch → 比對 → 備份 → reset）。"""
+
+    name: str
+    path: Path
+    branch: str | None
+    repo_type: str = "upstream"
+    follow_current_branch: bool = False
+    """True 時以 repo 目前的分支為準（upstream repo），忽略 branch 欄位"""
+    updated: bool = False
+    failed: bool = False
+    output: str = ""
+    _buffer: io.StringIO = field(default_factory=io.StringIO, repr=False)
+
+
+def _run_git_captured(
+    repo: Path, args: list[str], out: Console, timeout: float
+) -> int | None:
+    """執行 git 並把輸出寫入該儲存庫的緩衝 Console。
+
+    回傳 exit code；逾時或無法執行時回傳 None。
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=str(repo),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            # 並行執行時不可互動詢問帳密，否則會卡住其他儲存庫
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+        )
+    except subprocess.TimeoutExpired:
+        out.print(
+            f"[yellow]⚠ git {' '.join(args)} 超過 {timeout:g} 秒未完成，已中止[/yellow]"
+        )
+        return None
+    except OSError as exc:
+        out.print(f"[yellow]⚠ 無法執行 git {' '.join(args)}：{exc}[/yellow]")
+        return None
+
+    text = "\n".join(
+        part.rstrip() for part in (result.stdout, result.stderr) if part.strip()
+    )
+    if text:
+        out.print(f"[dim]{escape(text)}[/dim]")
+    if result.returncode != 0:
+        out.print(
+            f"[yellow]⚠ git {' '.join(args)} 失敗（exit {result.returncode}）[/yellow]"
+        )
+    return result.returncode
+
+
+def _refresh_repo(job: RepoRefreshJob, backup_root: Path, timeout: float) -> None:
+    """在 worker 執行緒中更新單一儲存庫，輸出寫入 job 自己的緩衝區。"""
+    out = Console(
+        file=job._buffer,
+        force_terminal=console.is_terminal,
+        color_system=console.color_system,
+        width=console.width,
+    )
+    # 一次 git status 取得分支與 dirty 狀態（fetch 不會改變工作目錄）
+    before = probe_repo(job.path)
+    if job.follow_current_branch:
+        job.branch = before.branch
+    branch_info = f" ({job.branch})" if job.branch else ""
+    out.print(f"正在更新 {job.path}{branch_info}...")
+
+    fetch_code = _run_git_captured(job.path, ["fetch", "--all"], out, timeout)
+    if fetch_code is None:
+        # fetch 逾時時不 reset，remote ref 可能只更新到一半
+        job.failed = True
+        return
+    job.failed = fetch_code != 0
+
+    remote_ref = f"origin/{job.branch}" if job.branch else "origin/HEAD"
+    after = probe_repo(job.path)
+    if job.branch and after.upstream == remote_ref and after.in_sync_with_upstream is not None:
+        job.updated = not after.in_sync_with_upstream
+    else:
+        # 追蹤分支與設定的 branch 不同時才退回 rev-parse 比對
+        job.updated = check_for_updates(job.path, job.branch)
+    if before.dirty:
+        backup_dirty_files(job.path, backup_root, out=out)
+    if _run_git_captured(job.path, ["reset", "--hard", remote_ref], out, timeout) != 0:
+        job.failed = True
+
+
+def refresh_repos_concurrently(
+    jobs: list[RepoRefreshJob],
+    backup_root: Path,
+    *,
+    max_workers: int | None = None,
+    timeout: float = REPO_REFRESH_TIMEOUT,
+) -> list[RepoRefreshJob]:
+    """並行更新多個儲存庫，回傳時各 job 已填入結果與緩衝輸出。
+
+    網路等待時間可重疊，整體耗時趨近最慢的單一儲存庫；輸出依 jobs 順序
+    由呼叫端印出，不會交錯。
+    """
+    if not jobs:
+        return jobs
+
+    def _run(job: RepoRefreshJob) -> None:
+        try:
+            _refresh_repo(job, backup_root, timeout)
+        except Exception as exc:  # noqa: BLE001 - 單一儲存庫失敗不影響其他
+            job.failed = True
+            job._buffer.write(f"⚠ 更新 {job.name} 時發生錯誤：{exc}\n")
+        job.output = job._buffer.getvalue()
+
+    workers = max(1, min(max_workers or REPO_REFRESH_MAX_WORKERS, len(jobs)))
+    if workers == 1:
+        for job in jobs:
+            _run(job)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_run, jobs))
+    return jobs
+
+
+def _flush_job_output(job: RepoRefreshJob) -> None:
+    if job.output:
+        console.file.write(job.output)
+        console.file.flush()
+
+
+def _run_update_repos_phase(max_workers: int | None = None) -> None:
     console.print("[green]正在更新儲存庫...[/green]")
     # OpenCode superpowers：遷移至 plugin 機制
     migrate_opencode_superpowers()
@@ -224,23 +342,53 @@ def _run_update_repos_phase() -> None:
 
     backup_root = Path.home() / ".cache" / "ai-dev" / "backups"
     updated_repos: list[str] = []
+    failed_repos: list[str] = []
     missing_repos: list[str] = []
+    upstream_jobs: list[RepoRefreshJob] = []
 
     for repo in repos:
         if not repo.exists() or not (repo / ".git").exists():
             missing_repos.append(str(repo))
             continue
+        upstream_jobs.append(
+            RepoRefreshJob(
+                name=repo.name, path=repo, branch=None, follow_current_branch=True
+            )
+        )
 
-        branch = get_current_branch(repo)
-        branch_info = f" ({branch})" if branch else ""
-        console.print(f"正在更新 {repo}{branch_info}...")
-        run_command(["git", "fetch", "--all"], cwd=str(repo), check=False)
-        if check_for_updates(repo, branch):
-            updated_repos.append(repo.name)
-        if has_local_changes(repo):
-            backup_dirty_files(repo, backup_root)
-        remote_ref = f"origin/{branch}" if branch else "origin/HEAD"
-        run_command(["git", "reset", "--hard", remote_ref], cwd=str(repo), check=False)
+    custom_repos = load_custom_repos().get("repos", {})
+    custom_entries: list[tuple[str, RepoRefreshJob | None]] = []
+    for repo_name, repo_info in custom_repos.items():
+        local_path = Path(
+            repo_info.get("local_path", "").replace("~", str(Path.home()))
+        )
+        if not local_path.exists() or not (local_path / ".git").exists():
+            custom_entries.append((repo_name, None))
+            continue
+        custom_entries.append(
+            (
+                repo_name,
+                RepoRefreshJob(
+                    name=repo_name,
+                    path=local_path,
+                    branch=repo_info.get("branch", "main"),
+                    repo_type=repo_info.get("type", "tool"),
+                ),
+            )
+        )
+
+    # upstream 與 custom repo 一起排入同一個 worker pool
+    custom_jobs = [job for _, job in custom_entries if job is not None]
+    refresh_repos_concurrently(
+        upstream_jobs + custom_jobs, backup_root, max_workers=max_workers
+    )
+
+    for job in upstream_jobs:
+        _flush_job_output(job)
+        if job.updated:
+            updated_repos.append(job.name)
+        if job.failed:
+            failed_repos.append(job.name)
 
     # Codex superpowers symlink 刷新（callee 內部檢查 .git 存在性）
     refresh_codex_superpowers_symlinks(get_codex_superpowers_dir())
@@ -254,32 +402,19 @@ def _run_update_repos_phase() -> None:
             "[dim]   請執行 `ai-dev install --only repos,targets` 來補齊缺失的儲存庫[/dim]"
         )
 
-    custom_repos = load_custom_repos().get("repos", {})
     template_repos_with_updates: list[str] = []
 
-    for repo_name, repo_info in custom_repos.items():
-        local_path = Path(
-            repo_info.get("local_path", "").replace("~", str(Path.home()))
-        )
-        if not local_path.exists() or not (local_path / ".git").exists():
+    for repo_name, job in custom_entries:
+        if job is None:
             console.print(f"[yellow]⚠ Custom repo 目錄不存在，跳過: {repo_name}[/yellow]")
             continue
-
-        branch = repo_info.get("branch", "main")
-        repo_type = repo_info.get("type", "tool")
-        console.print(f"正在更新 {local_path} ({branch})...")
-        run_command(["git", "fetch", "--all"], cwd=str(local_path), check=False)
-        if check_for_updates(local_path, branch):
+        _flush_job_output(job)
+        if job.failed:
+            failed_repos.append(repo_name)
+        if job.updated:
             updated_repos.append(repo_name)
-            if repo_type == "template":
+            if job.repo_type == "template":
                 template_repos_with_updates.append(repo_name)
-        if has_local_changes(local_path):
-            backup_dirty_files(local_path, backup_root)
-        run_command(
-            ["git", "reset", "--hard", f"origin/{branch}"],
-            cwd=str(local_path),
-            check=False,
-        )
 
     if template_repos_with_updates:
         console.print()
@@ -289,6 +424,13 @@ def _run_update_repos_phase() -> None:
         console.print("[dim]  在需要更新的專案目錄中執行：ai-dev init-from update[/dim]")
 
     console.print()
+    if failed_repos:
+        # 各儲存庫輸出已依序印出，這裡只彙整數量，避免失敗淹沒在長輸出中
+        console.print(
+            f"[yellow]⚠ {len(failed_repos)} 個儲存庫更新失敗（詳見上方輸出）：[/yellow]"
+        )
+        for name in failed_repos:
+            console.print(f"  • {name}")
     if updated_repos:
         console.print("[bold cyan]以下儲存庫有新更新：[/bold cyan]")
         for name in updated_repos:
@@ -309,7 +451,7 @@ def _run_update_repos_phase() -> None:
             console.print(f"[yellow]警告：無法寫入 {user_yaml}：{exc}[/yellow]")
 
 
-def run_repos_phase(*, plan: ExecutionPlan) -> None:
+def run_repos_phase(*, plan: ExecutionPlan, max_workers: int | None = None) -> None:
     """Run repo refresh work for a pipeline plan."""
     if plan.dry_run:
         console.print(f"[dim][dry-run] {plan.command_name}: repos[/dim]")
@@ -319,6 +461,6 @@ def run_repos_phase(*, plan: ExecutionPlan) -> None:
         _run_install_repos_phase()
         return
     if plan.command_name == "update":
-        _run_update_repos_phase()
+        _run_update_repos_phase(max_workers=max_workers)
         return
     raise ValueError(f"Unsupported repos phase for {plan.command_name}")
@@ -15,6 +15,7 @@ def run_targets_phase(
     force: bool = False,
     skip_conflicts: bool = False,
     backup: bool = False,
+    incremental: bool = False,
 ) -> None:
     """Run target distribution work for a pipeline plan."""
     if plan.dry_run:
@@ -39,4 +40,5 @@ def run_targets_phase(
         skip_conflicts=skip_conflicts,
         backup=backup,
         selected_targets=plan.targets or None,
+        incremental=incremental,
     )
@@ -4,11 +4,15 @@ AI Development Environment Manager TUI
 使用 Textual 框架建立的互動式終端介面。
 """
 
+import threading
+from bisect import bisect_left
 from pathlib import Path
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, VerticalScroll
+from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import (
     Button,
@@ -17,6 +21,7 @@ from textual.widgets import (
     Header,
     Input,
     Label,
+    ProgressBar,
     Select,
     Static,
 )
@@ -27,6 +32,8 @@ from ..utils.shared import (
     load_toggle_config,
     disable_resource,
     enable_resource,
+    apply_toggle_batch,
+    ToggleChange,
     get_mcp_config_path,
     open_in_editor,
     open_in_file_manager,
@@ -97,6 +104,35 @@ def sanitize_widget_id(name: str) -> str:
     return safe_id
 
 
+def plan_stable_rows(current: list[str], desired: list[str]) -> set[str]:
+    """回傳在重排時可以不動的列（current 與 desired 的最長共同遞增子序列）。
+
+    其餘列（含新增的列）才需要 mount / move，單一項目切換時只會移動一列。
+    """
+    position = {name: i for i, name in enumerate(desired)}
+    sequence = [(position[name], name) for name in current if name in position]
+
+    tails: list[int] = []
+    tail_ids: list[int] = []
+    parents: list[int] = [-1] * len(sequence)
+    for i, (pos, _name) in enumerate(sequence):
+        k = bisect_left(tails, pos)
+        if k == len(tails):
+            tails.append(pos)
+            tail_ids.append(i)
+        else:
+            tails[k] = pos
+            tail_ids[k] = i
+        parents[i] = tail_ids[k - 1] if k else -1
+
+    stable: set[str] = set()
+    i = tail_ids[-1] if tail_ids else -1
+    while i != -1:
+        stable.add(sequence[i][1])
+        i = parents[i]
+    return stable
+
+
 class ProfilePreviewModal(ModalScreen):
     """Profile 切換預覽對話框（顯示重疊分析結果）。"""
 
@@ -238,6 +274,18 @@ class ResourceItem(Horizontal):
         )
         yield Label(f"({self.resource_source})", classes="resource-source")
 
+    def set_state(self, enabled: bool, source: str) -> None:
+        """更新列的狀態，不觸發 Checkbox.Changed（避免再次執行切換）。"""
+        if enabled != self.resource_enabled:
+            self.resource_enabled = enabled
+            for checkbox in self.query(Checkbox):
+                with checkbox.prevent(Checkbox.Changed):
+                    checkbox.value = enabled
+        if source != self.resource_source:
+            self.resource_source = source
+            for label in self.query(".resource-source").results(Label):
+                label.update(f"({source})")
+
 
 class SkillManagerApp(App):
     """AI Development Environment Manager TUI 主程式。"""
@@ -265,6 +313,10 @@ class SkillManagerApp(App):
         self.current_type = "skills"
         self.current_source = "all"
         self.toggle_config = load_toggle_config()
+        # name → 已 mount 的列，用於差異更新
+        self._resource_rows: dict[str, ResourceItem] = {}
+        # 檔案搬移在背景執行緒中逐一進行，避免兩個 worker 同時搬同一份資源
+        self._toggle_lock = threading.Lock()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -303,6 +355,7 @@ class SkillManagerApp(App):
             )
         # 資源列表
         yield VerticalScroll(id="resource-list")
+        yield ProgressBar(id="bulk-progress", show_eta=False)
 
         # Standards Profile 區塊
         with Container(id="standards-profile-section"):
@@ -419,39 +472,107 @@ class SkillManagerApp(App):
         self.refresh_resource_list()
 
     def refresh_resource_list(self) -> None:
-        """重新載入資源列表。"""
-        container = self.query_one("#resource-list", VerticalScroll)
-        container.remove_children()
-
-        resources = list_installed_resources(self.current_target, self.current_type)
+        """在背景重新載入資源列表，完成後只更新有變動的列。"""
+        self._load_resource_list(
+            self.current_target, self.current_type, self.current_source
+        )
 
-        # 從 resources 中取得目前 target/type 的資源
-        target_resources = resources.get(self.current_target, {})
-        type_resources = target_resources.get(self.current_type, [])
+    @work(thread=True, exclusive=True, group="resource-list")
+    def _load_resource_list(self, target: str, resource_type: str, source: str) -> None:
+        resources = list_installed_resources(target, resource_type)
+        items = resources.get(target, {}).get(resource_type, [])
+        # 以訊息交回 UI 執行緒；訊息依序處理，不會有兩次差異更新交錯
+        self.post_message(self.ResourceListLoaded(target, resource_type, source, items))
+
+    class ResourceListLoaded(Message):
+        """背景載入的資源清單。"""
+
+        def __init__(
+            self, target: str, resource_type: str, source: str, items: list[dict]
+        ) -> None:
+            super().__init__()
+            self.target = target
+            self.resource_type = resource_type
+            self.source = source
+            self.items = items
+
+    async def on_skill_manager_app_resource_list_loaded(
+        self, message: "SkillManagerApp.ResourceListLoaded"
+    ) -> None:
+        """將最新清單與目前已 mount 的列比對，只新增 / 移除 / 更新 / 移動差異。"""
+        target = message.target
+        resource_type = message.resource_type
+        source = message.source
+        items = message.items
+        if (target, resource_type, source) != (
+            self.current_target,
+            self.current_type,
+            self.current_source,
+        ):
+            return  # 篩選條件已變更，這是過期的結果
 
-        for item in type_resources:
+        container = self.query_one("#resource-list", VerticalScroll)
+        desired = [
+            item
+            for item in items
+            if source == "all" or item["source"] == source
+        ]
+        desired_names = [item["name"] for item in desired]
+        keep = set(desired_names)
+
+        rows = self._resource_rows
+        stale = [
+            row
+            for name, row in rows.items()
+            if name not in keep
+            or row.resource_target != target
+            or row.resource_type != resource_type
+        ]
+        for row in stale:
+            del rows[row.resource_name]
+        if stale:
+            await container.remove_children(stale)
+
+        current = [
+            child.resource_name
+            for child in container.children
+            if isinstance(child, ResourceItem)
+        ]
+        stable = plan_stable_rows(current, desired_names)
+
+        previous: ResourceItem | None = None
+        for item in desired:
             name = item["name"]
-            source = item["source"]
-
-            # 來源篩選
-            if self.current_source != "all" and source != self.current_source:
-                continue
-
-            # 使用 disabled 欄位判斷是否啟用（disabled=True 表示停用）
             enabled = not item.get("disabled", False)
-            container.mount(
-                ResourceItem(
+            row = rows.get(name)
+            if row is None:
+                row = ResourceItem(
                     name=name,
-                    source=source,
+                    source=item["source"],
                     enabled=enabled,
-                    target=self.current_target,
-                    resource_type=self.current_type,
+                    target=target,
+                    resource_type=resource_type,
                     classes="resource-item",
                 )
-            )
+                if previous is not None:
+                    await container.mount(row, after=previous)
+                elif container.children:
+                    await container.mount(row, before=0)
+                else:
+                    await container.mount(row)
+                # mount 完成後才登記，刷新被取消時不會留下未掛上的列
+                rows[name] = row
+            else:
+                row.set_state(enabled, item["source"])
+                if name not in stable:
+                    if previous is not None:
+                        container.move_child(row, after=previous)
+                    else:
+                        container.move_child(row, before=0)
+            previous = row
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
-        """處理 checkbox 變更事件，即時停用/啟用資源。"""
+        """處理 checkbox 變更事件，於背景停用/啟用資源。"""
         checkbox = event.checkbox
 
         # 從 checkbox 的 parent (ResourceItem) 取得資源資訊
@@ -459,34 +580,86 @@ class SkillManagerApp(App):
         if not isinstance(parent, ResourceItem):
             return
 
-        name = parent.resource_name
-        target = parent.resource_target
-        resource_type = parent.resource_type
+        parent.resource_enabled = event.value
+        action = "Enabling" if event.value else "Disabling"
+        self.notify(f"{action} {parent.resource_name}...")
+        self._apply_toggles(
+            parent.resource_target,
+            parent.resource_type,
+            [(parent.resource_name, event.value)],
+        )
 
-        if event.value:
-            # 啟用資源
-            self.notify(f"Enabling {name}...")
-            success = enable_resource(target, resource_type, name)
-            if success:
-                self.toggle_config = load_toggle_config()
+    @work(thread=True, group="toggle")
+    def _apply_toggles(
+        self,
+        target: str,
+        resource_type: str,
+        changes: list[tuple[str, bool]],
+    ) -> None:
+        """在背景執行緒搬移檔案；多筆時更新進度條。"""
+        bulk = len(changes) > 1
+        if bulk:
+            self.call_from_thread(self._show_progress, len(changes))
+
+        failed: list[tuple[str, bool]] = []
+        with self._toggle_lock:
+            if bulk:
+                # 多筆變更走批次交易：並行搬移、只寫一次配置，失敗時整批還原
+                result = apply_toggle_batch(
+                    [
+                        ToggleChange(target, resource_type, name, enable)
+                        for name, enable in changes
+                    ],
+                    # total 以實際要搬移的筆數為準（略過 / 找不到的不計入）
+                    on_progress=lambda done, total: self.call_from_thread(
+                        self._advance_progress, done, total
+                    ),
+                )
+                failed = [(change.name, change.enabled) for change, _ in result.failed]
+            else:
+                name, enable = changes[0]
+                if enable:
+                    ok = enable_resource(target, resource_type, name)
+                else:
+                    ok = disable_resource(target, resource_type, name)
+                if not ok:
+                    failed.append((name, enable))
+            toggle_config = load_toggle_config()
+
+        self.call_from_thread(
+            self._finish_toggles, changes, failed, toggle_config
+        )
+
+    def _show_progress(self, total: int) -> None:
+        progress = self.query_one("#bulk-progress", ProgressBar)
+        progress.update(total=total, progress=0)
+        progress.display = True
+
+    def _advance_progress(self, done: int, total: int) -> None:
+        self.query_one("#bulk-progress", ProgressBar).update(total=total, progress=done)
+
+    def _finish_toggles(
+        self,
+        changes: list[tuple[str, bool]],
+        failed: list[tuple[str, bool]],
+        toggle_config: dict,
+    ) -> None:
+        self.toggle_config = toggle_config
+        self.query_one("#bulk-progress", ProgressBar).display = False
+
+        if len(changes) == 1 and not failed:
+            name, enable = changes[0]
+            if enable:
                 self.notify(f"Enabled {name}", severity="information")
             else:
-                self.notify(f"Failed to enable {name}", severity="error")
-                # 還原 checkbox 狀態
-                checkbox.value = False
-        else:
-            # 停用資源
-            self.notify(f"Disabling {name}...")
-            success = disable_resource(target, resource_type, name)
-            if success:
-                self.toggle_config = load_toggle_config()
                 self.notify(f"Disabled {name}", severity="warning")
-            else:
-                self.notify(f"Failed to disable {name}", severity="error")
-                # 還原 checkbox 狀態
-                checkbox.value = True
+        elif not failed:
+            self.notify(f"Updated {len(changes)} resources", severity="information")
+        for name, enable in failed:
+            action = "enable" if enable else "disable"
+            self.notify(f"Failed to {action} {name}", severity="error")
 
-        # 重新整理列表
+        # 重新整理列表（失敗的列會依實際檔案狀態還原 checkbox）
         self.refresh_resource_list()
 
     def action_toggle_selected(self) -> None:
@@ -495,19 +668,24 @@ class SkillManagerApp(App):
         if isinstance(focused, Checkbox):
             focused.toggle()
 
+    def _toggle_all(self, enable: bool) -> None:
+        changes: list[tuple[str, bool]] = []
+        for row in self._resource_rows.values():
+            if row.resource_enabled != enable:
+                row.set_state(enable, row.resource_source)
+                changes.append((row.resource_name, enable))
+        if changes:
+            self._apply_toggles(self.current_target, self.current_type, changes)
+
     def action_select_all(self) -> None:
-        """啟用所有項目（會逐一移動檔案）。"""
+        """啟用所有項目（於背景逐一移動檔案並顯示進度）。"""
         self.notify("Enabling all resources...", severity="warning")
-        for checkbox in self.query(Checkbox):
-            if not checkbox.value:
-                checkbox.value = True
+        self._toggle_all(True)
 
     def action_select_none(self) -> None:
-        """停用所有項目（會逐一移動檔案）。"""
+        """停用所有項目（於背景逐一移動檔案並顯示進度）。"""
         self.notify("Disabling all resources...", severity="warning")
-        for checkbox in self.query(Checkbox):
-            if checkbox.value:
-                checkbox.value = False
+        self._toggle_all(False)
 
     def action_save(self) -> None:
         """儲存目前的設定（已改為即時生效，此方法保留為重新整理狀態）。"""
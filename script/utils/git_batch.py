@@ -0,0 +1,341 @@
+"""
+Git 物件批次讀取：以常駐的 `git cat-file --batch` / `--batch-check` 行程
+取代每次查詢都 fork 一個 git。
+
+v2 3-way 分類需要對每個檔案查 base blob、驗證 commit 是否仍存在；
+同一輪 `ai-dev clone` 內所有 target 共用同一個 per-repo reader，
+查詢成本降為一次 pipe 往返。
+
+- 以完整 commit sha 查詢的結果不可變，依 (commit, path) memoize。
+- 任何協定錯誤（行程結束、輸出截斷）都會關閉行程並回傳 None，
+  由呼叫端沿用既有的「查不到」語意。
+
+另提供 path → 最後 commit 索引：`git log -1 -- <path>` 無法走 cat-file，
+改為每個 repo 單次 `git log --name-only` 建索引，並依 HEAD 持久化。
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+from .paths import get_ai_dev_config_dir
+
+_FULL_SHA = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+class GitObjectReader:
+    """單一 repo 的常駐 cat-file reader（thread-safe）。"""
+
+    def __init__(self, repo: Path) -> None:
+        self.repo = repo
+        self._batch: subprocess.Popen | None = None
+        self._check: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        self._blob_cache: dict[tuple[str, str], bytes | None] = {}
+        self._commit_cache: dict[str, bool] = {}
+
+    # ------------------------------------------------------------
+    # 行程管理
+    # ------------------------------------------------------------
+
+    def _spawn(self, mode: str) -> subprocess.Popen | None:
+        try:
+            return subprocess.Popen(
+                ["git", "-C", str(self.repo), "cat-file", mode],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            return None
+
+    def _request(self, mode: str, spec: str) -> tuple[bytes, subprocess.Popen] | None:
+        """送出一行查詢並回傳 header 行；失敗時關閉該行程。"""
+        if "\n" in spec:
+            return None
+        proc = self._batch if mode == "--batch" else self._check
+        if proc is None or proc.poll() is not None:
+            proc = self._spawn(mode)
+            if mode == "--batch":
+                self._batch = proc
+            else:
+                self._check = proc
+        if proc is None:
+            return None
+        try:
+            proc.stdin.write(spec.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+        except (OSError, ValueError):
+            self._kill(proc)
+            return None
+        if not header:
+            self._kill(proc)
+            return None
+        return header, proc
+
+    def _kill(self, proc: subprocess.Popen) -> None:
+        try:
+            proc.kill()
+            proc.wait()
+        except Exception:
+            pass
+        if proc is self._batch:
+            self._batch = None
+        if proc is self._check:
+            self._check = None
+
+    def close(self) -> None:
+        """結束常駐行程。"""
+        with self._lock:
+            for proc in (self._batch, self._check):
+                if proc is None:
+                    continue
+                try:
+                    proc.stdin.close()
+                    proc.wait(timeout=5)
+                except Exception:
+                    self._kill(proc)
+            self._batch = None
+            self._check = None
+
+    # ------------------------------------------------------------
+    # 查詢
+    # ------------------------------------------------------------
+
+    def resolve(self, rev: str) -> str | None:
+        """解析 revision（如 HEAD）為 commit sha；不 memoize（ref 可能移動）。"""
+        with self._lock:
+            result = self._request("--batch-check", f"{rev}^{{commit}}")
+        if result is None:
+            return None
+        parts = result[0].decode("utf-8", errors="replace").split()
+        if len(parts) == 3 and parts[1] == "commit":
+            return parts[0]
+        return None
+
+    def commit_exists(self, commit: str) -> bool:
+        """檢查 commit 是否存在（等同 `git cat-file -e <commit>^{commit}`）。"""
+        memoize = bool(_FULL_SHA.match(commit))
+        with self._lock:
+            if memoize and commit in self._commit_cache:
+                return self._commit_cache[commit]
+            result = self._request("--batch-check", f"{commit}^{{commit}}")
+            if result is None:
+                return False
+            parts = result[0].split()
+            exists = len(parts) == 3 and parts[1] == b"commit"
+            if memoize:
+                self._commit_cache[commit] = exists
+            return exists
+
+    def read_blob(self, commit: str, rel_path: str) -> bytes | None:
+        """讀取 `<commit>:<rel_path>` 的 blob 內容；不存在時回傳 None。"""
+        key = (commit, rel_path)
+        memoize = bool(_FULL_SHA.match(commit))
+        with self._lock:
+            if memoize and key in self._blob_cache:
+                return self._blob_cache[key]
+            data = self._read_object(f"{commit}:{rel_path}")
+            if memoize:
+                self._blob_cache[key] = data
+            return data
+
+    def _read_object(self, spec: str) -> bytes | None:
+        result = self._request("--batch", spec)
+        if result is None:
+            return None
+        header, proc = result
+        parts = header.split()
+        # "<spec> missing" / "<spec> ambiguous"：沒有 body
+        if len(parts) != 3:
+            return None
+        try:
+            size = int(parts[2])
+            body = proc.stdout.read(size + 1)  # 內容後接一個 LF
+        except (OSError, ValueError):
+            self._kill(proc)
+            return None
+        if len(body) != size + 1:
+            self._kill(proc)
+            return None
+        if parts[1] != b"blob":
+            return None
+        return body[:-1]
+
+
+_readers: dict[Path, GitObjectReader] = {}
+_readers_lock = threading.Lock()
+
+
+def get_git_reader(repo: Path) -> GitObjectReader:
+    """取得 repo 的共用 reader（同一行程內所有 target 共用）。"""
+    key = repo.resolve()
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = GitObjectReader(key)
+            _readers[key] = reader
+        return reader
+
+
+def close_git_readers() -> None:
+    """關閉所有常駐 cat-file 行程並清除 memo。"""
+    with _readers_lock:
+        readers = list(_readers.values())
+        _readers.clear()
+    for reader in readers:
+        reader.close()
+
+
+atexit.register(close_git_readers)
+
+
+# ============================================================
+# 路徑 → 最後 commit 索引
+# ============================================================
+
+PATH_INDEX_VERSION = 1
+
+# (repo, head, before) → {rel_path: (commit, commit_time)}
+_path_index_memo: dict[tuple[Path, str, str | None], dict[str, tuple[str, int]]] = {}
+
+
+def get_path_index_dir() -> Path:
+    """回傳 path→commit 索引的快取目錄。"""
+    return get_ai_dev_config_dir() / "cache" / "git-path-index"
+
+
+def _path_index_file(repo: Path) -> Path:
+    digest = hashlib.sha1(str(repo).encode("utf-8")).hexdigest()[:16]
+    return get_path_index_dir() / f"{repo.name}-{digest}.json"
+
+
+def _walk_log(repo: Path, *rev_args: str) -> dict[str, tuple[str, int]] | None:
+    """單次 `git log --name-only`，回傳每個路徑最新的 (commit, commit_time)。"""
+    try:
+        result = subprocess.run(
+            [
+                "git", "-C", str(repo), "-c", "core.quotepath=off",
+                "log", "--no-renames", "--name-only", "--format=%x01%H %ct",
+                *rev_args,
+            ],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+            check=False,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    index: dict[str, tuple[str, int]] = {}
+    commit, ctime = "", 0
+    for line in result.stdout.splitlines():
+        if line.startswith("\x01"):
+            sha, _, ts = line[1:].partition(" ")
+            commit, ctime = sha, int(ts or 0)
+            continue
+        if line and commit:
+            prev = index.get(line)
+            if prev is None or ctime > prev[1]:
+                index[line] = (commit, ctime)
+    return index
+
+
+def _is_ancestor(repo: Path, old: str, new: str) -> bool:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo), "merge-base", "--is-ancestor", old, new],
+            capture_output=True,
+            check=False,
+        )
+    except Exception:
+        return False
+    return result.returncode == 0
+
+
+def _load_persisted_index(repo: Path) -> tuple[str, dict[str, tuple[str, int]]] | None:
+    try:
+        with open(_path_index_file(repo), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != PATH_INDEX_VERSION:
+        return None
+    head = data.get("head")
+    raw = data.get("index")
+    if not isinstance(head, str) or not isinstance(raw, dict):
+        return None
+    return head, {k: (v[0], int(v[1])) for k, v in raw.items() if isinstance(v, list) and len(v) == 2}
+
+
+def _persist_index(repo: Path, head: str, index: dict[str, tuple[str, int]]) -> None:
+    path = _path_index_file(repo)
+    payload = {
+        "version": PATH_INDEX_VERSION,
+        "repo": str(repo),
+        "head": head,
+        "index": {k: [v[0], v[1]] for k, v in index.items()},
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_path_commit_index(
+    repo: Path, head: str, before: str | None = None
+) -> dict[str, tuple[str, int]] | None:
+    """取得 repo 在 head 時「每個路徑最後一次變動的 commit」索引。
+
+    - before 為 None：依 HEAD 持久化到 `get_path_index_dir()`；舊 HEAD 為新 HEAD
+      祖先時只走 `old..new` 增量合併，否則整段重建。
+    - before 有值（v1 migration 用）：以 `--before` 單次走訪，只在行程內 memoize。
+
+    Returns:
+        rel_path → (commit, commit_time)；git 失敗時回傳 None。
+    """
+    repo = repo.resolve()
+    key = (repo, head, before)
+    if key in _path_index_memo:
+        return _path_index_memo[key]
+
+    index: dict[str, tuple[str, int]] | None = None
+    if before:
+        index = _walk_log(repo, f"--before={before}", head)
+    else:
+        persisted = _load_persisted_index(repo)
+        if persisted is not None and persisted[0] == head:
+            index = persisted[1]
+        elif persisted is not None and _is_ancestor(repo, persisted[0], head):
+            delta = _walk_log(repo, f"{persisted[0]}..{head}")
+            if delta is not None:
+                index = persisted[1]
+                for path, value in delta.items():
+                    prev = index.get(path)
+                    if prev is None or value[1] >= prev[1]:
+                        index[path] = value
+        if index is None:
+            index = _walk_log(repo, head)
+        if index is not None and (persisted is None or persisted[0] != head):
+            _persist_index(repo, head, index)
+
+    if index is not None:
+        _path_index_memo[key] = index
+    return index
+
+
+def clear_path_index_memo() -> None:
+    """清除行程內的 path 索引 memo（磁碟快取保留）。"""
+    _path_index_memo.clear()
@@ -0,0 +1,186 @@
+"""
+檔案 Hash 快取：以 (path, size, mtime_ns, inode) 為 key 持久化 SHA-256 結果。
+
+`ai-dev clone` 每次都會對所有 skill 檔案計算 hash；多數檔案在兩次執行之間
+並未變動，命中快取即可省去整檔讀取。
+
+- 失效：stat 任一欄位不同即視為 miss，重新計算後覆寫。
+- Racy 保護：mtime 落在「現在」前 2 秒內的檔案不寫入快取，避免同一時間
+  粒度內被再次修改而誤用舊 hash（同 git index 的 racy-clean 處理）。
+- 淘汰：存檔時移除超過保存期限未使用的項目，並以最近使用時間截斷到上限。
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from .paths import get_ai_dev_config_dir
+
+HASH_CACHE_VERSION = 1
+HASH_CACHE_MAX_ENTRIES = 200_000
+HASH_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+_TOUCH_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+def get_hash_cache_path() -> Path:
+    """回傳 hash 快取檔路徑。"""
+    return get_ai_dev_config_dir() / "cache" / "file-hashes.json"
+
+
+class FileHashCache:
+    """stat-keyed 檔案 hash 快取。
+
+    entries 格式：abs_path → [size, mtime_ns, inode, digest, last_used]
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or get_hash_cache_path()
+        self._entries: dict[str, list] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # 查詢 / 寫入
+    # ------------------------------------------------------------
+
+    def lookup(self, file_path: Path, st: os.stat_result) -> str | None:
+        """stat 完全相符時回傳快取 hash，否則回傳 None。"""
+        self._ensure_loaded()
+        key = os.path.abspath(file_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            size, mtime_ns, inode, digest = entry[:4]
+            if size != st.st_size or mtime_ns != st.st_mtime_ns or inode != st.st_ino:
+                del self._entries[key]
+                self._dirty = True
+                return None
+            now = int(time.time())
+            # last_used 只需日級精度，避免每次命中都讓快取變 dirty
+            if now - entry[4] >= _TOUCH_INTERVAL_SECONDS:
+                entry[4] = now
+                self._dirty = True
+            return digest
+
+    def store(self, file_path: Path, st: os.stat_result, digest: str) -> None:
+        """寫入一筆 hash；mtime 過新（racy）時略過。"""
+        if st.st_mtime_ns >= time.time_ns() - _RACY_WINDOW_NS:
+            return
+        self._ensure_loaded()
+        key = os.path.abspath(file_path)
+        with self._lock:
+            self._entries[key] = [
+                st.st_size,
+                st.st_mtime_ns,
+                st.st_ino,
+                digest,
+                int(time.time()),
+            ]
+            self._dirty = True
+
+    def invalidate(self, file_path: Path) -> None:
+        """移除指定檔案（或目錄下所有檔案）的快取。"""
+        self._ensure_loaded()
+        key = os.path.abspath(file_path)
+        prefix = key.rstrip(os.sep) + os.sep
+        with self._lock:
+            stale = [k for k in self._entries if k == key or k.startswith(prefix)]
+            for k in stale:
+                del self._entries[k]
+            if stale:
+                self._dirty = True
+
+    def clear(self) -> None:
+        """清空快取（含磁碟檔）。"""
+        with self._lock:
+            self._entries = {}
+            self._loaded = True
+            self._dirty = False
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------
+    # 持久化
+    # ------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._entries = self._read()
+            self._loaded = True
+
+    def _read(self) -> dict[str, list]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != HASH_CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        return {
+            k: v
+            for k, v in entries.items()
+            if isinstance(v, list) and len(v) == 5
+        }
+
+    def _evict(self) -> None:
+        cutoff = int(time.time()) - HASH_CACHE_MAX_AGE_SECONDS
+        entries = {k: v for k, v in self._entries.items() if v[4] >= cutoff}
+        if len(entries) > HASH_CACHE_MAX_ENTRIES:
+            keep = sorted(entries.items(), key=lambda kv: kv[1][4], reverse=True)
+            entries = dict(keep[:HASH_CACHE_MAX_ENTRIES])
+        self._entries = entries
+
+    def save(self) -> None:
+        """淘汰過期項目後以 temp file + rename 原子寫回；無變動時不寫。"""
+        if not self._dirty:
+            return
+        with self._lock:
+            self._evict()
+            payload = {"version": HASH_CACHE_VERSION, "entries": self._entries}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError:
+                # 快取寫入失敗不影響主流程，下次再重建
+                pass
+
+
+_default_cache: FileHashCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_hash_cache() -> FileHashCache:
+    """取得行程內共用的 hash 快取（延遲建立，可由多個分發執行緒同時呼叫）。"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = FileHashCache()
+    return _default_cache
+
+
+def save_hash_cache() -> None:
+    """將共用 hash 快取寫回磁碟（未載入或無變動時不動作）。"""
+    if _default_cache is not None:
+        _default_cache.save()
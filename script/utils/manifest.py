@@ -9,8 +9,11 @@ v1 向下相容：v1 manifest 在第一次讀取時自動 migration；下游若
 """
 
 import hashlib
+import os
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +25,19 @@ console = Console()
 
 # 類型定義
 from .shared import TargetType, ResourceType
+from .hash_cache import get_hash_cache
+from .manifest_store import (
+    find_manifest_file,
+    load_document,
+    manifest_file,
+    write_manifest_file,
+)
+from .git_batch import (
+    clear_path_index_memo,
+    close_git_readers,
+    get_git_reader,
+    get_path_commit_index,
+)
 
 RESOURCE_TYPES: tuple[ResourceType, ...] = (
     "skills",
@@ -32,6 +48,14 @@ RESOURCE_TYPES: tuple[ResourceType, ...] = (
 
 SCHEMA_VERSION = 2
 
+# Hash 引擎參數：大 buffer 減少 syscall；並行上限避免 I/O 爭用
+HASH_CHUNK_SIZE = 1024 * 1024
+HASH_MAX_WORKERS = min(8, os.cpu_count() or 1)
+PARALLEL_HASH_MIN_FILES = 32
+
+# mtime 落在擷取當下前 2 秒內的檔案不記 fingerprint（同 hash_cache 的 racy 保護）
+FINGERPRINT_RACY_WINDOW_NS = 2 * 1_000_000_000
+
 ConflictClass = Literal["clean", "local-only", "both-changed", "no-base"]
 
 
@@ -40,45 +64,241 @@ ConflictClass = Literal["clean", "local-only", "both-changed", "no-base"]
 # ============================================================
 
 
-def compute_file_hash(path: Path) -> str:
+def compute_file_hash(path: Path, *, use_cache: bool = True) -> str:
     """計算單檔案的 SHA-256 hash。
 
+    預設先查 stat-keyed hash 快取（見 `hash_cache`），命中時不讀檔。
+
     Args:
         path: 檔案路徑
+        use_cache: 是否使用 / 更新 hash 快取
 
     Returns:
         str: 格式為 "sha256:<hex_digest>"
     """
+    st = os.stat(path) if use_cache else None
+    return _hash_file(path, st)
+
+
+def _hash_file(path: Path | str, st: os.stat_result | None) -> str:
+    """計算檔案 hash；st 不為 None 時經由 hash 快取。"""
+    cache = get_hash_cache() if st is not None else None
+    if cache is not None:
+        cached = cache.lookup(path, st)
+        if cached is not None:
+            return cached
+
     sha256 = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        while chunk := f.read(HASH_CHUNK_SIZE):
             sha256.update(chunk)
-    return f"sha256:{sha256.hexdigest()}"
+    digest = f"sha256:{sha256.hexdigest()}"
+
+    if cache is not None:
+        cache.store(path, st, digest)
+    return digest
+
+
+def hash_files(
+    items: list[tuple[Path | str, os.stat_result | None]],
+    *,
+    max_workers: int | None = None,
+) -> list[str]:
+    """批次計算多個檔案的 hash，回傳順序與 items 相同。
+
+    hashlib 在大於 2 KiB 的 update 會釋放 GIL，故檔案數達
+    `PARALLEL_HASH_MIN_FILES` 時改以 thread pool 並行讀檔與計算；
+    檔案少時 thread 建立成本高於收益，維持循序。
+
+    Args:
+        items: (路徑, stat) 清單；stat 為 None 時不經快取
+        max_workers: 並行上限，預設 `HASH_MAX_WORKERS`；1 表示循序
+    """
+    workers = max_workers or HASH_MAX_WORKERS
+    if workers <= 1 or len(items) < PARALLEL_HASH_MIN_FILES:
+        return [_hash_file(path, st) for path, st in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: _hash_file(*item), items))
+
+
+def make_fingerprint(st: os.stat_result, digest: str) -> list | None:
+    """組出寫入 manifest 的 [size, mtime_ns, hash]；mtime 過新（racy）時回傳 None。"""
+    if st.st_mtime_ns >= time.time_ns() - FINGERPRINT_RACY_WINDOW_NS:
+        return None
+    return [st.st_size, st.st_mtime_ns, digest]
+
+
+def _fingerprint_hit(known: dict[str, list] | None, key: str, st: os.stat_result) -> str | None:
+    """size 與 mtime_ns 都與紀錄相同時回傳紀錄的 hash。"""
+    if not known:
+        return None
+    fp = known.get(key)
+    if fp and fp[0] == st.st_size and fp[1] == st.st_mtime_ns:
+        return fp[2]
+    return None
+
+
+@dataclass
+class DirScan:
+    """單次走訪 skill 目錄的結果。
+
+    - `hash`: 與 compute_dir_hash 相同的組合 hash
+    - `files`: rel_path → sha256（與 compute_skill_file_map 相同）
+    - `sizes`: rel_path → 檔案大小（bytes）
+    - `fingerprints`: rel_path → [size, mtime_ns, hash]（不含 racy 檔案）
+    """
+
+    hash: str
+    files: dict[str, str]
+    sizes: dict[str, int]
+    fingerprints: dict[str, list] = field(default_factory=dict)
+
+
+def _walk_hashable_files(root: Path) -> list[tuple[str, str, os.stat_result]]:
+    """以 os.scandir 遞迴列出需要 hash 的檔案，回傳 (rel_path, abs_path, stat)。
+
+    排除 `__pycache__`（目錄直接剪枝）與 .pyc / .pyo 編譯產物。
+    與 rglob 一致：不遞迴進入 symlink 目錄，但 symlink 檔案照常計入。
+    """
+    out: list[tuple[str, str, os.stat_result]] = []
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        abs_dir, rel_dir = stack.pop()
+        try:
+            with os.scandir(abs_dir) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            if entry.name == "__pycache__":
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((entry.path, rel))
+                continue
+            if not entry.is_file():
+                continue
+            if os.path.splitext(entry.name)[1] in {".pyc", ".pyo"}:
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            out.append((rel, entry.path, st))
+    out.sort(key=lambda item: item[0])
+    return out
 
 
-def _is_excluded_for_hash(file_path: Path) -> bool:
-    """檢查檔案是否應被 hash 計算排除。"""
-    if "__pycache__" in file_path.parts:
-        return True
-    if file_path.suffix in {".pyc", ".pyo"}:
-        return True
-    return False
+def _combine_dir_scan(
+    walked: list[tuple[str, str, os.stat_result]], hashes: list[str]
+) -> DirScan:
+    sha256 = hashlib.sha256()
+    files: dict[str, str] = {}
+    sizes: dict[str, int] = {}
+    fingerprints: dict[str, list] = {}
+    for (rel, _abs_path, st), file_hash in zip(walked, hashes):
+        # 將相對路徑加入 hash 計算（確保檔案結構變化也會影響 hash）
+        sha256.update(rel.encode("utf-8"))
+        sha256.update(file_hash.encode("utf-8"))
+        files[rel] = file_hash
+        sizes[rel] = st.st_size
+        fp = make_fingerprint(st, file_hash)
+        if fp is not None:
+            fingerprints[rel] = fp
+    return DirScan(
+        hash=f"sha256:{sha256.hexdigest()}",
+        files=files,
+        sizes=sizes,
+        fingerprints=fingerprints,
+    )
+
+
+def scan_skill_dir(
+    path: Path,
+    *,
+    use_cache: bool = True,
+    max_workers: int | None = None,
+) -> DirScan:
+    """單次走訪 skill 目錄，同時產生組合 hash、per-file hash 與檔案大小。
+
+    取代分別呼叫 compute_dir_hash + compute_skill_file_map 的兩次走訪與重複 hash。
+    path 不是目錄時，hash 退回單檔 hash，files / sizes 為空。
+    """
+    if not path.is_dir():
+        return DirScan(hash=compute_file_hash(path, use_cache=use_cache), files={}, sizes={})
+
+    walked = _walk_hashable_files(path)
+    hashes = hash_files(
+        [(abs_path, st if use_cache else None) for _rel, abs_path, st in walked],
+        max_workers=max_workers,
+    )
+    return _combine_dir_scan(walked, hashes)
+
+
+def scan_skill_dirs(
+    paths: list[Path],
+    *,
+    use_cache: bool = True,
+    max_workers: int | None = None,
+    known: list[dict[str, list] | None] | None = None,
+) -> list[DirScan]:
+    """批次掃描多個路徑，所有檔案共用同一個 hash pool。
+
+    單一 skill 通常只有少數檔案，逐一呼叫 scan_skill_dir 達不到並行門檻；
+    先攤平所有目錄的檔案再一次送進 `hash_files`。非目錄路徑視為單檔，
+    結果與 scan_skill_dir 相同。
+
+    Args:
+        known: 與 paths 對應的 manifest fingerprint（rel_path → [size, mtime_ns,
+            hash]，單檔以 "" 為 key）。size 與 mtime_ns 相同的檔案直接沿用紀錄
+            的 hash，不讀檔；未變動的目錄只需一次 stat 走訪。
+    """
+    walks: list[list[tuple[str, str, os.stat_result]] | None] = []
+    # 每個檔案的 hash：已知者直接填入，其餘為 None 待計算
+    resolved: list[str | None] = []
+    items: list[tuple[Path | str, os.stat_result | None]] = []
+    for i, path in enumerate(paths):
+        known_fps = known[i] if known else None
+        if path.is_dir():
+            walked = _walk_hashable_files(path)
+            walks.append(walked)
+            for rel, abs_path, st in walked:
+                hit = _fingerprint_hit(known_fps, rel, st)
+                resolved.append(hit)
+                if hit is None:
+                    items.append((abs_path, st if use_cache else None))
+        else:
+            walks.append(None)
+            st = os.stat(path)
+            hit = _fingerprint_hit(known_fps, "", st)
+            resolved.append(hit)
+            if hit is None:
+                items.append((path, st if use_cache else None))
+
+    computed = iter(hash_files(items, max_workers=max_workers))
+    hashes = [h if h is not None else next(computed) for h in resolved]
+
+    out: list[DirScan] = []
+    offset = 0
+    for walked in walks:
+        if walked is None:
+            out.append(DirScan(hash=hashes[offset], files={}, sizes={}))
+            offset += 1
+            continue
+        out.append(_combine_dir_scan(walked, hashes[offset:offset + len(walked)]))
+        offset += len(walked)
+    return out
 
 
 def compute_skill_file_map(path: Path) -> dict[str, str]:
     """對 skill 目錄內每個檔案計算 sha256，回傳 rel_path → sha256 對照表。
 
-    使用與 compute_dir_hash 相同的排除規則。
+    使用與 compute_dir_hash 相同的排除規則。同時需要目錄 hash 時請改用
+    `scan_skill_dir`，避免重複走訪。
     """
     if not path.is_dir():
         return {}
-    out: dict[str, str] = {}
-    for file_path in sorted(path.rglob("*"), key=lambda p: str(p.relative_to(path))):
-        if not file_path.is_file() or _is_excluded_for_hash(file_path):
-            continue
-        rel = str(file_path.relative_to(path))
-        out[rel] = compute_file_hash(file_path)
-    return out
+    return scan_skill_dir(path).files
 
 
 def compute_dir_hash(path: Path) -> str:
@@ -95,27 +315,7 @@ def compute_dir_hash(path: Path) -> str:
     Returns:
         str: 格式為 "sha256:<hex_digest>"
     """
-    if not path.is_dir():
-        return compute_file_hash(path)
-
-    sha256 = hashlib.sha256()
-    # 收集所有檔案並排序
-    files = sorted(path.rglob("*"), key=lambda p: str(p.relative_to(path)))
-
-    for file_path in files:
-        if file_path.is_file():
-            if "__pycache__" in file_path.parts:
-                continue
-            if file_path.suffix in {".pyc", ".pyo"}:
-                continue
-            # 將相對路徑加入 hash 計算（確保檔案結構變化也會影響 hash）
-            rel_path = str(file_path.relative_to(path))
-            sha256.update(rel_path.encode("utf-8"))
-            # 計算檔案內容 hash
-            file_hash = compute_file_hash(file_path)
-            sha256.update(file_hash.encode("utf-8"))
-
-    return f"sha256:{sha256.hexdigest()}"
+    return scan_skill_dir(path).hash
 
 
 # ============================================================
@@ -184,6 +384,8 @@ class FileRecord:
     - `files`: skill 內 rel_path → sha256 對照（單檔資源為空 dict）。
     - `src_path`: 真正的 src 來源路徑（用於查 git commit；不寫 manifest）。
     - `src_commit`: 預先解析的 src commit（不寫到本欄，會落到 FileEntry）。
+    - `fingerprints`: 記錄當下的 rel_path → [size, mtime_ns, hash]（單檔以 ""
+      為 key），供下次衝突檢測略過未變動檔案的 hash。
     """
 
     name: str
@@ -193,6 +395,7 @@ class FileRecord:
     files: dict[str, str] = field(default_factory=dict)
     src_path: Path | None = None
     src_commit: str | None = None
+    fingerprints: dict[str, list] = field(default_factory=dict)
 
 
 @dataclass
@@ -207,6 +410,22 @@ class ConflictInfo:
     target_path: Path | None = None
 
 
+def _single_file_record(
+    name: str, source_path: Path, source: str, src_path: Path | None
+) -> FileRecord:
+    st = os.stat(source_path)
+    hash_value = _hash_file(source_path, st)
+    fp = make_fingerprint(st, hash_value)
+    return FileRecord(
+        name=name,
+        hash=hash_value,
+        source=source,
+        source_path=source_path,
+        src_path=src_path or source_path,
+        fingerprints={"": fp} if fp else {},
+    )
+
+
 @dataclass
 class ManifestTracker:
     """追蹤分發過程中的檔案。"""
@@ -230,15 +449,15 @@ class ManifestTracker:
             source_path: 用於 hash / file map 計算的路徑（通常是 dst 副本）。
             src_path: 真正的 src 來源路徑（用於查 git commit）。
         """
-        hash_value = compute_dir_hash(source_path)
-        files_map = compute_skill_file_map(source_path)
+        scan = scan_skill_dir(source_path)
         self.skills[name] = FileRecord(
             name=name,
-            hash=hash_value,
+            hash=scan.hash,
             source=source,
             source_path=source_path,
-            files=files_map,
+            files=scan.files,
             src_path=src_path or source_path,
+            fingerprints=scan.fingerprints,
         )
 
     def record_command(
@@ -249,14 +468,7 @@ class ManifestTracker:
         src_path: Path | None = None,
     ) -> None:
         """記錄已複製的 command。"""
-        hash_value = compute_file_hash(source_path)
-        self.commands[name] = FileRecord(
-            name=name,
-            hash=hash_value,
-            source=source,
-            source_path=source_path,
-            src_path=src_path or source_path,
-        )
+        self.commands[name] = _single_file_record(name, source_path, source, src_path)
 
     def record_agent(
         self,
@@ -266,14 +478,7 @@ class ManifestTracker:
         src_path: Path | None = None,
     ) -> None:
         """記錄已複製的 agent。"""
-        hash_value = compute_file_hash(source_path)
-        self.agents[name] = FileRecord(
-            name=name,
-            hash=hash_value,
-            source=source,
-            source_path=source_path,
-            src_path=src_path or source_path,
-        )
+        self.agents[name] = _single_file_record(name, source_path, source, src_path)
 
     def record_workflow(
         self,
@@ -283,14 +488,7 @@ class ManifestTracker:
         src_path: Path | None = None,
     ) -> None:
         """記錄已複製的 workflow。"""
-        hash_value = compute_file_hash(source_path)
-        self.workflows[name] = FileRecord(
-            name=name,
-            hash=hash_value,
-            source=source,
-            source_path=source_path,
-            src_path=src_path or source_path,
-        )
+        self.workflows[name] = _single_file_record(name, source_path, source, src_path)
 
     def to_manifest(
         self,
@@ -322,6 +520,8 @@ class ManifestTracker:
                 entry["files"] = files_block
             if existing_skipped:
                 entry["skipped"] = existing_skipped
+            if record.fingerprints:
+                entry["fingerprints"] = record.fingerprints
             return entry
 
         def build_single_entry(record: FileRecord, prev_section: dict) -> dict:
@@ -332,6 +532,8 @@ class ManifestTracker:
                     entry[k] = prev[k]
             if isinstance(prev, dict) and "skipped" in prev:
                 entry["skipped"] = prev["skipped"]
+            if "" in record.fingerprints:
+                entry["fingerprint"] = record.fingerprints[""]
             return entry
 
         prev_commit_map = (previous_manifest or {}).get("last_sync_commit_by_source", {}) or {}
@@ -380,64 +582,60 @@ def get_manifest_dir() -> Path:
 def get_manifest_path(target: TargetType) -> Path:
     """返回指定平台的 manifest 路徑。
 
+    已存在的檔案優先（格式見 manifest_store）；都不存在時回傳偏好格式的路徑。
+
     Args:
         target: 目標平台名稱 (claude, opencode, antigravity, codex, agy)
 
     Returns:
         Path: manifest 檔案路徑
     """
-    return get_manifest_dir() / f"{target}.yaml"
+    manifest_dir = get_manifest_dir()
+    return find_manifest_file(manifest_dir, target) or manifest_file(manifest_dir, target)
 
 
-def read_manifest(target: TargetType) -> dict | None:
+def read_manifest(target: TargetType, out: Console | None = None) -> dict | None:
     """讀取 manifest 檔案。
 
     Args:
         target: 目標平台名稱
+        out: 輸出用的 Console（預設為模組 console）
 
     Returns:
         dict | None: manifest 內容，不存在或損壞時返回 None
     """
+    out = out or console
     manifest_path = get_manifest_path(target)
 
     if not manifest_path.exists():
         return None
 
     try:
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            if data is None or not isinstance(data, dict):
-                console.print(
-                    f"[yellow]警告：manifest 檔案格式無效，將視為首次分發[/yellow]"
-                )
-                return None
-            return data
-    except yaml.YAMLError as e:
-        console.print(f"[yellow]警告：manifest 檔案損壞 ({e})，將視為首次分發[/yellow]")
+        data = load_document(manifest_path)
+        if data is None or not isinstance(data, dict):
+            out.print(
+                f"[yellow]警告：manifest 檔案格式無效，將視為首次分發[/yellow]"
+            )
+            return None
+        return data
+    except (yaml.YAMLError, ValueError) as e:
+        out.print(f"[yellow]警告：manifest 檔案損壞 ({e})，將視為首次分發[/yellow]")
         return None
     except Exception as e:
-        console.print(
+        out.print(
             f"[yellow]警告：讀取 manifest 失敗 ({e})，將視為首次分發[/yellow]"
         )
         return None
 
 
 def write_manifest(target: TargetType, manifest: dict) -> None:
-    """寫入 manifest 檔案。
+    """寫入 manifest 檔案（偏好格式、原子寫入）。
 
     Args:
         target: 目標平台名稱
         manifest: manifest 內容
     """
-    manifest_path = get_manifest_path(target)
-
-    # 自動建立目錄
-    manifest_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        yaml.dump(
-            manifest, f, allow_unicode=True, default_flow_style=False, sort_keys=False
-        )
+    write_manifest_file(get_manifest_dir(), target, manifest)
 
 
 # ============================================================
@@ -462,6 +660,29 @@ def _get_target_resource_path(
         return base_path / f"{name}.md"
 
 
+def recorded_fingerprints(block: dict) -> dict[str, list] | None:
+    """取出 manifest 資源紀錄中的 fingerprint，格式不符的項目略過。"""
+    if not isinstance(block, dict):
+        return None
+
+    def _valid(fp) -> bool:
+        return (
+            isinstance(fp, list)
+            and len(fp) == 3
+            and isinstance(fp[0], int)
+            and isinstance(fp[1], int)
+            and isinstance(fp[2], str)
+        )
+
+    single = block.get("fingerprint")
+    if _valid(single) and single[2] == block.get("hash"):
+        return {"": single}
+    multi = block.get("fingerprints")
+    if isinstance(multi, dict):
+        return {rel: fp for rel, fp in multi.items() if _valid(fp)} or None
+    return None
+
+
 def detect_conflicts(
     target: TargetType,
     old_manifest: dict | None,
@@ -469,7 +690,8 @@ def detect_conflicts(
 ) -> list[ConflictInfo]:
     """檢測衝突。
 
-    比對目標檔案 hash 與 manifest 記錄的 hash。
+    比對目標檔案 hash 與 manifest 記錄的 hash。manifest 內有 fingerprint 的
+    檔案先比 (size, mtime_ns)，相同即沿用紀錄的 hash，只重新 hash 有變動的檔案。
 
     Args:
         target: 目標平台名稱
@@ -483,10 +705,11 @@ def detect_conflicts(
         # 首次分發，不報告衝突
         return []
 
-    conflicts = []
     old_files = old_manifest.get("files", {})
 
-    # 檢查各資源類型
+    # 先蒐集需要比對的目標，再一次批次 hash（共用同一個 thread pool）
+    candidates: list[tuple[ResourceType, str, str, Path]] = []
+    known: list[dict[str, list] | None] = []
     for resource_type in RESOURCE_TYPES:
         old_records = old_files.get(resource_type, {})
         new_records = getattr(new_tracker, resource_type, {})
@@ -503,27 +726,30 @@ def detect_conflicts(
                 # 目標不存在，不是衝突
                 continue
 
-            # 計算目標檔案當前 hash
-            if resource_type == "skills":
-                current_hash = compute_dir_hash(target_path)
-            else:
-                current_hash = compute_file_hash(target_path)
+            candidates.append((resource_type, name, old_hash, target_path))
+            known.append(recorded_fingerprints(old_records[name]))
 
-            # 比對
-            if current_hash != old_hash:
-                # 從 tracker 取得來源路徑
-                file_record = new_records.get(name)
-                src_path = file_record.source_path if file_record else None
-                conflicts.append(
-                    ConflictInfo(
-                        name=name,
-                        resource_type=resource_type,
-                        old_hash=old_hash,
-                        current_hash=current_hash,
-                        source_path=src_path,
-                        target_path=target_path,
-                    )
+    # 計算目標檔案當前 hash（skills 為目錄 hash，其餘為單檔 hash）
+    scans = scan_skill_dirs([c[3] for c in candidates], known=known)
+
+    conflicts = []
+    for (resource_type, name, old_hash, target_path), scan in zip(candidates, scans):
+        current_hash = scan.hash
+        # 比對
+        if current_hash != old_hash:
+            # 從 tracker 取得來源路徑
+            file_record = getattr(new_tracker, resource_type, {}).get(name)
+            src_path = file_record.source_path if file_record else None
+            conflicts.append(
+                ConflictInfo(
+                    name=name,
+                    resource_type=resource_type,
+                    old_hash=old_hash,
+                    current_hash=current_hash,
+                    source_path=src_path,
+                    target_path=target_path,
                 )
+            )
 
     return conflicts
 
@@ -649,6 +875,7 @@ def backup_file(
     target: TargetType,
     resource_type: ResourceType,
     name: str,
+    out: Console | None = None,
 ) -> Path | None:
     """備份單個檔案/目錄。
 
@@ -656,12 +883,14 @@ def backup_file(
         target: 目標平台名稱
         resource_type: 資源類型
         name: 資源名稱
+        out: 輸出用的 Console（預設為模組 console）
 
     Returns:
         Path | None: 備份路徑，若失敗則返回 None
     """
     import shutil
 
+    out = out or console
     target_path = _get_target_resource_path(target, resource_type, name)
     if target_path is None or not target_path.exists():
         return None
@@ -679,10 +908,10 @@ def backup_file(
             shutil.copytree(target_path, backup_path)
         else:
             shutil.copy2(target_path, backup_path)
-        console.print(f"  [dim]已備份: {name} → {backup_path.name}[/dim]")
+        out.print(f"  [dim]已備份: {name} → {backup_path.name}[/dim]")
         return backup_path
     except Exception as e:
-        console.print(f"[red]備份失敗 ({name}): {e}[/red]")
+        out.print(f"[red]備份失敗 ({name}): {e}[/red]")
         return None
 
 
@@ -722,26 +951,33 @@ def find_orphans(
     return orphans
 
 
-def cleanup_orphans(target: TargetType, orphans: dict[ResourceType, list[str]]) -> None:
+def cleanup_orphans(
+    target: TargetType,
+    orphans: dict[ResourceType, list[str]],
+    out: Console | None = None,
+) -> None:
     """清理孤兒檔案。
 
     Args:
         target: 目標平台名稱
         orphans: 按資源類型分組的孤兒檔案清單
+        out: 輸出用的 Console（預設為模組 console）
     """
     import shutil
 
+    out = out or console
+
     total = sum(len(names) for names in orphans.values())
     if total == 0:
         return
 
-    console.print()
-    console.print(f"[bold cyan]清理孤兒檔案 ({total} 個)...[/bold cyan]")
+    out.print()
+    out.print(f"[bold cyan]清理孤兒檔案 ({total} 個)...[/bold cyan]")
 
     for resource_type, names in orphans.items():
         for name in names:
             if resource_type == "skills" and name == "auto-skill":
-                console.print(
+                out.print(
                     "  [dim]保留退役的 skills/auto-skill；由確認式清理流程處理[/dim]"
                 )
                 continue
@@ -750,7 +986,7 @@ def cleanup_orphans(target: TargetType, orphans: dict[ResourceType, list[str]])
                 continue
 
             if not target_path.exists():
-                console.print(f"  [dim]跳過（不存在）: {resource_type}/{name}[/dim]")
+                out.print(f"  [dim]跳過（不存在）: {resource_type}/{name}[/dim]")
                 continue
 
             try:
@@ -758,9 +994,9 @@ def cleanup_orphans(target: TargetType, orphans: dict[ResourceType, list[str]])
                     shutil.rmtree(target_path)
                 else:
                     target_path.unlink()
-                console.print(f"  [green]已刪除: {resource_type}/{name}[/green]")
+                out.print(f"  [green]已刪除: {resource_type}/{name}[/green]")
             except Exception as e:
-                console.print(f"  [red]刪除失敗 ({resource_type}/{name}): {e}[/red]")
+                out.print(f"  [red]刪除失敗 ({resource_type}/{name}): {e}[/red]")
 
 
 # ============================================================
@@ -857,23 +1093,50 @@ def get_repo_head(source: str) -> str | None:
     repo = get_source_repo_path(source)
     if not repo:
         return None
-    return _git(repo, "rev-parse", "HEAD")
+    return get_git_reader(repo).resolve("HEAD")
+
+
+# (repo, head, rel_path, before) → commit；僅供索引無法回答的目錄查詢
+_file_commit_memo: dict[tuple[str, str, str, str | None], str | None] = {}
 
 
 def get_file_commit(source: str, rel_path: str, before: str | None = None) -> str | None:
     """取得 source repo 內指定 rel_path 的最後 commit。
 
+    以 `get_path_commit_index` 的 path → commit 索引查詢（每個 repo / HEAD
+    只走一次 `git log`）；rel_path 為目錄等索引無法直接回答時，才退回
+    `git log -1 -- <path>`，並依 (repo, HEAD, rel_path, before) memoize。
+
     Args:
         before: ISO 時間戳，若提供則取該時間之前最新的 commit。
     """
     repo = get_source_repo_path(source)
     if not repo:
         return None
+    head = get_git_reader(repo).resolve("HEAD")
+    if head:
+        index = get_path_commit_index(repo, head, before)
+        if index is not None:
+            lookup = Path(rel_path).as_posix()
+            hit = index.get(lookup)
+            if hit is not None:
+                return hit[0]
+            prefix = lookup.rstrip("/") + "/"
+            if not any(p.startswith(prefix) for p in index):
+                # 從未被 commit 過（untracked 或不存在）
+                return None
+
+    key = (str(repo), head or "", rel_path, before)
+    if head and key in _file_commit_memo:
+        return _file_commit_memo[key]
     args = ["log", "-1", "--format=%H"]
     if before:
         args.extend(["--before", before])
     args.extend(["--", rel_path])
-    return _git(repo, *args)
+    commit = _git(repo, *args)
+    if head:
+        _file_commit_memo[key] = commit
+    return commit
 
 
 def get_repo_blob(source: str, commit: str, rel_path: str) -> bytes | None:
@@ -881,17 +1144,7 @@ def get_repo_blob(source: str, commit: str, rel_path: str) -> bytes | None:
     repo = get_source_repo_path(source)
     if not repo:
         return None
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(repo), "show", f"{commit}:{rel_path}"],
-            capture_output=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            return None
-        return result.stdout
-    except Exception:
-        return None
+    return get_git_reader(repo).read_blob(commit, rel_path)
 
 
 def is_commit_valid(source: str, commit: str) -> bool:
@@ -899,15 +1152,14 @@ def is_commit_valid(source: str, commit: str) -> bool:
     repo = get_source_repo_path(source)
     if not repo:
         return False
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(repo), "cat-file", "-e", f"{commit}^{{commit}}"],
-            capture_output=True,
-            check=False,
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    return get_git_reader(repo).commit_exists(commit)
+
+
+def close_git_session() -> None:
+    """結束本輪分發的 git 批次 reader 與 memo。"""
+    close_git_readers()
+    clear_path_index_memo()
+    _file_commit_memo.clear()
 
 
 def list_changed_files(source: str, last_commit: str, head: str) -> list[str]:
@@ -921,6 +1173,44 @@ def list_changed_files(source: str, last_commit: str, head: str) -> list[str]:
     return [line.strip() for line in out.splitlines() if line.strip()]
 
 
+def list_dirty_files(source: str) -> list[str] | None:
+    """回傳 source repo 工作樹中未 commit（含 untracked）的檔案清單。
+
+    `list_changed_files` 只看 commit 區間；增量分發還需要納入本地尚未
+    commit 的修改。git 失敗時回傳 None，由呼叫端退回完整掃描。
+    """
+    repo = get_source_repo_path(source)
+    if not repo:
+        return None
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo), "status", "--porcelain", "-z", "--untracked-files=all"],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+            check=False,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    out: list[str] = []
+    entries = result.stdout.split("\0")
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        out.append(entry[3:])
+        # rename / copy 後面緊接原路徑
+        if entry[0] in "RC" and i < len(entries):
+            out.append(entries[i])
+            i += 1
+    return out
+
+
 # ------------------------------------------------------------
 # Schema 偵測 / file entry 存取
 # ------------------------------------------------------------
@@ -1136,19 +1426,20 @@ def update_last_sync_commit(manifest: dict, source: str, commit: str | None) ->
 # ------------------------------------------------------------
 
 
-def _backup_v1_manifest(target: TargetType) -> Path | None:
+def _backup_v1_manifest(target: TargetType, out: Console | None = None) -> Path | None:
+    out = out or console
     src = get_manifest_path(target)
     if not src.exists():
         return None
     backup_dir = get_manifest_dir() / ".backup-v1"
     backup_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
-    dst = backup_dir / f"{target}.yaml.{timestamp}"
+    dst = backup_dir / f"{src.name}.{timestamp}"
     try:
         shutil.copy2(src, dst)
         return dst
     except Exception as e:
-        console.print(f"[yellow]警告：v1 manifest 備份失敗 ({e})[/yellow]")
+        out.print(f"[yellow]警告：v1 manifest 備份失敗 ({e})[/yellow]")
         return None
 
 
@@ -1174,10 +1465,10 @@ def migrate_to_v2(v1_manifest: dict, target: TargetType) -> dict:
             if target_path is None or not target_path.exists():
                 continue
             if resource_type == "skills":
-                current_dir_hash = compute_dir_hash(target_path)
-                if current_dir_hash != old_hash:
+                scan = scan_skill_dir(target_path)
+                if scan.hash != old_hash:
                     continue
-                file_map = compute_skill_file_map(target_path)
+                file_map = scan.files
                 files_block: dict = {}
                 src_repo_root = get_source_repo_path(source)
                 for rel, file_hash in file_map.items():
@@ -1247,16 +1538,17 @@ def _resolve_repo_rel(
     return name
 
 
-def maybe_migrate_manifest(target: TargetType) -> dict | None:
+def maybe_migrate_manifest(target: TargetType, out: Console | None = None) -> dict | None:
     """讀取 manifest，若為 v1 則 migrate 並寫回。回傳 v2 manifest。"""
-    raw = read_manifest(target)
+    out = out or console
+    raw = read_manifest(target, out=out)
     if raw is None:
         return None
     if is_v2(raw):
         return raw
-    backup = _backup_v1_manifest(target)
+    backup = _backup_v1_manifest(target, out=out)
     if backup:
-        console.print(
+        out.print(
             f"[dim]已備份 v1 manifest → {backup.name}（manifest schema 升級為 v2）[/dim]"
         )
     upgraded = migrate_to_v2(raw, target)
@@ -0,0 +1,148 @@
+"""
+Manifest 儲存後端：決定 manifest 檔的格式、路徑與讀寫方式。
+
+v2 manifest 為每個 skill 檔案保存一筆 FileEntry，數量到數千筆後，純 Python
+的 `yaml.safe_load` / `yaml.dump` 會成為 `ai-dev clone` 啟動的主要成本。
+
+- YAML（預設）：有 libyaml 時改用 `CSafeLoader` / `CSafeDumper`，輸出仍為
+  可讀的 block style，與既有檔案相容。
+- JSON：以 `AI_DEV_MANIFEST_FORMAT=json` 選用，讀寫速度再快一個量級。
+- 讀取時優先找偏好格式，找不到再讀另一種格式；寫入一律寫偏好格式，並移除
+  另一種格式的舊檔，因此切換格式後第一次寫入即完成遷移。
+- 寫入以 temp file + rename 完成，中途中斷不會留下半個 manifest。
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Literal
+
+import yaml
+
+ManifestFormat = Literal["yaml", "json"]
+
+MANIFEST_FORMATS: tuple[ManifestFormat, ...] = ("yaml", "json")
+MANIFEST_FORMAT_ENV = "AI_DEV_MANIFEST_FORMAT"
+DEFAULT_MANIFEST_FORMAT: ManifestFormat = "yaml"
+
+_SUFFIXES: dict[str, str] = {"yaml": ".yaml", "json": ".json"}
+
+# libyaml 不一定存在（例如從 sdist 安裝的 PyYAML）；沒有時退回純 Python 實作
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def get_manifest_format() -> ManifestFormat:
+    """回傳目前偏好的 manifest 格式（環境變數無效時使用預設值）。"""
+    value = os.environ.get(MANIFEST_FORMAT_ENV, "").strip().lower()
+    return value if value in MANIFEST_FORMATS else DEFAULT_MANIFEST_FORMAT
+
+
+def _ordered_formats(preferred: ManifestFormat) -> list[ManifestFormat]:
+    return [preferred, *(fmt for fmt in MANIFEST_FORMATS if fmt != preferred)]
+
+
+def manifest_file(directory: Path, stem: str, fmt: ManifestFormat | None = None) -> Path:
+    """回傳指定格式（預設為偏好格式）的 manifest 檔路徑。"""
+    return directory / f"{stem}{_SUFFIXES[fmt or get_manifest_format()]}"
+
+
+def find_manifest_file(directory: Path, stem: str) -> Path | None:
+    """回傳已存在的 manifest 檔（偏好格式優先），都不存在時回傳 None。"""
+    for fmt in _ordered_formats(get_manifest_format()):
+        path = manifest_file(directory, stem, fmt)
+        if path.exists():
+            return path
+    return None
+
+
+def list_manifest_stems(directory: Path) -> list[str]:
+    """列出目錄下所有 manifest 的名稱（不含副檔名、去重、排序）。"""
+    if not directory.is_dir():
+        return []
+    stems = {
+        path.stem
+        for suffix in _SUFFIXES.values()
+        for path in directory.glob(f"*{suffix}")
+        if path.is_file()
+    }
+    return sorted(stems)
+
+
+def load_document(path: Path):
+    """依副檔名解析 manifest 檔。
+
+    Raises:
+        OSError: 讀取失敗
+        ValueError: JSON 格式錯誤
+        yaml.YAMLError: YAML 格式錯誤
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == _SUFFIXES["json"]:
+            return json.load(f)
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def dump_document(path: Path, data: dict) -> None:
+    """依副檔名序列化並以 temp file + rename 原子寫入。"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if path.suffix == _SUFFIXES["json"]:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=str)
+            else:
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=YamlDumper,
+                    allow_unicode=True,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_manifest_file(directory: Path, stem: str, data: dict) -> Path:
+    """以偏好格式寫入 manifest，並移除其他格式的舊檔。"""
+    path = manifest_file(directory, stem)
+    dump_document(path, data)
+    for fmt in MANIFEST_FORMATS:
+        other = manifest_file(directory, stem, fmt)
+        if other != path:
+            other.unlink(missing_ok=True)
+    return path
+
+
+def convert_manifests(directory: Path, fmt: ManifestFormat) -> list[tuple[Path, Path]]:
+    """一次性把目錄下所有 manifest 轉為指定格式。
+
+    已是目標格式者略過；解析失敗的檔案保留原樣。
+
+    Returns:
+        list[tuple[Path, Path]]: 已轉換的 (原檔, 新檔)
+    """
+    converted: list[tuple[Path, Path]] = []
+    for stem in list_manifest_stems(directory):
+        dst = manifest_file(directory, stem, fmt)
+        for src_fmt in MANIFEST_FORMATS:
+            src = manifest_file(directory, stem, src_fmt)
+            if src_fmt == fmt or not src.exists():
+                continue
+            if dst.exists() and dst.stat().st_mtime_ns >= src.stat().st_mtime_ns:
+                # 目標格式較新：舊格式檔是殘留，直接移除
+                src.unlink()
+                continue
+            try:
+                data = load_document(src)
+            except (OSError, ValueError, yaml.YAMLError):
+                continue
+            if not isinstance(data, dict):
+                continue
+            dump_document(dst, data)
+            src.unlink()
+            converted.append((src, dst))
+    return converted
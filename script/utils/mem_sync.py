@@ -138,6 +138,171 @@ def append_pulled_hashes(hashes: list[str]) -> None:
             f.write(value + "\n")
 
 
+# ---------------------------------------------------------------------------
+# Observation content-hash sidecar index
+# ---------------------------------------------------------------------------
+#
+# push / pull / cleanup 都需要本地每筆 observation 的 content hash。
+# 索引存放在 ai-dev 自有的 SQLite（不動 claude-mem schema），以 `id > max_seen`
+# 增量補齊；筆數不符時（claude-mem 或 cleanup 刪除過資料）清掉已不存在的 id。
+
+MEM_HASH_INDEX_VERSION = 1
+
+
+def get_hash_index_path() -> Path:
+    return get_ai_dev_config_dir() / "cache" / "mem-hash-index.db"
+
+
+def _content_hash_sql(title, narrative, facts, project, obs_type) -> str:
+    return compute_content_hash(
+        {
+            "title": title,
+            "narrative": narrative,
+            "facts": facts,
+            "project": project,
+            "type": obs_type,
+        }
+    )
+
+
+def _open_hash_index() -> sqlite3.Connection | None:
+    """開啟 sidecar 索引並增量同步；本地 claude-mem DB 不存在時回傳 None。"""
+    db_path = CLAUDE_MEM_DB_PATH
+    if not db_path.exists():
+        return None
+
+    index_path = get_hash_index_path()
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(f"file:{index_path}", uri=True)
+    try:
+        conn.create_function("content_hash", 5, _content_hash_sql, deterministic=True)
+        conn.execute("ATTACH DATABASE ? AS mem", (f"file:{db_path}?mode=ro",))
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS obs_hashes (
+                id INTEGER PRIMARY KEY,
+                hash TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_obs_hashes_hash ON obs_hashes(hash);
+            """
+        )
+        _sync_hash_index(conn)
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def _sync_hash_index(conn: sqlite3.Connection) -> None:
+    meta = dict(conn.execute("SELECT key, value FROM main.meta").fetchall())
+    max_seen = int(meta.get("max_id") or 0)
+    src_max = conn.execute("SELECT COALESCE(MAX(id), 0) FROM mem.observations").fetchone()[0]
+
+    # 版本不同或 claude-mem DB 被重建（id 倒退）：整份重建
+    if meta.get("version") != str(MEM_HASH_INDEX_VERSION) or src_max < max_seen:
+        conn.execute("DELETE FROM main.obs_hashes")
+        max_seen = 0
+
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO main.obs_hashes (id, hash) "
+            "SELECT id, content_hash(title, narrative, facts, project, type) "
+            "FROM mem.observations WHERE id > ?",
+            (max_seen,),
+        )
+        src_count = conn.execute("SELECT COUNT(*) FROM mem.observations").fetchone()[0]
+        index_count = conn.execute("SELECT COUNT(*) FROM main.obs_hashes").fetchone()[0]
+        if src_count != index_count:
+            conn.execute(
+                "DELETE FROM main.obs_hashes "
+                "WHERE id NOT IN (SELECT id FROM mem.observations)"
+            )
+        conn.executemany(
+            "INSERT OR REPLACE INTO main.meta (key, value) VALUES (?, ?)",
+            [("version", str(MEM_HASH_INDEX_VERSION)), ("max_id", str(src_max))],
+        )
+
+
+def get_observation_hashes(ids: list[int]) -> dict[int, str]:
+    """以 observation id 查 content hash（查不到的 id 不在結果中）。"""
+    if not ids:
+        return {}
+    conn = _open_hash_index()
+    if conn is None:
+        return {}
+    try:
+        out: dict[int, str] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            out.update(
+                conn.execute(
+                    f"SELECT id, hash FROM main.obs_hashes WHERE id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+            )
+        return out
+    finally:
+        conn.close()
+
+
+def find_local_content_hashes(hashes: list[str]) -> set[str]:
+    """回傳 hashes 中本地已存在的 content hash。"""
+    if not hashes:
+        return set()
+    conn = _open_hash_index()
+    if conn is None:
+        return set()
+    try:
+        found: set[str] = set()
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            found.update(
+                row[0]
+                for row in conn.execute(
+                    f"SELECT DISTINCT hash FROM main.obs_hashes WHERE hash IN ({placeholders})",
+                    chunk,
+                )
+            )
+        return found
+    finally:
+        conn.close()
+
+
+def get_duplicate_hash_groups() -> list[list[int]]:
+    """回傳 content hash 相同的 observation id 群組（各群組 id 由小到大）。"""
+    conn = _open_hash_index()
+    if conn is None:
+        return []
+    try:
+        groups: dict[str, list[int]] = {}
+        for obs_id, content_hash in conn.execute(
+            "SELECT id, hash FROM main.obs_hashes WHERE hash IN ("
+            "SELECT hash FROM main.obs_hashes GROUP BY hash HAVING COUNT(*) > 1"
+            ") ORDER BY id"
+        ):
+            groups.setdefault(content_hash, []).append(obs_id)
+        return list(groups.values())
+    finally:
+        conn.close()
+
+
+def get_hash_index_stats() -> dict[str, int]:
+    """回傳本地 observations 筆數與 content hash 重複筆數。"""
+    conn = _open_hash_index()
+    if conn is None:
+        return {"observations": 0, "duplicates": 0}
+    try:
+        total, distinct = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT hash) FROM main.obs_hashes"
+        ).fetchone()
+        return {"observations": total, "duplicates": total - distinct}
+    finally:
+        conn.close()
+
+
 def push_preflight(config: dict[str, Any], hashes: list[str]) -> list[str]:
     """查詢 server 缺少的 observations content hash。"""
     if not hashes:
@@ -216,30 +381,6 @@ _PROMPT_COLS = [
 ]
 
 
-def _pick(row: dict[str, Any], cols: list[str]) -> dict[str, Any]:
-    return {c: row.get(c) for c in cols}
-
-
-def _insert_ignore(
-    conn: sqlite3.Connection, table: str, row: dict[str, Any], cols: list[str]
-) -> bool:
-    data = _pick(row, cols)
-    placeholders = ", ".join("?" for _ in data)
-    col_names = ", ".join(data.keys())
-    try:
-        conn.execute(
-            f"INSERT OR IGNORE INTO {table} ({col_names}) VALUES ({placeholders})",
-            list(data.values()),
-        )
-        return conn.total_changes > 0
-    except sqlite3.Error:
-        return False
-
-
-def _exists(conn: sqlite3.Connection, sql: str, params: tuple) -> bool:
-    return conn.execute(sql, params).fetchone() is not None
-
-
 WORKER_URL = "http://localhost:37777"
 CHROMA_DB_PATH = Path("~/.claude-mem/chroma/chroma.sqlite3").expanduser()
 
@@ -369,103 +510,126 @@ def reindex_observations() -> dict[str, Any]:
     return stats
 
 
+def _bulk_insert_new(
+    conn: sqlite3.Connection,
+    table: str,
+    rows: list[dict[str, Any]],
+    cols: list[str],
+    key_cols: list[str] | None,
+) -> int:
+    """以暫存表 + anti-join 一次匯入多筆資料，回傳實際寫入筆數。
+
+    key_cols 為 None 時交給 table 的 UNIQUE 約束（INSERT OR IGNORE）；
+    否則排除 key 已存在於 table、或在同批較早出現過的列。key 比對使用 `=`，
+    與逐筆 `SELECT 1 ... WHERE col = ?` 相同：含 NULL 的 key 不視為重複。
+    """
+    if not rows:
+        return 0
+
+    stage = f"_import_{table}"
+    col_names = ", ".join(cols)
+    conn.execute(f"DROP TABLE IF EXISTS temp.{stage}")
+    conn.execute(f"CREATE TEMP TABLE {stage} (_seq INTEGER PRIMARY KEY, {col_names})")
+    conn.executemany(
+        f"INSERT INTO temp.{stage} (_seq, {col_names}) "
+        f"VALUES (?, {', '.join('?' for _ in cols)})",
+        ([seq, *(row.get(c) for c in cols)] for seq, row in enumerate(rows)),
+    )
+
+    before = conn.total_changes
+    if key_cols is None:
+        conn.execute(
+            f"INSERT OR IGNORE INTO {table} ({col_names}) "
+            f"SELECT {col_names} FROM temp.{stage} ORDER BY _seq"
+        )
+    else:
+        conn.execute(
+            f"CREATE INDEX temp.{stage}_key ON {stage} ({', '.join(key_cols)})"
+        )
+        match_existing = " AND ".join(f"t.{c} = s.{c}" for c in key_cols)
+        match_earlier = " AND ".join(f"e.{c} = s.{c}" for c in key_cols)
+        conn.execute(
+            f"INSERT INTO {table} ({col_names}) "
+            f"SELECT {', '.join(f's.{c}' for c in cols)} FROM temp.{stage} AS s "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {table} AS t WHERE {match_existing}) "
+            f"AND NOT EXISTS (SELECT 1 FROM temp.{stage} AS e "
+            f"WHERE e._seq < s._seq AND {match_earlier}) "
+            f"ORDER BY s._seq"
+        )
+    imported = conn.total_changes - before
+    conn.execute(f"DROP TABLE temp.{stage}")
+    return imported
+
+
 def import_to_local_db(data: dict[str, list]) -> dict[str, Any]:
-    """直接寫入本地 claude-mem SQLite（claude-mem worker 不可用時的 fallback）。"""
+    """直接寫入本地 claude-mem SQLite（claude-mem worker 不可用時的 fallback）。
+
+    各 table 以暫存表 + set-based anti-join 批次去重與寫入，
+    整批在單一交易內完成（WAL + synchronous=NORMAL）。
+    """
     db_path = CLAUDE_MEM_DB_PATH
     if not db_path.exists():
         raise FileNotFoundError(f"claude-mem 資料庫不存在：{db_path}")
 
-    stats: dict[str, int] = {
-        "sessionsImported": 0,
-        "sessionsSkipped": 0,
-        "observationsImported": 0,
-        "observationsSkipped": 0,
-        "summariesImported": 0,
-        "summariesSkipped": 0,
-        "promptsImported": 0,
-        "promptsSkipped": 0,
-    }
+    sessions = list(data.get("sessions", []))
+    observations = list(data.get("observations", []))
+    prompts = list(data.get("prompts", []))
+
+    summaries: list[dict[str, Any]] = []
+    summaries_without_sid = 0
+    for row in data.get("summaries", []):
+        sid = row.get("session_id") or row.get("memory_session_id")
+        if not sid:
+            summaries_without_sid += 1
+            continue
+        row_copy = dict(row)
+        row_copy["memory_session_id"] = sid
+        summaries.append(row_copy)
 
     conn = sqlite3.connect(str(db_path))
     try:
-        # sessions — content_session_id UNIQUE
-        for row in data.get("sessions", []):
-            before = conn.total_changes
-            _insert_ignore(conn, "sdk_sessions", row, _SESSION_COLS)
-            if conn.total_changes > before:
-                stats["sessionsImported"] += 1
-            else:
-                stats["sessionsSkipped"] += 1
-
-        # observations — dedup by (memory_session_id, title, created_at_epoch)
-        for row in data.get("observations", []):
-            if _exists(
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            # sessions — content_session_id UNIQUE
+            sessions_imported = _bulk_insert_new(
+                conn, "sdk_sessions", sessions, _SESSION_COLS, None
+            )
+            # observations — dedup by (memory_session_id, title, created_at_epoch)
+            observations_imported = _bulk_insert_new(
                 conn,
-                "SELECT 1 FROM observations WHERE memory_session_id = ? AND title = ? AND created_at_epoch = ?",
-                (
-                    row.get("memory_session_id"),
-                    row.get("title"),
-                    row.get("created_at_epoch"),
-                ),
-            ):
-                stats["observationsSkipped"] += 1
-                continue
-            d = _pick(row, _OBSERVATION_COLS)
-            placeholders = ", ".join("?" for _ in d)
-            col_names = ", ".join(d.keys())
-            conn.execute(
-                f"INSERT INTO observations ({col_names}) VALUES ({placeholders})",
-                list(d.values()),
+                "observations",
+                observations,
+                _OBSERVATION_COLS,
+                ["memory_session_id", "title", "created_at_epoch"],
             )
-            stats["observationsImported"] += 1
-
-        # summaries — dedup by memory_session_id
-        for row in data.get("summaries", []):
-            sid = row.get("session_id") or row.get("memory_session_id")
-            if not sid:
-                stats["summariesSkipped"] += 1
-                continue
-            row_copy = dict(row)
-            row_copy["memory_session_id"] = sid
-            if _exists(
+            # summaries — dedup by memory_session_id
+            summaries_imported = _bulk_insert_new(
                 conn,
-                "SELECT 1 FROM session_summaries WHERE memory_session_id = ?",
-                (sid,),
-            ):
-                stats["summariesSkipped"] += 1
-                continue
-            d = _pick(row_copy, _SUMMARY_COLS)
-            placeholders = ", ".join("?" for _ in d)
-            col_names = ", ".join(d.keys())
-            conn.execute(
-                f"INSERT INTO session_summaries ({col_names}) VALUES ({placeholders})",
-                list(d.values()),
+                "session_summaries",
+                summaries,
+                _SUMMARY_COLS,
+                ["memory_session_id"],
             )
-            stats["summariesImported"] += 1
-
-        # prompts — dedup by (content_session_id, prompt_number)
-        for row in data.get("prompts", []):
-            if _exists(
+            # prompts — dedup by (content_session_id, prompt_number)
+            prompts_imported = _bulk_insert_new(
                 conn,
-                "SELECT 1 FROM user_prompts WHERE content_session_id = ? AND prompt_number = ?",
-                (row.get("content_session_id"), row.get("prompt_number")),
-            ):
-                stats["promptsSkipped"] += 1
-                continue
-            d = _pick(row, _PROMPT_COLS)
-            placeholders = ", ".join("?" for _ in d)
-            col_names = ", ".join(d.keys())
-            conn.execute(
-                f"INSERT INTO user_prompts ({col_names}) VALUES ({placeholders})",
-                list(d.values()),
+                "user_prompts",
+                prompts,
+                _PROMPT_COLS,
+                ["content_session_id", "prompt_number"],
             )
-            stats["promptsImported"] += 1
-
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
     finally:
         conn.close()
 
+    stats: dict[str, int] = {
+        "sessionsImported": sessions_imported,
+        "sessionsSkipped": len(sessions) - sessions_imported,
+        "observationsImported": observations_imported,
+        "observationsSkipped": len(observations) - observations_imported,
+        "summariesImported": summaries_imported,
+        "summariesSkipped": len(summaries) - summaries_imported + summaries_without_sid,
+        "promptsImported": prompts_imported,
+        "promptsSkipped": len(prompts) - prompts_imported,
+    }
     return {"stats": stats}
@@ -2,23 +2,38 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
+import json
+import os
 from pathlib import Path
 import shutil
-from typing import Literal
+import threading
+import time
+from typing import Callable, Literal
 
 from .git_exclude import ALWAYS_EXCLUDE, GITHUB_AI_PATHS, ensure_ai_exclude
-from .manifest import compute_dir_hash, compute_file_hash
-from .paths import get_custom_skills_dir
+from .manifest import (
+    FINGERPRINT_RACY_WINDOW_NS,
+    _walk_hashable_files,
+    make_fingerprint,
+    recorded_fingerprints,
+    scan_skill_dirs,
+)
+from .paths import get_ai_dev_config_dir, get_custom_skills_dir
 from .project_blocks import (
     read_managed_block,
     read_managed_block_text,
     remove_managed_block,
     upsert_managed_block,
 )
-from .project_projection_manifest import read_project_manifest, write_project_manifest
+from .project_projection_manifest import (
+    list_project_manifests,
+    read_project_manifest,
+    write_project_manifest,
+)
 from .project_tracking import load_tracking_file, update_tracking_file
 
 PROJECT_PROJECTION_SCHEMA_VERSION = "1"
@@ -46,6 +61,12 @@ PARTIALLY_MANAGED_PROJECT_PATHS = {f".github/{path}" for path in GITHUB_AI_PATHS
 VALID_CONFLICT_MODES = {"skip", "force", "backup"}
 ProjectionKind = Literal["managed_block", "dir", "file"]
 
+# 各投影項目互不重疊，可並行比對與寫入
+PROJECTION_MAX_WORKERS = 8
+# fleet 模式同時處理的專案數（各專案內改為逐項處理，避免 thread 數相乘）
+FLEET_MAX_WORKERS = 4
+TEMPLATE_HASH_CACHE_VERSION = 1
+
 
 @dataclass(frozen=True)
 class ProjectionEntry:
@@ -148,44 +169,200 @@ def _extract_managed_block_content(source_path: Path) -> str:
     return source_text
 
 
-def _get_expected_hash(
-    entry: ProjectionEntry, managed_block_content: str | None = None
-) -> str:
-    if entry.kind == "managed_block":
-        if managed_block_content is None:
-            managed_block_content = _extract_managed_block_content(entry.source_path)
-        return compute_text_hash(managed_block_content)
-    if entry.kind == "dir":
-        return compute_dir_hash(entry.source_path)
-    return compute_file_hash(entry.source_path)
+# ------------------------------------------------------------
+# 模板端 hash 快取
+# ------------------------------------------------------------
+
+
+@dataclass
+class TemplateHashes:
+    """單一模板版本的預期 hash 與模板端 fingerprint（relative_path 為 key）。"""
 
+    version: str
+    hashes: dict[str, str] = field(default_factory=dict)
+    fingerprints: dict[str, dict[str, list]] = field(default_factory=dict)
+
+
+_template_memo: dict[str, TemplateHashes] = {}
+_template_memo_lock = threading.Lock()
+
+
+def get_template_hash_cache_path() -> Path:
+    """回傳模板 hash 快取檔路徑。"""
+    return get_ai_dev_config_dir() / "cache" / "project-template-hashes.json"
+
+
+def compute_template_version(entries: list[ProjectionEntry]) -> str | None:
+    """以 stat 走訪計算模板內容版本；有 mtime 過新（racy）的檔案時回傳 None。
+
+    版本涵蓋每個投影來源檔案的相對路徑、size 與 mtime_ns，任一變動都會換版本。
+    """
+    racy_after = time.time_ns() - FINGERPRINT_RACY_WINDOW_NS
+    sha256 = hashlib.sha256(f"v{TEMPLATE_HASH_CACHE_VERSION}".encode("utf-8"))
+    for entry in entries:
+        if entry.kind == "dir":
+            files = [(rel, st) for rel, _abs, st in _walk_hashable_files(entry.source_path)]
+        else:
+            try:
+                files = [("", os.stat(entry.source_path))]
+            except OSError:
+                return None
+        for rel, st in files:
+            if st.st_mtime_ns >= racy_after:
+                return None
+            sha256.update(
+                f"{entry.relative_path}\0{entry.kind}\0{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8")
+            )
+    return f"sha256:{sha256.hexdigest()}"
 
-def _get_current_hash(target_path: Path, kind: str) -> str | None:
-    if not target_path.exists():
-        return None
+
+def _compute_template_hashes(entries: list[ProjectionEntry], version: str) -> TemplateHashes:
+    result = TemplateHashes(version=version)
+    scanned = [entry for entry in entries if entry.kind != "managed_block"]
+    for entry, scan in zip(scanned, scan_skill_dirs([e.source_path for e in scanned])):
+        result.hashes[entry.relative_path] = scan.hash
+        if entry.kind == "dir":
+            result.fingerprints[entry.relative_path] = scan.fingerprints
+        else:
+            fp = make_fingerprint(os.stat(entry.source_path), scan.hash)
+            result.fingerprints[entry.relative_path] = {"": fp} if fp else {}
+    for entry in entries:
+        if entry.kind == "managed_block":
+            result.hashes[entry.relative_path] = compute_text_hash(
+                _extract_managed_block_content(entry.source_path)
+            )
+    return result
+
+
+def _read_template_cache(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != TEMPLATE_HASH_CACHE_VERSION:
+        return {}
+    templates = data.get("templates")
+    return templates if isinstance(templates, dict) else {}
+
+
+def _write_template_cache(path: Path, key: str, hashes: TemplateHashes) -> None:
+    templates = _read_template_cache(path)
+    templates[key] = {
+        "content_version": hashes.version,
+        "hashes": hashes.hashes,
+        "fingerprints": hashes.fingerprints,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": TEMPLATE_HASH_CACHE_VERSION, "templates": templates},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, path)
+    except OSError:
+        # 快取寫入失敗不影響投影，下次再重算
+        pass
+
+
+def get_template_hashes(template_dir: Path, entries: list[ProjectionEntry]) -> TemplateHashes:
+    """取得模板各投影項目的預期 hash。
+
+    以 `compute_template_version` 的內容版本為 key，依序查行程內 memo、
+    磁碟快取，都未命中才實際 hash 模板；模板有 racy 檔案時不快取。
+    """
+    key = str(template_dir)
+    version = compute_template_version(entries)
+    if version is None:
+        return _compute_template_hashes(entries, "")
+
+    with _template_memo_lock:
+        memo = _template_memo.get(key)
+    if memo is not None and memo.version == version:
+        return memo
+
+    cache_path = get_template_hash_cache_path()
+    cached = _read_template_cache(cache_path).get(key)
+    if isinstance(cached, dict) and cached.get("content_version") == version:
+        hashes = TemplateHashes(
+            version=version,
+            hashes=cached.get("hashes") or {},
+            fingerprints=cached.get("fingerprints") or {},
+        )
+    else:
+        hashes = _compute_template_hashes(entries, version)
+        _write_template_cache(cache_path, key, hashes)
+
+    with _template_memo_lock:
+        _template_memo[key] = hashes
+    return hashes
+
+
+# ------------------------------------------------------------
+# 專案端 fingerprint
+# ------------------------------------------------------------
+
+
+def _scan_current(
+    target_path: Path,
+    kind: str,
+    previous_record: dict | None = None,
+    known: dict[str, list] | None = None,
+) -> tuple[str | None, dict[str, list]]:
+    """計算專案端目前 hash 與 fingerprint。
+
+    size 與 mtime_ns 與紀錄（或 known）相同的檔案沿用紀錄的 hash，不讀檔。
+    managed_block 的 fingerprint 以整個檔案的 stat 對應區塊 hash。
+    """
+    recorded = recorded_fingerprints(previous_record or {}) or known
 
     if kind == "managed_block":
+        try:
+            st = os.stat(target_path)
+        except OSError:
+            return None, {}
+        fp = (recorded or {}).get("")
+        if fp and fp[0] == st.st_size and fp[1] == st.st_mtime_ns:
+            return fp[2], {"": fp}
         content = read_managed_block(target_path, PROJECT_MANAGED_BLOCK_ID)
         if content is None:
-            return None
-        return compute_text_hash(content)
+            return None, {}
+        current = compute_text_hash(content)
+        fp = make_fingerprint(st, current)
+        return current, {"": fp} if fp else {}
 
     if kind == "dir":
         if not target_path.is_dir():
-            return None
-        return compute_dir_hash(target_path)
+            return None, {}
+        scan = scan_skill_dirs([target_path], known=[recorded])[0]
+        return scan.hash, scan.fingerprints
 
     if not target_path.is_file():
-        return None
-    return compute_file_hash(target_path)
+        return None, {}
+    scan = scan_skill_dirs([target_path], known=[recorded])[0]
+    fp = make_fingerprint(os.stat(target_path), scan.hash)
+    return scan.hash, {"": fp} if fp else {}
 
 
-def _build_manifest_record(entry: ProjectionEntry, expected_hash: str) -> dict[str, str]:
-    return {
+def _build_manifest_record(
+    entry: ProjectionEntry,
+    expected_hash: str,
+    fingerprints: dict[str, list] | None = None,
+) -> dict:
+    record: dict = {
         "kind": entry.kind,
         "hash": expected_hash,
         "source": entry.relative_path,
     }
+    if fingerprints:
+        if entry.kind == "dir":
+            record["fingerprints"] = fingerprints
+        elif "" in fingerprints:
+            record["fingerprint"] = fingerprints[""]
+    return record
 
 
 def _backup_path(project_root: Path, relative_path: str, backup_root: Path) -> None:
@@ -244,8 +421,15 @@ def hydrate_project(
     project_root: Path,
     template_dir: Path | None = None,
     on_conflict: str = "skip",
+    max_workers: int | None = None,
+    template_hashes: TemplateHashes | None = None,
 ) -> HydrateResult:
-    """依 project intent 將 AI 設定投影到專案內。"""
+    """依 project intent 將 AI 設定投影到專案內。
+
+    模板端預期 hash 依模板內容版本快取；專案端以 manifest 記錄的 stat
+    fingerprint 略過未變動檔案的 hash；各投影項目互不重疊，並行處理。
+    `template_hashes` 供 fleet 模式在多個專案間共用同一次模板掃描。
+    """
     project_root = Path(project_root).resolve()
     intent = load_tracking_file(project_root)
     if intent is None:
@@ -281,16 +465,15 @@ def hydrate_project(
         backup_root = project_root / "_backup_project_projection" / timestamp
 
     new_files: dict[str, dict] = {}
+    if template_hashes is None:
+        template_hashes = get_template_hashes(template_dir, entries)
 
-    for entry in entries:
+    def _project_entry(entry: ProjectionEntry) -> tuple[str, dict | None]:
+        """比對並投影單一項目，回傳 (狀態, manifest 紀錄)。"""
         target_path = project_root / entry.relative_path
-        managed_block_content = None
-        if entry.kind == "managed_block":
-            managed_block_content = _extract_managed_block_content(entry.source_path)
-
-        expected_hash = _get_expected_hash(entry, managed_block_content)
+        expected_hash = template_hashes.hashes[entry.relative_path]
         previous_record = old_files.get(entry.relative_path)
-        current_hash = _get_current_hash(target_path, entry.kind)
+        current_hash, current_fps = _scan_current(target_path, entry.kind, previous_record)
 
         conflict = False
         if previous_record is not None:
@@ -298,8 +481,7 @@ def hydrate_project(
                 previous_record.get("kind") == entry.kind
                 and current_hash == previous_record.get("hash") == expected_hash
             ):
-                new_files[entry.relative_path] = _build_manifest_record(entry, expected_hash)
-                continue
+                return "unchanged", _build_manifest_record(entry, expected_hash, current_fps)
 
             if current_hash is not None and current_hash != previous_record.get("hash"):
                 conflict = True
@@ -307,18 +489,35 @@ def hydrate_project(
             conflict = True
 
         if conflict and on_conflict == "skip":
-            result.conflicts.append(entry.relative_path)
-            result.skipped.append(entry.relative_path)
-            if previous_record is not None:
-                new_files[entry.relative_path] = previous_record
-            continue
+            return "conflict", previous_record
 
         if conflict and on_conflict == "backup" and backup_root is not None and target_path.exists():
             _backup_path(project_root, entry.relative_path, backup_root)
 
-        _apply_projection_entry(project_root, entry, managed_block_content)
-        result.generated.append(entry.relative_path)
-        new_files[entry.relative_path] = _build_manifest_record(entry, expected_hash)
+        _apply_projection_entry(project_root, entry)
+        # copy2 / copytree 保留模板 mtime，以模板端 fingerprint 比對即可免讀檔
+        _hash, applied_fps = _scan_current(
+            target_path,
+            entry.kind,
+            known=template_hashes.fingerprints.get(entry.relative_path),
+        )
+        return "generated", _build_manifest_record(entry, expected_hash, applied_fps)
+
+    workers = max(1, min(max_workers or PROJECTION_MAX_WORKERS, len(entries)))
+    if workers == 1:
+        outcomes = [_project_entry(entry) for entry in entries]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_project_entry, entries))
+
+    for entry, (status, record) in zip(entries, outcomes):
+        if status == "conflict":
+            result.conflicts.append(entry.relative_path)
+            result.skipped.append(entry.relative_path)
+        elif status == "generated":
+            result.generated.append(entry.relative_path)
+        if record is not None:
+            new_files[entry.relative_path] = record
 
     for relative_path, previous_record in sorted(old_files.items()):
         if relative_path in desired_paths:
@@ -329,7 +528,7 @@ def hydrate_project(
             continue
 
         kind = previous_record.get("kind", "file")
-        current_hash = _get_current_hash(target_path, kind)
+        current_hash, _fps = _scan_current(target_path, kind, previous_record)
         conflict = current_hash is not None and current_hash != previous_record.get("hash")
 
         if conflict and on_conflict == "skip":
@@ -364,6 +563,122 @@ def reconcile_project(
     project_root: Path,
     template_dir: Path | None = None,
     on_conflict: str = "skip",
+    max_workers: int | None = None,
+    template_hashes: TemplateHashes | None = None,
 ) -> HydrateResult:
     """收斂 project intent、projection manifest 與實際生成檔。"""
-    return hydrate_project(project_root, template_dir=template_dir, on_conflict=on_conflict)
+    return hydrate_project(
+        project_root,
+        template_dir=template_dir,
+        on_conflict=on_conflict,
+        max_workers=max_workers,
+        template_hashes=template_hashes,
+    )
+
+
+# ------------------------------------------------------------
+# Fleet 模式：一次收斂所有已追蹤專案
+# ------------------------------------------------------------
+
+FleetStatus = Literal["ok", "conflict", "missing", "error"]
+
+
+@dataclass
+class FleetProjectResult:
+    """fleet reconcile 中單一專案的結果。"""
+
+    project_id: str
+    project_root: str | None
+    status: FleetStatus
+    result: HydrateResult | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        result = self.result or HydrateResult()
+        return {
+            "project_id": self.project_id,
+            "project_root": self.project_root,
+            "status": self.status,
+            "generated": result.generated,
+            "skipped": result.skipped,
+            "removed": result.removed,
+            "conflicts": result.conflicts,
+            "error": self.error,
+        }
+
+
+def discover_tracked_projects() -> list[tuple[str, str | None, str | None]]:
+    """從 projection manifest 目錄找出所有已追蹤專案。
+
+    Returns:
+        list[tuple[str, str | None, str | None]]: (project_id, project_root, 問題說明)；
+        可直接 reconcile 者問題說明為 None
+    """
+    projects: list[tuple[str, str | None, str | None]] = []
+    for project_id, manifest in list_project_manifests():
+        if manifest is None:
+            projects.append((project_id, None, "projection manifest 無法讀取"))
+            continue
+        project_root = manifest.get("project_root")
+        if not project_root:
+            projects.append((project_id, None, "projection manifest 未記錄 project_root"))
+            continue
+        intent = load_tracking_file(Path(project_root))
+        if intent is None:
+            projects.append((project_id, project_root, "專案目錄或 .ai-dev-project.yaml 不存在"))
+        elif intent.get("project_id") != project_id:
+            projects.append(
+                (project_id, project_root, f"專案目錄已改由 {intent.get('project_id')} 使用")
+            )
+        else:
+            projects.append((project_id, project_root, None))
+    return projects
+
+
+def reconcile_all_projects(
+    template_dir: Path | None = None,
+    on_conflict: str = "skip",
+    max_workers: int | None = None,
+    prepare: Callable[[Path], object] | None = None,
+) -> list[FleetProjectResult]:
+    """以 worker pool 收斂所有已追蹤專案。
+
+    模板只掃描一次，各專案共用同一份 `TemplateHashes`；單一專案失敗不影響
+    其他專案，結果依 project_id 排序回傳。
+
+    Args:
+        prepare: 每個專案 reconcile 前呼叫（例如補齊 exclude 設定）
+    """
+    template_dir = (template_dir or get_project_template_dir()).resolve()
+    if not template_dir.exists():
+        raise FileNotFoundError(f"找不到 project-template 目錄：{template_dir}")
+    if on_conflict not in VALID_CONFLICT_MODES:
+        raise ValueError("on_conflict 必須是 skip、force 或 backup")
+
+    template_hashes = get_template_hashes(template_dir, _collect_projection_entries(template_dir))
+
+    def _reconcile_one(project: tuple[str, str | None, str | None]) -> FleetProjectResult:
+        project_id, project_root, problem = project
+        if problem is not None:
+            return FleetProjectResult(project_id, project_root, "missing", error=problem)
+        try:
+            if prepare is not None:
+                prepare(Path(project_root))
+            result = reconcile_project(
+                Path(project_root),
+                template_dir=template_dir,
+                on_conflict=on_conflict,
+                max_workers=1,
+                template_hashes=template_hashes,
+            )
+        except Exception as exc:
+            return FleetProjectResult(project_id, project_root, "error", error=str(exc))
+        status: FleetStatus = "conflict" if result.conflicts else "ok"
+        return FleetProjectResult(project_id, project_root, status, result=result)
+
+    projects = discover_tracked_projects()
+    workers = max(1, min(max_workers or FLEET_MAX_WORKERS, len(projects) or 1))
+    if workers == 1:
+        return [_reconcile_one(project) for project in projects]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_reconcile_one, projects))
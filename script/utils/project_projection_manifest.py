@@ -52,3 +52,18 @@ def write_project_manifest(project_id: str, manifest: dict) -> Path:
         yaml.dump(manifest, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
 
     return manifest_path
+
+
+def list_project_manifests() -> list[tuple[str, dict | None]]:
+    """列出本機所有專案投影 manifest，回傳 (project_id, manifest) 並依 id 排序。
+
+    無法解析的 manifest 以 None 表示，交由呼叫端回報。
+    """
+    manifest_dir = get_project_manifest_dir()
+    if not manifest_dir.is_dir():
+        return []
+    return [
+        (path.stem, read_project_manifest(path.stem))
+        for path in sorted(manifest_dir.glob("*.yaml"))
+        if path.is_file()
+    ]
@@ -0,0 +1,128 @@
+"""
+儲存庫狀態探測：每個 repo 只呼叫一次 `git status --porcelain=v2 --branch`。
+
+`ai-dev status` 與 `ai-dev update` 原本對每個 repo 分別呼叫
+`rev-parse` / `diff` / `rev-list` 取得 HEAD、分支、落後數與是否有修改；
+這裡一次取得全部欄位，並可跨 repo 並行執行。
+
+- HEAD / 分支 / upstream / ahead-behind 取自 `# branch.*` 標頭
+- dirty 只看已追蹤檔案（staged 或 unstaged），與 `git diff HEAD` + `--cached` 一致
+- 以 `--no-optional-locks` 執行，不會與同時進行的 git 操作搶 index.lock
+"""
+
+from __future__ import annotations
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_PROBE_MAX_WORKERS = 8
+REPO_PROBE_TIMEOUT = 30
+
+
+@dataclass(frozen=True)
+class RepoProbe:
+    """單一儲存庫的狀態快照。"""
+
+    path: Path
+    ok: bool
+    """git status 是否成功（False 時其餘欄位皆為預設值）"""
+
+    head: str | None = None
+    """HEAD commit；尚無 commit 時為 None"""
+
+    branch: str | None = None
+    """目前分支；detached HEAD 時為 None"""
+
+    upstream: str | None = None
+    """追蹤的遠端分支（如 `origin/main`）；未設定時為 None"""
+
+    ahead: int | None = None
+    behind: int | None = None
+    dirty: bool = False
+    """已追蹤檔案是否有 staged / unstaged 修改"""
+
+    @property
+    def has_upstream_updates(self) -> bool:
+        """upstream 有本地尚未包含的 commit。"""
+        return bool(self.behind)
+
+    @property
+    def in_sync_with_upstream(self) -> bool | None:
+        """HEAD 與 upstream 指向同一 commit；無 upstream 資訊時為 None。"""
+        if self.ahead is None or self.behind is None:
+            return None
+        return self.ahead == 0 and self.behind == 0
+
+
+def parse_porcelain_v2(path: Path, output: str) -> RepoProbe:
+    """解析 `git status --porcelain=v2 --branch` 的輸出。"""
+    head = branch = upstream = None
+    ahead = behind = None
+    dirty = False
+    for line in output.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid "):].strip()
+            head = None if oid == "(initial)" else oid
+        elif line.startswith("# branch.head "):
+            name = line[len("# branch.head "):].strip()
+            branch = None if name == "(detached)" else name
+        elif line.startswith("# branch.upstream "):
+            upstream = line[len("# branch.upstream "):].strip()
+        elif line.startswith("# branch.ab "):
+            parts = line.split()
+            try:
+                ahead = int(parts[2].lstrip("+"))
+                behind = int(parts[3].lstrip("-"))
+            except (IndexError, ValueError):
+                ahead = behind = None
+        elif line[:2] in ("1 ", "2 ", "u "):
+            dirty = True
+    return RepoProbe(
+        path=path,
+        ok=True,
+        head=head,
+        branch=branch,
+        upstream=upstream,
+        ahead=ahead,
+        behind=behind,
+        dirty=dirty,
+    )
+
+
+def probe_repo(path: Path, timeout: float = REPO_PROBE_TIMEOUT) -> RepoProbe:
+    """以單一 git 行程取得 repo 狀態；非 git 目錄或失敗時回傳 ok=False。"""
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "--no-optional-locks",
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "--untracked-files=no",
+            ],
+            cwd=str(path),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return RepoProbe(path=path, ok=False)
+    if result.returncode != 0:
+        return RepoProbe(path=path, ok=False)
+    return parse_porcelain_v2(path, result.stdout)
+
+
+def probe_repos(
+    paths: list[Path], max_workers: int | None = None
+) -> list[RepoProbe]:
+    """並行探測多個 repo，結果順序與 paths 相同。"""
+    if not paths:
+        return []
+    workers = max(1, min(max_workers or REPO_PROBE_MAX_WORKERS, len(paths)))
+    if workers == 1:
+        return [probe_repo(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(probe_repo, paths))
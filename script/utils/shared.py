@@ -11,6 +11,10 @@ import shutil
 import difflib
 import fnmatch
 import json
+import io
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
@@ -703,15 +707,18 @@ def _iter_skill_source_dirs(src: Path):
             yield item
 
 
-def _load_clone_policy(skill_dir: Path, show_warning: bool = True) -> dict | None:
+def _load_clone_policy(
+    skill_dir: Path, show_warning: bool = True, out: Console | None = None
+) -> dict | None:
     """載入並驗證 skill 目錄中的 .clonepolicy.json。"""
+    out = out or console
     policy_file = skill_dir / ".clonepolicy.json"
     if not policy_file.exists():
         return None
 
     def _warn(message: str) -> None:
         if show_warning:
-            console.print(
+            out.print(
                 f"[yellow]⚠ clone policy 無效：{shorten_path(policy_file)} ({message})，改用 copytree[/yellow]"
             )
 
@@ -761,8 +768,11 @@ def _resolve_clone_strategy(relative_path: str, rules: list[dict[str, str]]) ->
     return "default"
 
 
-def _merge_index_json(src_file: Path, dst_file: Path) -> None:
+def _merge_index_json(
+    src_file: Path, dst_file: Path, out: Console | None = None
+) -> None:
     """以 id/skillId 為 key 合併 _index.json。"""
+    out = out or console
     if not dst_file.exists():
         dst_file.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(src_file, dst_file)
@@ -771,7 +781,7 @@ def _merge_index_json(src_file: Path, dst_file: Path) -> None:
     try:
         src_data = json.loads(src_file.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError) as e:
-        console.print(
+        out.print(
             f"[yellow]⚠ 來源 JSON 讀取失敗，跳過 key-merge: {shorten_path(src_file)} ({e})[/yellow]"
         )
         return
@@ -779,14 +789,14 @@ def _merge_index_json(src_file: Path, dst_file: Path) -> None:
     try:
         dst_data = json.loads(dst_file.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError) as e:
-        console.print(
+        out.print(
             f"[yellow]⚠ 目標 JSON 讀取失敗，強制覆蓋: {shorten_path(dst_file)} ({e})[/yellow]"
         )
         shutil.copy2(src_file, dst_file)
         return
 
     if not isinstance(src_data, dict) or not isinstance(dst_data, dict):
-        console.print(
+        out.print(
             f"[yellow]⚠ JSON 結構錯誤，跳過 key-merge: {shorten_path(dst_file)}[/yellow]"
         )
         return
@@ -859,6 +869,15 @@ def _show_clone_file_diff(src_file: Path, dst_file: Path) -> None:
     console.print("\n".join(diff_lines))
 
 
+def _backup_and_overwrite(src_file: Path, dst_file: Path, out: Console) -> None:
+    """把目標檔備份成 `<name>.<timestamp>.bak` 後以來源覆蓋。"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = dst_file.with_name(f"{dst_file.name}.{timestamp}.bak")
+    shutil.copy2(dst_file, backup_path)
+    out.print(f"    [dim]已備份: {shorten_path(backup_path)}[/dim]")
+    shutil.copy2(src_file, dst_file)
+
+
 def _copy_skill_with_policy(
     src: Path,
     dst: Path,
@@ -866,10 +885,18 @@ def _copy_skill_with_policy(
     force: bool,
     skip_conflicts: bool,
     log_conflicts: bool = True,
+    backup: bool = False,
+    out: Console | None = None,
 ) -> None:
-    """依 clone policy 逐檔複製 skill。"""
+    """依 clone policy 逐檔複製 skill。
+
+    預設策略的衝突依 force → skip_conflicts → backup 的順序自動處理，
+    三者皆未指定時才逐檔詢問。
+    """
     from .manifest import compute_file_hash
 
+    out = out or console
+
     rules = policy.get("rules", [])
     dst.mkdir(parents=True, exist_ok=True)
 
@@ -892,7 +919,7 @@ def _copy_skill_with_policy(
             continue
 
         if strategy == "key-merge":
-            _merge_index_json(src_file, dst_file)
+            _merge_index_json(src_file, dst_file, out=out)
             continue
 
         if not dst_file.exists():
@@ -910,16 +937,20 @@ def _copy_skill_with_policy(
 
         if skip_conflicts:
             if log_conflicts:
-                console.print(f"    [yellow]跳過（衝突）: {relative_path}[/yellow]")
+                out.print(f"    [yellow]跳過（衝突）: {relative_path}[/yellow]")
+            continue
+
+        if backup:
+            _backup_and_overwrite(src_file, dst_file, out)
             continue
 
         while True:
-            console.print()
-            console.print(f"    [bold yellow]檔案衝突: {relative_path}[/bold yellow]")
-            console.print("    [cyan]1[/cyan]. 覆蓋")
-            console.print("    [cyan]2[/cyan]. 跳過")
-            console.print("    [cyan]3[/cyan]. 備份後覆蓋")
-            console.print("    [cyan]4[/cyan]. 查看差異")
+            out.print()
+            out.print(f"    [bold yellow]檔案衝突: {relative_path}[/bold yellow]")
+            out.print("    [cyan]1[/cyan]. 覆蓋")
+            out.print("    [cyan]2[/cyan]. 跳過")
+            out.print("    [cyan]3[/cyan]. 備份後覆蓋")
+            out.print("    [cyan]4[/cyan]. 查看差異")
 
             try:
                 choice = input("    請輸入選項 (1-4): ").strip()
@@ -932,17 +963,13 @@ def _copy_skill_with_policy(
             if choice == "2":
                 break
             if choice == "3":
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = dst_file.with_name(f"{dst_file.name}.{timestamp}.bak")
-                shutil.copy2(dst_file, backup_path)
-                console.print(f"    [dim]已備份: {shorten_path(backup_path)}[/dim]")
-                shutil.copy2(src_file, dst_file)
+                _backup_and_overwrite(src_file, dst_file, out)
                 break
             if choice == "4":
                 _show_clone_file_diff(src_file, dst_file)
                 continue
 
-            console.print("    [red]無效選項，請輸入 1-4[/red]")
+            out.print("    [red]無效選項，請輸入 1-4[/red]")
 
 
 def _copy_with_log(
@@ -955,6 +982,9 @@ def _copy_with_log(
     source: str = "custom-skills",
     force: bool = False,
     skip_conflicts: bool = False,
+    unchanged_names: set[str] | None = None,
+    backup: bool = False,
+    out: Console | None = None,
 ) -> None:
     """複製目錄並輸出帶路徑的日誌。
 
@@ -968,12 +998,16 @@ def _copy_with_log(
         source: 資源來源名稱（用於 manifest 追蹤）
         force: 預設策略衝突時是否強制覆蓋
         skip_conflicts: 預設策略衝突時是否直接跳過
+        unchanged_names: 增量模式下判定未變動、直接略過的資源名稱
+        backup: 預設策略衝突時是否備份後覆蓋
+        out: 輸出用的 Console（預設為模組 console）
     """
+    out = out or console
     if not src.exists():
         return
 
-    console.print(f"  [green]{resource_type}[/green] → [cyan]{target_name}[/cyan]")
-    console.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
+    out.print(f"  [green]{resource_type}[/green] → [cyan]{target_name}[/cyan]")
+    out.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
     dst.mkdir(parents=True, exist_ok=True)
 
     # 如果有 tracker，需要逐一記錄
@@ -988,11 +1022,13 @@ def _copy_with_log(
         if resource_type == "skills":
             # Skills 是目錄結構；支援 skills/<subdir>/<name>/ 扁平化
             for item in _iter_skill_source_dirs(src):
+                if unchanged_names and item.name in unchanged_names:
+                    continue
                 if skip_names and item.name in skip_names:
-                    console.print(f"    [yellow]跳過（衝突）: {item.name}[/yellow]")
+                    out.print(f"    [yellow]跳過（衝突）: {item.name}[/yellow]")
                     continue
                 dst_item = dst / item.name
-                policy = _load_clone_policy(item)
+                policy = _load_clone_policy(item, out=out)
                 if policy is not None:
                     _copy_skill_with_policy(
                         item,
@@ -1000,6 +1036,8 @@ def _copy_with_log(
                         policy,
                         force=force,
                         skip_conflicts=skip_conflicts,
+                        backup=backup,
+                        out=out,
                     )
                 else:
                     shutil.copytree(item, dst_item, dirs_exist_ok=True)
@@ -1018,8 +1056,10 @@ def _copy_with_log(
                     if item.name.lower() == "readme.md":
                         continue
                     name = item.stem
+                    if unchanged_names and name in unchanged_names:
+                        continue
                     if skip_names and name in skip_names:
-                        console.print(f"    [yellow]跳過（衝突）: {name}[/yellow]")
+                        out.print(f"    [yellow]跳過（衝突）: {name}[/yellow]")
                         continue
                     dst_item = dst / item.name
                     shutil.copy2(item, dst_item)
@@ -1030,7 +1070,7 @@ def _copy_with_log(
         if resource_type == "skills":
             for item in _iter_skill_source_dirs(src):
                 dst_item = dst / item.name
-                policy = _load_clone_policy(item)
+                policy = _load_clone_policy(item, out=out)
                 if policy is not None:
                     _copy_skill_with_policy(
                         item,
@@ -1038,6 +1078,8 @@ def _copy_with_log(
                         policy,
                         force=force,
                         skip_conflicts=skip_conflicts,
+                        backup=backup,
+                        out=out,
                     )
                 else:
                     shutil.copytree(item, dst_item, dirs_exist_ok=True)
@@ -1083,6 +1125,7 @@ def _v2_classify_and_resolve(
     force: bool,
     skip_conflicts: bool,
     backup: bool,
+    out: Console | None = None,
 ):
     """3-way 預分類，回傳：
 
@@ -1105,10 +1148,12 @@ def _v2_classify_and_resolve(
         clear_skip,
     )
 
+    out = out or console
+
     # 非互動環境（CI / piped stdin）若沒帶任何衝突旗標，預設改為 skip 並提示，
     # 避免 prompt 落到 EOFError 時靜默跳過所有 both-changed 檔案。
     if not (force or skip_conflicts or backup) and not sys.stdin.isatty():
-        console.print(
+        out.print(
             "[yellow]⚠ 偵測到非互動環境，both-changed 衝突將自動跳過（等同 --skip-conflicts）。"
             "如需覆蓋請改用 --force / --backup。[/yellow]"
         )
@@ -1270,8 +1315,11 @@ def _v2_classify_and_resolve(
     return decisions, preserved_dst, post_overwrite_record, source_heads
 
 
-def _v2_restore_preserved(preserved_dst: dict[Path, bytes]) -> None:
+def _v2_restore_preserved(
+    preserved_dst: dict[Path, bytes], out: Console | None = None
+) -> None:
     """post-copy 還原 local-only / skipped 檔案。"""
+    out = out or console
     if not preserved_dst:
         return
     for path, content in preserved_dst.items():
@@ -1279,9 +1327,9 @@ def _v2_restore_preserved(preserved_dst: dict[Path, bytes]) -> None:
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_bytes(content)
         except Exception as e:
-            console.print(f"[yellow]警告：還原 {path} 失敗 ({e})[/yellow]")
+            out.print(f"[yellow]警告：還原 {path} 失敗 ({e})[/yellow]")
     if preserved_dst:
-        console.print(f"[dim]已還原 {len(preserved_dst)} 個本地保留檔案[/dim]")
+        out.print(f"[dim]已還原 {len(preserved_dst)} 個本地保留檔案[/dim]")
 
 
 def _v2_apply_decisions(
@@ -1324,6 +1372,7 @@ def _v2_anchor_no_base_skips(
     no_base_conflicts,
     skip_names: set[str],
     source_heads: dict[str, str],
+    out: Console | None = None,
 ) -> None:
     """no-base 衝突使用者選擇跳過時，把目前現場狀態錨成 base。
 
@@ -1336,6 +1385,8 @@ def _v2_anchor_no_base_skips(
         record_file_decision,
     )
 
+    out = out or console
+
     skipped_keys = {
         (c.resource_type, c.name)
         for c in no_base_conflicts
@@ -1356,7 +1407,7 @@ def _v2_anchor_no_base_skips(
             or ""
         )
         if not src_commit:
-            console.print(
+            out.print(
                 f"[yellow]⚠ 無法錨定 {resource_type}/{name}"
                 f"{('/' + rel) if rel else ''}：取不到 src_commit"
                 f"（source={source}），下次仍可能重複偵測為 no-base 衝突。[/yellow]"
@@ -1389,12 +1440,229 @@ def _v2_anchor_no_base_skips(
             _anchor(resource_type, name, None, record.hash, record.source)
 
 
+def _v2_build_incremental_plan(
+    target: str,
+    old_manifest: dict | None,
+    version: str,
+) -> dict | None:
+    """建立增量分發計畫；無法安全增量時回傳 None（退回完整掃描）。
+
+    條件：舊 manifest 為 v2、由同版本 ai-dev 寫入，且有 last_sync 時間戳。
+    各 source 的變動集合於第一次查詢時才計算（見 `_v2_source_changes`）。
+    """
+    from .manifest import is_v2
+
+    if not is_v2(old_manifest) or old_manifest.get("version") != version:
+        return None
+    try:
+        last_sync_epoch = datetime.fromisoformat(old_manifest.get("last_sync", "")).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return {
+        "target": target,
+        "old_manifest": old_manifest,
+        "last_sync_epoch": last_sync_epoch,
+        "changes": {},   # source → (repo_root, changed_paths) | None
+        "heads": {},     # source → HEAD commit（用於推進 last_sync_commit）
+        "unchanged": set(),  # (resource_type, name)
+    }
+
+
+def _v2_source_changes(plan: dict, source: str) -> tuple[Path, set[str]] | None:
+    """回傳 source 自上次同步後變動的 repo 路徑（commit 區間 + 工作樹）。
+
+    上次 commit 不存在、已失效或 git 失敗時回傳 None，該 source 全數視為變動。
+    """
+    from .manifest import (
+        get_repo_head,
+        get_source_repo_path,
+        is_commit_valid,
+        list_changed_files,
+        list_dirty_files,
+    )
+
+    if source in plan["changes"]:
+        return plan["changes"][source]
+
+    result: tuple[Path, set[str]] | None = None
+    last = (plan["old_manifest"].get("last_sync_commit_by_source") or {}).get(source)
+    repo = get_source_repo_path(source)
+    head = get_repo_head(source) if repo else None
+    if repo and last and head and is_commit_valid(source, last):
+        dirty = list_dirty_files(source)
+        if dirty is not None:
+            changed = set(dirty)
+            if last != head:
+                changed.update(list_changed_files(source, last, head))
+            result = (repo.resolve(), changed)
+            plan["heads"][source] = head
+    plan["changes"][source] = result
+    return result
+
+
+def _v2_target_touched_since(path: Path, epoch: float) -> bool:
+    """target 資源自 epoch 後是否被改動（以 mtime / ctime 判斷，含目錄本身）。"""
+    def _touched(st: os.stat_result) -> bool:
+        return max(st.st_mtime, st.st_ctime) > epoch
+
+    try:
+        if _touched(path.lstat()):
+            return True
+        if not path.is_dir():
+            return False
+        for root, dirs, files in os.walk(path):
+            for entry in (*dirs, *files):
+                if _touched(os.lstat(os.path.join(root, entry))):
+                    return True
+    except OSError:
+        return True
+    return False
+
+
+def _v2_is_unchanged(
+    plan: dict,
+    resource_type: str,
+    name: str,
+    src_path: Path,
+    source: str,
+) -> bool:
+    """判斷資源自上次同步後來源與 target 皆未變動，可直接沿用舊 manifest 紀錄。"""
+    old_block = (
+        plan["old_manifest"].get("files", {}).get(resource_type, {}).get(name)
+    )
+    if not isinstance(old_block, dict) or old_block.get("source") != source:
+        return False
+
+    changes = _v2_source_changes(plan, source)
+    if changes is None:
+        return False
+    repo_root, changed = changes
+    try:
+        rel = src_path.resolve().relative_to(repo_root).as_posix()
+    except ValueError:
+        return False
+    prefix = rel + "/"
+    if any(p == rel or p.startswith(prefix) for p in changed):
+        return False
+
+    dst_path = _v2_get_dst_path(plan["target"], resource_type, name, None)
+    if dst_path is None or not dst_path.exists():
+        return False
+    return not _v2_target_touched_since(dst_path, plan["last_sync_epoch"])
+
+
+def _v2_wrap_record_methods(plan: dict, record_method_map: dict) -> dict:
+    """包裝 prescan 的 record 方法：未變動資源只記入 plan，不計算 hash。"""
+    def _wrap(resource_type: str, method):
+        def record(name, source_path, source="custom-skills", src_path=None):
+            if _v2_is_unchanged(plan, resource_type, name, src_path or source_path, source):
+                plan["unchanged"].add((resource_type, name))
+                return
+            method(name, source_path, source=source, src_path=src_path)
+        return record
+
+    return {rt: _wrap(rt, method) for rt, method in record_method_map.items()}
+
+
+# ============================================================
+# 多平台並行分發
+# ============================================================
+
+DISTRIBUTE_MAX_WORKERS = 5
+
+
+def _buffered_console(base: Console) -> tuple[Console, io.StringIO]:
+    """建立寫入記憶體緩衝、沿用 base 顯示設定的 Console。"""
+    buffer = io.StringIO()
+    return (
+        Console(
+            file=buffer,
+            force_terminal=base.is_terminal,
+            color_system=base.color_system,
+            width=base.width,
+        ),
+        buffer,
+    )
+
+
+def _target_lanes(
+    target_keys: tuple[str, ...], platform_configs: dict
+) -> list[list[str]]:
+    """把目的路徑重疊的平台分到同一條 lane（lane 內循序、lane 間並行）。"""
+    lanes: list[tuple[set[Path], list[str]]] = []
+    for target in target_keys:
+        dsts = {
+            Path(os.path.abspath(dst))
+            for _rt, _src, dst in platform_configs[target]["resources"]
+        }
+        merged = [
+            lane for lane in lanes
+            if any(a == b or a in b.parents or b in a.parents for a in dsts for b in lane[0])
+        ]
+        for lane in merged:
+            lanes.remove(lane)
+            dsts |= lane[0]
+        targets = [t for lane in merged for t in lane[1]] + [target]
+        lanes.append((dsts, targets))
+    order = {t: i for i, t in enumerate(target_keys)}
+    return sorted(
+        (sorted(targets, key=order.__getitem__) for _dsts, targets in lanes),
+        key=lambda lane: order[lane[0]],
+    )
+
+
+def _run_targets_concurrently(
+    target_keys: tuple[str, ...],
+    platform_configs: dict,
+    run_target,
+) -> list[bool]:
+    """以 thread pool 並行分發各平台，依平台順序輸出各自的日誌。
+
+    Args:
+        target_keys: 要分發的平台
+        platform_configs: 平台配置（用於判斷目的路徑是否重疊）
+        run_target: 單一平台的分發函式 `run_target(target, out)`，回傳是否完成；
+            日誌須寫入傳入的 `out`（每條 lane 一個緩衝 Console）
+
+    Returns:
+        list[bool]: 與 target_keys 同序的結果
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    lanes = _target_lanes(target_keys, platform_configs)
+    base = console
+
+    def _run_lane(lane: list[str]):
+        out, buffer = _buffered_console(base)
+        try:
+            results = {t: run_target(t, out) for t in lane}
+            return buffer.getvalue(), results, None
+        except BaseException as exc:  # 先交回已產生的輸出再拋出
+            return buffer.getvalue(), {}, exc
+
+    results: dict[str, bool] = {}
+    error: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=min(DISTRIBUTE_MAX_WORKERS, len(lanes))) as pool:
+        futures = [pool.submit(_run_lane, lane) for lane in lanes]
+        for future in futures:
+            output, lane_results, exc = future.result()
+            base.file.write(output)
+            base.file.flush()
+            results.update(lane_results)
+            if exc is not None and error is None:
+                error = exc
+    if error is not None:
+        raise error
+    return [results.get(t, False) for t in target_keys]
+
+
 def copy_custom_skills_to_targets(
     sync_project: bool = True,
     force: bool = False,
     skip_conflicts: bool = False,
     backup: bool = False,
     selected_targets: tuple[str, ...] | None = None,
+    incremental: bool = False,
 ) -> None:
     """Stage 3: 將 custom-skills 分發到各工具目錄。
 
@@ -1404,7 +1672,10 @@ def copy_custom_skills_to_targets(
         skip_conflicts: 跳過有衝突的檔案
         backup: 備份衝突檔案後覆蓋
         selected_targets: 限制要分發的目標平台
+        incremental: 只處理上次同步（manifest last_sync_commit_by_source）後
+            來源或 target 有變動的資源；無法判定時該 target 退回完整掃描
     """
+    from .hash_cache import save_hash_cache
     from .manifest import (
         ManifestTracker,
         read_manifest,
@@ -1433,6 +1704,7 @@ def copy_custom_skills_to_targets(
         get_repo_blob,
         compute_file_hash,
         prompt_file_decision,
+        close_git_session,
         SCHEMA_VERSION,
     )
 
@@ -1507,13 +1779,16 @@ def copy_custom_skills_to_targets(
 
     target_keys = selected_targets or tuple(platform_configs.keys())
 
-    # 對每個平台執行分發
-    for target in target_keys:
+    def _distribute_target(target: str, out: Console = console) -> bool:
+        """分發單一平台；使用者選擇取消時回傳 False。
+
+        所有日誌寫入 `out`，並行分發時由協調者傳入各平台自己的緩衝 Console。
+        """
         config = platform_configs[target]
         target_name = config["name"]
 
         # 1. 讀取舊 manifest
-        old_manifest = read_manifest(target)
+        old_manifest = read_manifest(target, out=out)
 
         # 2. 建立 tracker 並預先掃描要分發的檔案
         tracker = ManifestTracker(target=target)
@@ -1527,6 +1802,21 @@ def copy_custom_skills_to_targets(
             "workflows": tracker.record_workflow,
         }
 
+        # 2.1 增量模式：未變動的資源不進 tracker（不 hash、不分類、不複製）
+        incremental_plan = None
+        if incremental:
+            if old_manifest is not None and not is_v2(old_manifest):
+                old_manifest = maybe_migrate_manifest(target, out=out) or old_manifest
+            incremental_plan = _v2_build_incremental_plan(target, old_manifest, version)
+            if incremental_plan is None:
+                out.print(
+                    f"  [dim]{target_name}: 無可用的上次同步紀錄，改為完整掃描[/dim]"
+                )
+            else:
+                record_method_map = _v2_wrap_record_methods(
+                    incremental_plan, record_method_map
+                )
+
         for resource_type, src, dst in config["resources"]:
             if not src.exists():
                 continue
@@ -1554,10 +1844,26 @@ def copy_custom_skills_to_targets(
         if dist_config:
             _prescan_ecc(target, record_method_map, dist_config)
 
+        # 同名資源只要任一來源 / 類型有變動就整個走完整流程
+        unchanged_names: set[str] = set()
+        if incremental_plan is not None:
+            tracked_names = {
+                name
+                for resource_type in ("skills", "commands", "agents", "workflows")
+                for name in getattr(tracker, resource_type)
+            }
+            unchanged_names = {
+                name for _rt, name in incremental_plan["unchanged"]
+            } - tracked_names
+            out.print(
+                f"  [dim]{target_name}: 增量模式，{len(unchanged_names)} 個資源未變更，"
+                "略過分類與複製[/dim]"
+            )
+
         # 3. v2 file-level 3-way 分類（先 migrate manifest 再分類）
         if old_manifest is not None and not is_v2(old_manifest):
             # 觸發 migration 並重新讀
-            old_manifest = maybe_migrate_manifest(target) or old_manifest
+            old_manifest = maybe_migrate_manifest(target, out=out) or old_manifest
 
         v2_decisions, preserved_dst, post_overwrite_record, source_heads = (
             _v2_classify_and_resolve(
@@ -1567,6 +1873,7 @@ def copy_custom_skills_to_targets(
                 force=force,
                 skip_conflicts=skip_conflicts,
                 backup=backup,
+                out=out,
             )
         )
 
@@ -1585,15 +1892,15 @@ def copy_custom_skills_to_targets(
                 display_conflicts(no_base_conflicts)
                 action = prompt_conflict_action(no_base_conflicts)
             if action == "abort":
-                console.print("[yellow]已取消分發[/yellow]")
-                return
+                out.print("[yellow]已取消分發[/yellow]")
+                return False
             elif action == "skip":
                 skip_names = {c.name for c in no_base_conflicts}
-                console.print(f"[yellow]跳過 {len(skip_names)} 個 no-base 衝突檔案[/yellow]")
+                out.print(f"[yellow]跳過 {len(skip_names)} 個 no-base 衝突檔案[/yellow]")
             elif action == "backup":
-                console.print("[cyan]備份 no-base 衝突檔案...[/cyan]")
+                out.print("[cyan]備份 no-base 衝突檔案...[/cyan]")
                 for conflict in no_base_conflicts:
-                    backup_file(target, conflict.resource_type, conflict.name)
+                    backup_file(target, conflict.resource_type, conflict.name, out=out)
         elif no_base_conflicts:
             if force:
                 pass  # 直接覆蓋
@@ -1601,7 +1908,7 @@ def copy_custom_skills_to_targets(
                 skip_names = {c.name for c in no_base_conflicts}
             elif backup:
                 for conflict in no_base_conflicts:
-                    backup_file(target, conflict.resource_type, conflict.name)
+                    backup_file(target, conflict.resource_type, conflict.name, out=out)
 
         # 4. 重新建立 tracker（因為可能有跳過的檔案）
         # 保留 prescan 結果供步驟 7.5 anchor 使用，reset 後新 tracker 不含跳過的檔案
@@ -1624,6 +1931,9 @@ def copy_custom_skills_to_targets(
                 source="custom-skills",
                 force=force,
                 skip_conflicts=skip_conflicts,
+                unchanged_names=unchanged_names,
+                backup=backup,
+                out=out,
             )
 
         # 5.5 分發 custom repos 的資源
@@ -1634,6 +1944,9 @@ def copy_custom_skills_to_targets(
             skip_names,
             force=force,
             skip_conflicts=skip_conflicts,
+            unchanged_names=unchanged_names,
+            backup=backup,
+            out=out,
         )
 
         # 5.6 分發 ECC 選擇性資源
@@ -1646,10 +1959,17 @@ def copy_custom_skills_to_targets(
             skip_conflicts=skip_conflicts,
             dist_config=dist_config,
             old_manifest=old_manifest,
+            unchanged_names=unchanged_names,
+            out=out,
         )
 
         # 5.7 v2 post-copy: 還原 local-only / skipped 檔案
-        _v2_restore_preserved(preserved_dst)
+        _v2_restore_preserved(preserved_dst, out=out)
+
+        # 增量模式：未變動的來源也推進 last_sync_commit
+        if incremental_plan is not None:
+            for source, head in incremental_plan["heads"].items():
+                source_heads.setdefault(source, head)
 
         # 6. 產生新 manifest（v2，承接舊 manifest 的 FileEntry 與 skipped）
         new_manifest = tracker.to_manifest(
@@ -1675,6 +1995,16 @@ def copy_custom_skills_to_targets(
                             resource_type
                         ][name]
 
+        # 7.1 增量模式：未變動資源原樣沿用舊紀錄（也避免被當成孤兒清理）
+        if unchanged_names and old_manifest:
+            old_files = old_manifest.get("files", {})
+            for resource_type, name in incremental_plan["unchanged"]:
+                if name not in unchanged_names:
+                    continue
+                block = old_files.get(resource_type, {}).get(name)
+                if block is not None:
+                    new_manifest["files"].setdefault(resource_type, {})[name] = block
+
         # 7.5 no-base 跳過：把當下現場狀態錨成 base，覆蓋步驟 7 的舊 hash 保留，
         # 避免下次分發再被判為 no-base 而重複彈出同樣 prompt
         if skip_names and no_base_conflicts:
@@ -1685,15 +2015,32 @@ def copy_custom_skills_to_targets(
                 no_base_conflicts=no_base_conflicts,
                 skip_names=skip_names,
                 source_heads=source_heads,
+                out=out,
             )
 
         # 8. 清理孤兒檔案
         # 注意：跳過的衝突檔案不應被視為孤兒（因為已在步驟 7 中加回 manifest）
         orphans = find_orphans(old_manifest, new_manifest)
-        cleanup_orphans(target, orphans)
+        cleanup_orphans(target, orphans, out=out)
 
         # 9. 寫入新 manifest
         write_manifest(target, new_manifest)
+        return True
+
+    # 只有 --force / --skip-conflicts 保證全程不需輸入（--backup 仍可能走到
+    # no-base 以外的互動流程），此時各平台寫入互不重疊的目錄與 manifest，可並行分發
+    if (force or skip_conflicts) and len(target_keys) > 1:
+        completed = all(
+            _run_targets_concurrently(target_keys, platform_configs, _distribute_target)
+        )
+    else:
+        completed = all(_distribute_target(target) for target in target_keys)
+
+    # 寫回本輪累積的檔案 hash 快取，下次分發可略過未變動檔案
+    save_hash_cache()
+    close_git_session()
+    if not completed:
+        return
 
     # 專案目錄同步（不使用 manifest 追蹤）
     if sync_project:
@@ -1786,10 +2133,15 @@ def _distribute_custom_repos(
     skip_names: set[str],
     force: bool = False,
     skip_conflicts: bool = False,
+    unchanged_names: set[str] | None = None,
+    backup: bool = False,
+    out: Console | None = None,
 ) -> None:
     """分發 custom repos 的資源到指定平台。"""
     from .custom_repos import expand_local_path, load_custom_repos
 
+    out = out or console
+
     custom_repos = load_custom_repos().get("repos", {})
     if not custom_repos:
         return
@@ -1797,12 +2149,12 @@ def _distribute_custom_repos(
     for repo_name, repo_info in custom_repos.items():
         local_path = expand_local_path(repo_info)
         if not local_path.exists():
-            console.print(
+            out.print(
                 f"  [yellow]⚠ Custom repo 目錄不存在，跳過: {repo_name} ({local_path})[/yellow]"
             )
             continue
 
-        console.print(f"  [bold cyan]分發 custom repo: {repo_name}[/bold cyan]")
+        out.print(f"  [bold cyan]分發 custom repo: {repo_name}[/bold cyan]")
 
         # Skills（所有平台共用）
         skills_src = local_path / "skills"
@@ -1819,6 +2171,9 @@ def _distribute_custom_repos(
                     source=repo_name,
                     force=force,
                     skip_conflicts=skip_conflicts,
+                    unchanged_names=unchanged_names,
+                    backup=backup,
+                    out=out,
                 )
 
         # Commands（按平台子目錄）
@@ -1836,6 +2191,9 @@ def _distribute_custom_repos(
                     source=repo_name,
                     force=force,
                     skip_conflicts=skip_conflicts,
+                    unchanged_names=unchanged_names,
+                    backup=backup,
+                    out=out,
                 )
 
         # Agents（按平台子目錄）
@@ -1853,6 +2211,9 @@ def _distribute_custom_repos(
                     source=repo_name,
                     force=force,
                     skip_conflicts=skip_conflicts,
+                    unchanged_names=unchanged_names,
+                    backup=backup,
+                    out=out,
                 )
 
 
@@ -2066,14 +2427,17 @@ def _distribute_ecc_selective(
     skip_conflicts: bool = False,
     dist_config: dict | None = None,
     old_manifest: dict | None = None,
+    unchanged_names: set[str] | None = None,
+    out: Console | None = None,
 ) -> None:
     """根據 distribution.yaml 從 ECC 選擇性分發資源到指定平台。"""
+    out = out or console
     if dist_config is None:
         return
 
     source_base = Path(dist_config["source_path"])
     if not source_base.exists():
-        console.print(
+        out.print(
             "  [yellow]⚠ ECC 目錄不存在，跳過分發[/yellow]\n"
             f"  [yellow]  路徑: {source_base}[/yellow]\n"
             "  [yellow]  請先執行 ai-dev update 拉取 ECC[/yellow]"
@@ -2084,7 +2448,7 @@ def _distribute_ecc_selective(
     skip_dirs = set(dist_config.get("skip_directories", []))
     exclude = dist_config.get("exclude", {})
 
-    console.print(f"  [bold cyan]分發 ECC 資源 → {target_name}[/bold cyan]")
+    out.print(f"  [bold cyan]分發 ECC 資源 → {target_name}[/bold cyan]")
 
     # Skills (whitelist：僅分發 enabled 列出的 skill)
     skills_config = distribute.get("skills", {})
@@ -2094,8 +2458,8 @@ def _distribute_ecc_selective(
         if src.exists() and dst:
             enabled_skills = set(skills_config.get("enabled", []))
             enabled_skills.discard("auto-skill")
-            console.print(f"  [green]skills[/green] → [cyan]{target_name}[/cyan]")
-            console.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
+            out.print(f"  [green]skills[/green] → [cyan]{target_name}[/cyan]")
+            out.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
             dst.mkdir(parents=True, exist_ok=True)
 
             # 升級偵測：舊 manifest 中 ECC source 但已不在新 enabled → 將被孤兒清理
@@ -2108,7 +2472,7 @@ def _distribute_ecc_selective(
             if orphan_names:
                 preview = ", ".join(orphan_names[:5])
                 more = f"…（共 {len(orphan_names)} 個）" if len(orphan_names) > 5 else ""
-                console.print(
+                out.print(
                     f"    [yellow]⚠ 本次分發將移除 {len(orphan_names)} 個 ECC skill（不再列於 enabled）：[/yellow]\n"
                     f"    [yellow]    {preview}{more}[/yellow]\n"
                     "    [yellow]  如欲保留請於 ~/.config/ai-dev/ecc-profile.yaml 的 enabled_extra 加入名稱。[/yellow]"
@@ -2118,7 +2482,7 @@ def _distribute_ecc_selective(
             available_names = {p.name for p in src.iterdir() if p.is_dir() and not p.name.startswith(".")}
             missing = sorted(enabled_skills - available_names - skip_dirs)
             if missing:
-                console.print(
+                out.print(
                     f"    [yellow]⚠ enabled 中 {len(missing)} 個 skill 在 ECC 中找不到："
                     f"{', '.join(missing[:5])}{'…' if len(missing) > 5 else ''}[/yellow]\n"
                     "    [yellow]  建議執行 `ai-dev ecc audit` 檢查名稱是否變更或已移除[/yellow]"
@@ -2131,8 +2495,10 @@ def _distribute_ecc_selective(
                     and item.name not in skip_dirs
                     and item.name in enabled_skills
                 ):
+                    if unchanged_names and item.name in unchanged_names:
+                        continue
                     if skip_names and item.name in skip_names:
-                        console.print(f"    [yellow]跳過（衝突）: {item.name}[/yellow]")
+                        out.print(f"    [yellow]跳過（衝突）: {item.name}[/yellow]")
                         continue
                     dst_item = dst / item.name
                     shutil.copytree(item, dst_item, dirs_exist_ok=True)
@@ -2147,8 +2513,8 @@ def _distribute_ecc_selective(
         dst = COPY_TARGETS.get(target, {}).get("commands")
         if src.exists() and dst:
             exclude_cmds = set(exclude.get("commands", {}).get(target, []))
-            console.print(f"  [green]commands[/green] → [cyan]{target_name}[/cyan]")
-            console.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
+            out.print(f"  [green]commands[/green] → [cyan]{target_name}[/cyan]")
+            out.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
             dst.mkdir(parents=True, exist_ok=True)
             for item in src.iterdir():
                 if item.is_file() and item.suffix == ".md":
@@ -2157,8 +2523,10 @@ def _distribute_ecc_selective(
                     name = item.stem
                     if name in exclude_cmds:
                         continue
+                    if unchanged_names and name in unchanged_names:
+                        continue
                     if skip_names and name in skip_names:
-                        console.print(f"    [yellow]跳過（衝突）: {name}[/yellow]")
+                        out.print(f"    [yellow]跳過（衝突）: {name}[/yellow]")
                         continue
                     dst_item = dst / item.name
                     shutil.copy2(item, dst_item)
@@ -2172,8 +2540,8 @@ def _distribute_ecc_selective(
         dst = COPY_TARGETS.get(target, {}).get("agents")
         if src.exists() and dst:
             exclude_agents = set(exclude.get("agents", {}).get(target, []))
-            console.print(f"  [green]agents[/green] → [cyan]{target_name}[/cyan]")
-            console.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
+            out.print(f"  [green]agents[/green] → [cyan]{target_name}[/cyan]")
+            out.print(f"    [dim]{shorten_path(src)} → {shorten_path(dst)}[/dim]")
             dst.mkdir(parents=True, exist_ok=True)
             for item in src.iterdir():
                 if item.is_file() and item.suffix == ".md":
@@ -2182,8 +2550,10 @@ def _distribute_ecc_selective(
                     name = item.stem
                     if name in exclude_agents:
                         continue
+                    if unchanged_names and name in unchanged_names:
+                        continue
                     if skip_names and name in skip_names:
-                        console.print(f"    [yellow]跳過（衝突）: {name}[/yellow]")
+                        out.print(f"    [yellow]跳過（衝突）: {name}[/yellow]")
                         continue
                     dst_item = dst / item.name
                     shutil.copy2(item, dst_item)
@@ -2321,6 +2691,7 @@ def copy_skills(
     skip_conflicts: bool = False,
     backup: bool = False,
     selected_targets: tuple[str, ...] | None = None,
+    incremental: bool = False,
 ) -> None:
     """將 ~/.config/custom-skills 分發到各工具目錄。
 
@@ -2338,6 +2709,7 @@ def copy_skills(
         skip_conflicts: 跳過有衝突的檔案
         backup: 備份衝突檔案後覆蓋
         selected_targets: 限制要分發的目標平台
+        incremental: 只處理上次同步後有變動的資源
     """
     # Stage 3: 分發到目標目錄
     copy_custom_skills_to_targets(
@@ -2346,6 +2718,7 @@ def copy_skills(
         skip_conflicts=skip_conflicts,
         backup=backup,
         selected_targets=selected_targets,
+        incremental=incremental,
     )
 
 
@@ -2709,24 +3082,16 @@ def enable_resource(
     return True
 
 
-def copy_single_resource(
-    target: TargetType, resource_type: ResourceType, name: str
-) -> bool:
-    """從來源複製單一資源到目標目錄。
+def find_resource_source(resource_type: ResourceType, name: str) -> Path | None:
+    """尋找單一資源的來源路徑（依來源優先順序），找不到時回傳 None。
 
     Args:
-        target: 目標工具
         resource_type: 資源類型
         name: 資源名稱
 
     Returns:
-        bool: True 表示成功，False 表示失敗
+        Path | None: skills 為目錄，其餘為 .md 檔
     """
-    target_path = get_resource_file_path(target, resource_type, name)
-    if not target_path:
-        return False
-
-    # 根據資源類型尋找來源
     if resource_type == "skills":
         # Skills 來源：UDS, Obsidian, Anthropic, ECC（上游）, Custom
         sources = [
@@ -2737,33 +3102,17 @@ def copy_single_resource(
         ]
         if name == "skill-creator":
             sources.insert(0, get_anthropic_skills_dir() / "skills" / "skill-creator")
+        return next((src for src in sources if src.is_dir()), None)
 
-        for src in sources:
-            if src.exists() and src.is_dir():
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copytree(src, target_path, dirs_exist_ok=True)
-                return True
-
-    elif resource_type == "commands":
+    if resource_type == "commands":
         # Commands 來源：ECC（上游）, custom-skills/commands/claude
         sources = [
             get_ecc_dir() / "commands" / f"{name}.md",
             get_custom_skills_dir() / "commands" / "claude" / f"{name}.md",
         ]
-        for src in sources:
-            if src.exists():
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, target_path)
-                return True
-
     elif resource_type == "workflows":
         # Workflows 來源：custom-skills/commands/antigravity
-        src = get_custom_skills_dir() / "commands" / "antigravity" / f"{name}.md"
-        if src.exists():
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, target_path)
-            return True
-
+        sources = [get_custom_skills_dir() / "commands" / "antigravity" / f"{name}.md"]
     elif resource_type == "agents":
         # Agents 來源：ECC（上游）, Claude, OpenCode
         sources = [
@@ -2771,13 +3120,296 @@ def copy_single_resource(
             get_custom_skills_dir() / "agents" / "claude" / f"{name}.md",
             get_custom_skills_dir() / "agents" / "opencode" / f"{name}.md",
         ]
-        for src in sources:
-            if src.exists():
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, target_path)
-                return True
+    else:
+        return None
+    return next((src for src in sources if src.exists()), None)
 
-    return False
+
+def _copy_resource_from(src: Path, target_path: Path) -> None:
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    if src.is_dir():
+        shutil.copytree(src, target_path, dirs_exist_ok=True)
+    else:
+        shutil.copy2(src, target_path)
+
+
+def copy_single_resource(
+    target: TargetType, resource_type: ResourceType, name: str
+) -> bool:
+    """從來源複製單一資源到目標目錄。
+
+    Args:
+        target: 目標工具
+        resource_type: 資源類型
+        name: 資源名稱
+
+    Returns:
+        bool: True 表示成功，False 表示失敗
+    """
+    target_path = get_resource_file_path(target, resource_type, name)
+    if not target_path:
+        return False
+
+    src = find_resource_source(resource_type, name)
+    if src is None:
+        return False
+    _copy_resource_from(src, target_path)
+    return True
+
+
+# ============================================================
+# 批次啟用 / 停用（交易式）
+# ============================================================
+
+TOGGLE_BATCH_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ToggleChange:
+    """一筆資源開關變更：把 target/type/name 調整到 enabled 狀態。"""
+
+    target: str
+    resource_type: str
+    name: str
+    enabled: bool
+
+
+@dataclass
+class ToggleBatchResult:
+    """`apply_toggle_batch` 的結果。"""
+
+    applied: list[ToggleChange] = field(default_factory=list)
+    skipped: list[ToggleChange] = field(default_factory=list)
+    """已是目標狀態，無需變更"""
+
+    failed: list[tuple[ToggleChange, str]] = field(default_factory=list)
+    rolled_back: bool = False
+    """執行階段失敗時，已套用的搬移全部還原"""
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+@dataclass
+class _ToggleOp:
+    change: ToggleChange
+    src: Path
+    dst: Path
+    copy: bool = False
+    """True 表示 src 為上游來源，以複製取代搬移"""
+    journal: list[tuple[str, Path, Path | None]] = field(default_factory=list)
+
+
+def _toggle_disabled_path(change: ToggleChange) -> Path:
+    filename = (
+        change.name if change.resource_type == "skills" else f"{change.name}.md"
+    )
+    return get_disabled_path(change.target, change.resource_type, filename)
+
+
+def _move_path(src: Path, dst: Path) -> None:
+    """同一檔案系統內以 rename 搬移；跨裝置時退回複製後刪除。"""
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    if src.is_dir():
+        shutil.copytree(src, dst)
+        shutil.rmtree(src)
+    else:
+        shutil.copy2(src, dst)
+        src.unlink()
+
+
+def _plan_toggle_batch(
+    changes: list[ToggleChange], result: ToggleBatchResult
+) -> list[_ToggleOp]:
+    """計算每筆變更的搬移；已是目標狀態者記為 skipped，無法處理者記為 failed。"""
+    latest: dict[tuple[str, str, str], ToggleChange] = {}
+    for change in changes:
+        latest[(change.target, change.resource_type, change.name)] = change
+
+    ops: list[_ToggleOp] = []
+    for change in latest.values():
+        active = get_resource_file_path(change.target, change.resource_type, change.name)
+        if active is None:
+            result.failed.append(
+                (change, f"無法取得 {change.target}/{change.resource_type} 的路徑")
+            )
+            continue
+        disabled = _toggle_disabled_path(change)
+
+        if change.enabled:
+            if disabled.exists():
+                ops.append(_ToggleOp(change, disabled, active))
+            elif active.exists():
+                result.skipped.append(change)
+            else:
+                # disabled 中不存在，從來源重新複製；來源也沒有時只記這一筆失敗
+                source = find_resource_source(change.resource_type, change.name)
+                if source is None:
+                    result.failed.append((change, f"無法找到資源 {change.name} 的來源"))
+                else:
+                    ops.append(_ToggleOp(change, source, active, copy=True))
+        else:
+            if active.exists():
+                ops.append(_ToggleOp(change, active, disabled))
+            elif disabled.exists():
+                result.skipped.append(change)
+            else:
+                result.failed.append((change, f"資源 {change.name} 不存在，無法停用"))
+    return ops
+
+
+def _apply_toggle_op(op: _ToggleOp) -> None:
+    """執行一筆搬移並記錄 journal（供失敗時 rollback）。"""
+    op.dst.parent.mkdir(parents=True, exist_ok=True)
+    if op.dst.exists() or op.dst.is_symlink():
+        # 目的地已有舊檔：先移到旁邊，成功後才刪除，失敗時可還原
+        stash = op.dst.with_name(f".{op.dst.name}.toggle-{os.getpid()}")
+        _move_path(op.dst, stash)
+        op.journal.append(("stash", op.dst, stash))
+
+    if op.copy:
+        # 先記 journal：複製到一半失敗時 rollback 也會清掉殘留
+        op.journal.append(("create", op.dst, None))
+        _copy_resource_from(op.src, op.dst)
+    else:
+        _move_path(op.src, op.dst)
+        op.journal.append(("move", op.src, op.dst))
+
+
+def _rollback_toggle_op(op: _ToggleOp) -> None:
+    for action, first, second in reversed(op.journal):
+        try:
+            if action == "move":
+                _move_path(second, first)
+            elif action == "create":
+                if first.is_dir() and not first.is_symlink():
+                    shutil.rmtree(first)
+                elif first.exists() or first.is_symlink():
+                    first.unlink()
+            elif action == "stash":
+                _move_path(second, first)
+        except OSError as e:
+            console.print(f"[red]還原 {first} 失敗：{e}[/red]")
+    op.journal.clear()
+
+
+def _discard_toggle_stashes(op: _ToggleOp) -> None:
+    for action, _first, stash in op.journal:
+        if action != "stash" or stash is None:
+            continue
+        if stash.is_dir() and not stash.is_symlink():
+            shutil.rmtree(stash, ignore_errors=True)
+        else:
+            stash.unlink(missing_ok=True)
+
+
+def _record_toggle_changes(changes: list[ToggleChange]) -> None:
+    """以單次讀寫把已套用的變更寫入 toggle-config.yaml。"""
+    config = load_toggle_config()
+    for change in changes:
+        section = config.setdefault(change.target, {}).setdefault(
+            change.resource_type, {"enabled": True, "disabled": []}
+        )
+        disabled_list = section.get("disabled") or []
+        if change.enabled:
+            if change.name in disabled_list:
+                disabled_list.remove(change.name)
+        elif change.name not in disabled_list:
+            disabled_list.append(change.name)
+        section["disabled"] = disabled_list
+    save_toggle_config(config)
+
+
+def apply_toggle_batch(
+    changes: list[ToggleChange],
+    *,
+    quiet: bool = True,
+    max_workers: int | None = None,
+    on_progress=None,
+) -> ToggleBatchResult:
+    """批次啟用 / 停用資源：先規劃、再並行搬移，最後只寫一次 toggle 配置。
+
+    - 規劃階段找不到的資源（含啟用時 disabled 與上游來源都沒有）記為 failed，
+      不影響其他變更。
+    - 搬移以 rename 完成（同一檔案系統內為原子操作）；任何一筆在執行階段
+      失敗時，已完成的搬移全部還原，配置不寫入（result.rolled_back=True）。
+    - on_progress(done, total) 會在各 worker 執行緒中呼叫。
+
+    Args:
+        changes: 要套用的變更；同一資源重複出現時以最後一筆為準
+        quiet: False 時印出摘要並對受影響的 target 顯示一次重啟提醒
+        max_workers: 並行搬移的執行緒數
+        on_progress: 進度回呼
+
+    Returns:
+        ToggleBatchResult
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    result = ToggleBatchResult()
+    ops = _plan_toggle_batch(list(changes), result)
+
+    total = len(ops)
+    done = 0
+    progress_lock = threading.Lock()
+    errors: list[tuple[_ToggleOp, str]] = []
+
+    def _run(op: _ToggleOp) -> None:
+        nonlocal done
+        try:
+            _apply_toggle_op(op)
+        except Exception as e:  # noqa: BLE001 - 交由 rollback 處理
+            with progress_lock:
+                errors.append((op, str(e)))
+        with progress_lock:
+            done += 1
+            if on_progress is not None:
+                on_progress(done, total)
+
+    workers = max(1, min(max_workers or TOGGLE_BATCH_MAX_WORKERS, total or 1))
+    if workers == 1:
+        for op in ops:
+            _run(op)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_run, ops))
+
+    if errors:
+        for op in ops:
+            _rollback_toggle_op(op)
+        result.failed.extend((op.change, message) for op, message in errors)
+        result.rolled_back = True
+        if not quiet:
+            console.print(
+                f"[red]批次切換失敗，已還原 {total} 筆變更：{errors[0][1]}[/red]"
+            )
+        return result
+
+    for op in ops:
+        _discard_toggle_stashes(op)
+    result.applied = [op.change for op in ops]
+    if result.applied:
+        _record_toggle_changes(result.applied)
+
+    if not quiet:
+        for change in result.applied:
+            label = f"{change.target}/{change.resource_type}/{change.name}"
+            if change.enabled:
+                console.print(f"[green]已啟用 {label}[/green]")
+            else:
+                console.print(f"[yellow]已停用 {label}[/yellow]")
+        for change, message in result.failed:
+            console.print(f"[red]{message}[/red]")
+        for target in dict.fromkeys(change.target for change in result.applied):
+            show_restart_reminder(target)
+
+    return result
 
 
 # ============================================================
@@ -3062,6 +3694,220 @@ def list_disabled_resources(
     return sorted(names)
 
 
+# ============================================================
+# 資源清單索引（list / TUI 共用）
+# ============================================================
+
+RESOURCE_INVENTORY_VERSION = 1
+_INVENTORY_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+# 各 target 支援的資源類型（`ai-dev list` 與 TUI 的預設範圍）
+TARGET_RESOURCE_TYPES: dict[str, list[str]] = {
+    "claude": ["skills", "commands", "agents", "workflows"],
+    "antigravity": ["skills", "workflows"],
+    "opencode": ["skills", "commands", "agents"],
+    "codex": ["skills"],
+    "agy": ["skills"],
+}
+
+_SOURCE_SCANNERS = {
+    "skills": get_source_skills,
+    "commands": get_source_commands,
+    "workflows": get_source_workflows,
+    "agents": get_source_agents,
+}
+
+
+def get_resource_inventory_path() -> Path:
+    """回傳資源清單索引檔路徑。"""
+    return get_ai_dev_config_dir() / "cache" / "resource-inventory.json"
+
+
+def _source_scan_dirs(resource_type: str) -> list[Path]:
+    """`get_source_*` 會列舉的目錄；其 mtime 不變即代表名稱集合不變。"""
+    custom = get_custom_skills_dir()
+    if resource_type == "skills":
+        dirs = [
+            get_uds_dir() / "skills" / "claude-code",
+            get_obsidian_skills_dir() / "skills",
+            get_anthropic_skills_dir() / "skills",
+            get_ecc_dir() / "skills",
+            custom / "skills",
+        ]
+        dirs.extend(custom / "skills" / sub for sub in SKILL_SUBDIRS)
+        return dirs
+    if resource_type == "commands":
+        return [get_ecc_dir() / "commands", custom / "commands" / "claude"]
+    if resource_type == "workflows":
+        return [custom / "commands" / "antigravity"]
+    if resource_type == "agents":
+        return [
+            get_ecc_dir() / "agents",
+            custom / "agents" / "claude",
+            custom / "agents" / "opencode",
+        ]
+    return []
+
+
+def _dir_fingerprint(dirs: list[Path]) -> list[list]:
+    fingerprint = []
+    for path in dirs:
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        fingerprint.append([str(path), mtime_ns])
+    return fingerprint
+
+
+def _scan_target_resources(
+    target: TargetType, resource_type: ResourceType
+) -> dict[str, list[str]]:
+    enabled: list[str] = []
+    path = get_target_path(target, resource_type)
+    if path and path.exists():
+        for item in path.iterdir():
+            if resource_type == "skills":
+                # 過濾隱藏目錄（如 .system）
+                if item.is_dir() and not item.name.startswith("."):
+                    enabled.append(item.name)
+            elif item.is_file() and item.suffix == ".md":
+                enabled.append(item.stem)
+    return {
+        "enabled": sorted(enabled),
+        "disabled": list_disabled_resources(target, resource_type),
+    }
+
+
+class ResourceInventory:
+    """資源名稱 → 來源、target → (啟用, 停用) 的持久化索引。
+
+    每個元件（某類型的來源集合、某 target/type 的目錄內容）記錄其掃描目錄
+    的 mtime；新增、刪除或改名都會改變所在目錄的 mtime，不符時只重掃該元件。
+    mtime 落在建立時間前 2 秒內的元件視為 racy，下次一律重掃。
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or get_resource_inventory_path()
+        self._components: dict[str, dict] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict]:
+        if self._components is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = None
+            if (
+                isinstance(data, dict)
+                and data.get("version") == RESOURCE_INVENTORY_VERSION
+                and isinstance(data.get("components"), dict)
+            ):
+                self._components = data["components"]
+            else:
+                self._components = {}
+        return self._components
+
+    def _component(self, key: str, dirs: list[Path], build):
+        with self._lock:
+            components = self._load()
+            fingerprint = _dir_fingerprint(dirs)
+            entry = components.get(key)
+            if (
+                isinstance(entry, dict)
+                and entry.get("dirs") == fingerprint
+                and all(
+                    mtime is None or mtime < entry.get("built_at_ns", 0) - _INVENTORY_RACY_WINDOW_NS
+                    for _path, mtime in fingerprint
+                )
+            ):
+                return entry["data"]
+
+            data = build()
+            components[key] = {
+                "dirs": fingerprint,
+                "built_at_ns": time.time_ns(),
+                "data": data,
+            }
+            self._dirty = True
+            return data
+
+    def sources(self, resource_type: str) -> dict[str, str]:
+        """回傳資源名稱 → 來源 key；同名時以 `get_source_*` 的順序優先。"""
+
+        def _build() -> dict[str, str]:
+            mapping: dict[str, str] = {}
+            for source_key, names in _SOURCE_SCANNERS[resource_type]().items():
+                for name in sorted(names):
+                    mapping.setdefault(name, source_key)
+            return mapping
+
+        if resource_type not in _SOURCE_SCANNERS:
+            return {}
+        return self._component(
+            f"sources:{resource_type}", _source_scan_dirs(resource_type), _build
+        )
+
+    def source_of(self, resource_type: str, name: str) -> str:
+        """回傳資源來源的顯示名稱（等同 `identify_source`，但為 O(1) 查詢）。"""
+        source_key = self.sources(resource_type).get(name, "user")
+        return SOURCE_NAMES.get(source_key, source_key)
+
+    def target_resources(
+        self, target: TargetType, resource_type: ResourceType
+    ) -> tuple[list[str], list[str]]:
+        """回傳 (啟用中, 已停用) 的資源名稱，皆已排序。"""
+        dirs = [get_disabled_base_dir() / target / resource_type]
+        path = get_target_path(target, resource_type)
+        if path:
+            dirs.insert(0, path)
+        data = self._component(
+            f"target:{target}:{resource_type}",
+            dirs,
+            lambda: _scan_target_resources(target, resource_type),
+        )
+        return list(data["enabled"]), list(data["disabled"])
+
+    def invalidate(self) -> None:
+        """丟棄所有元件（下次查詢時重掃）。"""
+        with self._lock:
+            self._components = {}
+            self._dirty = True
+
+    def save(self) -> None:
+        """以 temp file + rename 原子寫回；無變動時不寫。"""
+        if not self._dirty:
+            return
+        with self._lock:
+            payload = {
+                "version": RESOURCE_INVENTORY_VERSION,
+                "components": self._components or {},
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError:
+                # 索引寫入失敗不影響列表結果，下次再重建
+                pass
+
+
+_resource_inventory: ResourceInventory | None = None
+
+
+def get_resource_inventory() -> ResourceInventory:
+    """取得行程內共用的資源清單索引（TUI 多次刷新時重用已載入的內容）。"""
+    global _resource_inventory
+    if _resource_inventory is None:
+        _resource_inventory = ResourceInventory()
+    return _resource_inventory
+
+
 def list_installed_resources(
     target: TargetType | None = None, resource_type: ResourceType | None = None
 ) -> dict[str, list[dict[str, str]]]:
@@ -3076,108 +3922,40 @@ def list_installed_resources(
         ...
     }
     """
-    skill_sources = get_source_skills()
-    command_sources = get_source_commands()
-    workflow_sources = get_source_workflows()
-    agent_sources = get_source_agents()
-
+    inventory = get_resource_inventory()
     result = {}
 
-    targets = (
-        [target] if target else ["claude", "antigravity", "opencode", "codex", "agy"]
-    )
-    type_mapping = {
-        "claude": ["skills", "commands", "agents", "workflows"],
-        "antigravity": ["skills", "workflows"],
-        "opencode": ["skills", "commands", "agents"],
-        "codex": ["skills"],
-        "agy": ["skills"],
-    }
+    targets = [target] if target else list(TARGET_RESOURCE_TYPES)
 
     for t in targets:
         result[t] = {}
-        types = [resource_type] if resource_type else type_mapping.get(t, [])
+        types = [resource_type] if resource_type else TARGET_RESOURCE_TYPES.get(t, [])
 
         for rt in types:
-            items = []
-            seen_names = set()
-
-            # 1. 先列出啟用中的資源（目標目錄）
-            path = get_target_path(t, rt)
-            if path and path.exists():
-                # Skills 是目錄結構
-                if rt == "skills":
-                    for item in path.iterdir():
-                        # 過濾隱藏目錄（如 .system）
-                        if item.is_dir() and not item.name.startswith("."):
-                            source = identify_source(item.name, skill_sources)
-                            items.append(
-                                {
-                                    "name": item.name,
-                                    "source": source,
-                                    "disabled": False,
-                                }
-                            )
-                            seen_names.add(item.name)
-                # Commands, Workflows, Agents 是 .md 檔案
-                else:
-                    sources_map = {
-                        "commands": command_sources,
-                        "workflows": workflow_sources,
-                        "agents": agent_sources,
-                    }
-                    sources = sources_map.get(rt, {})
-
-                    for item in path.iterdir():
-                        if item.is_file() and item.suffix == ".md":
-                            name = item.stem
-                            source = identify_source(name, sources)
-                            items.append(
-                                {
-                                    "name": name,
-                                    "source": source,
-                                    "disabled": False,
-                                }
-                            )
-                            seen_names.add(name)
-
-            # 2. 再列出被停用的資源（disabled 目錄）
-            disabled_names = list_disabled_resources(t, rt)
-            for name in disabled_names:
-                if name not in seen_names:
-                    if rt == "skills":
-                        source = identify_source(name, skill_sources)
-                    else:
-                        sources_map = {
-                            "commands": command_sources,
-                            "workflows": workflow_sources,
-                            "agents": agent_sources,
-                        }
-                        sources = sources_map.get(rt, {})
-                        source = identify_source(name, sources)
-
-                    items.append(
-                        {
-                            "name": name,
-                            "source": source,
-                            "disabled": True,
-                        }
-                    )
-
-            # 排序：先依啟用狀態（啟用在前），再依名稱
-            items.sort(key=lambda x: (x["disabled"], x["name"]))
+            enabled, disabled = inventory.target_resources(t, rt)
+            enabled_set = set(enabled)
+            # 啟用在前、停用在後，各自依名稱排序
+            items = [
+                {"name": name, "source": inventory.source_of(rt, name), "disabled": False}
+                for name in enabled
+            ]
+            items.extend(
+                {"name": name, "source": inventory.source_of(rt, name), "disabled": True}
+                for name in disabled
+                if name not in enabled_set
+            )
             result[t][rt] = items
 
+    inventory.save()
     return result
 
 
 def get_all_skill_names() -> list[str]:
     """取得所有已安裝的 skill 名稱（用於重複名稱警告）。"""
-    sources = get_source_skills()
-    all_names = set()
-    for names in sources.values():
-        all_names.update(names)
-    return sorted(all_names)
+    inventory = get_resource_inventory()
+    names = sorted(inventory.sources("skills"))
+    inventory.save()
+    return names
 
 
 def show_skills_npm_hint() -> None:
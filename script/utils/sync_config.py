@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import filecmp
 import fnmatch
+import hashlib
 import json
+import os
 import re
 import shutil
 import socket
 import subprocess
 import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable
@@ -15,7 +18,7 @@ from typing import Any, Callable
 import yaml
 from rich.console import Console
 
-from .paths import get_sync_config_path, get_sync_repo_dir
+from .paths import get_ai_dev_config_dir, get_sync_config_path, get_sync_repo_dir
 from .system import check_command_exists, get_os, run_command
 
 console = Console()
@@ -423,12 +426,90 @@ def _is_excluded(rel_path: str, excludes: list[str]) -> bool:
     return any(_matches_pattern(rel_path, pattern) for pattern in excludes)
 
 
+class _ExcludeMatcher:
+    """預先編譯的 exclude 比對器，語意與 `_is_excluded` 相同。
+
+    - `dir/` 形式的規則轉為前綴集合，走訪時整個目錄直接剪枝。
+    - 其餘 glob 規則合併為單一 regex，一次比對完整路徑與檔名。
+    - 以 `*` 結尾的 glob 若能匹配 `dir/`，代表該目錄下所有路徑都會被排除
+      （`*` 可跨 `/`），同樣可剪枝。
+    """
+
+    def __init__(self, excludes: list[str]) -> None:
+        self._dir_prefixes: set[str] = set()
+        globs: list[str] = []
+        for pattern in excludes:
+            normalized = _normalize_pattern(pattern).lstrip("/")
+            if not normalized:
+                continue
+            if normalized.endswith("/"):
+                self._dir_prefixes.add(normalized.rstrip("/"))
+            else:
+                globs.append(os.path.normcase(normalized))
+
+        self._glob = self._compile(globs)
+        self._prune_glob = self._compile([g for g in globs if g.endswith("*")])
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> re.Pattern[str] | None:
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+    def _under_dir_prefix(self, rel_path: str) -> bool:
+        if not self._dir_prefixes:
+            return False
+        parts = rel_path.split("/")
+        return any(
+            "/".join(parts[:i]) in self._dir_prefixes for i in range(1, len(parts) + 1)
+        )
+
+    def excludes_file(self, rel_path: str) -> bool:
+        rel_path = rel_path.strip("/")
+        if self._under_dir_prefix(rel_path):
+            return True
+        if self._glob is None:
+            return False
+        normalized = os.path.normcase(rel_path)
+        return bool(
+            self._glob.match(normalized)
+            or self._glob.match(os.path.normcase(rel_path.rsplit("/", 1)[-1]))
+        )
+
+    def prunes_dir(self, rel_dir: str) -> bool:
+        """目錄下所有路徑都必定被排除時回傳 True（走訪時不必進入）。"""
+        if rel_dir in self._dir_prefixes:
+            return True
+        return bool(
+            self._prune_glob is not None
+            and self._prune_glob.match(os.path.normcase(f"{rel_dir}/"))
+        )
+
+
 def _parse_rsync_stat(output: str, field: str) -> int:
-    pattern = rf"{re.escape(field)}:\s*([0-9]+)"
+    # rsync 3.1+ 以千分位逗號輸出數字（如 "Number of files: 1,234"）
+    pattern = rf"{re.escape(field)}:\s*([0-9][0-9,]*)"
     match = re.search(pattern, output)
     if not match:
         return 0
-    return int(match.group(1))
+    return int(match.group(1).replace(",", ""))
+
+
+def _parse_rsync_itemized(output: str) -> dict[str, int]:
+    """從 `--itemize-changes` 輸出計算新增 / 更新 / 刪除的一般檔案數。
+
+    `>f+++++++++ path` 為新檔、其他 `>f` 為更新；`*deleting path`
+    中不以 `/` 結尾者為刪除的檔案。
+    """
+    counts = {"added": 0, "updated": 0, "deleted": 0}
+    for line in output.splitlines():
+        if line.startswith(">f"):
+            flags = line.split(" ", 1)[0]
+            counts["added" if flags[2:].startswith("+++") else "updated"] += 1
+        elif line.startswith("*deleting"):
+            if not line.rstrip().endswith("/"):
+                counts["deleted"] += 1
+    return counts
 
 
 def _sync_directory_rsync(
@@ -444,6 +525,7 @@ def _sync_directory_rsync(
         command = [
             "rsync",
             "-av",
+            "--itemize-changes",
             "--stats",
             "--exclude-from",
             exclude_file,
@@ -459,9 +541,7 @@ def _sync_directory_rsync(
 
         output = result.stdout
         return {
-            "added": 0,
-            "updated": _parse_rsync_stat(output, "Number of regular files transferred"),
-            "deleted": _parse_rsync_stat(output, "Number of deleted files"),
+            **_parse_rsync_itemized(output),
             "files": _parse_rsync_stat(output, "Number of files"),
             "method": "rsync",
         }
@@ -477,17 +557,37 @@ def _files_equal(left: Path, right: Path) -> bool:
 
 
 def _collect_files(root: Path, excludes: list[str]) -> dict[str, Path]:
+    """收集 root 下未被排除的檔案（rel posix path → Path）。
+
+    以 `os.scandir` 走訪並在目錄層級剪枝被排除的子樹；與 `rglob` 相同，
+    不進入 symlink 目錄，symlink 檔案依其目標判斷是否為檔案。
+    """
     files: dict[str, Path] = {}
     if not root.exists():
         return files
 
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        rel = path.relative_to(root).as_posix()
-        if _is_excluded(rel, excludes):
+    matcher = _ExcludeMatcher(excludes)
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            entries = list(os.scandir(dir_path))
+        except OSError:
             continue
-        files[rel] = path
+        for entry in entries:
+            rel = f"{rel_dir}{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not matcher.prunes_dir(rel):
+                        stack.append((entry.path, f"{rel}/"))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if matcher.excludes_file(rel):
+                continue
+            files[rel] = Path(entry.path)
     return files
 
 
@@ -543,6 +643,135 @@ def _sync_directory_shutil(
     }
 
 
+# ============================================================
+# 並行同步引擎（無 rsync 時使用）
+# ============================================================
+
+SYNC_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+PARALLEL_SYNC_MIN_FILES = 16
+_COMPARE_CHUNK_SIZE = 1024 * 1024
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def _contents_equal(left: Path, right: Path, size: int) -> bool:
+    """大小相同的兩個檔案逐塊比對內容（等同 filecmp.cmp(shallow=False)）。"""
+    if size == 0:
+        return True
+    try:
+        with open(left, "rb") as lf, open(right, "rb") as rf:
+            while True:
+                lchunk = lf.read(_COMPARE_CHUNK_SIZE)
+                if lchunk != rf.read(_COMPARE_CHUNK_SIZE):
+                    return False
+                if not lchunk:
+                    return True
+    except OSError:
+        return False
+
+
+def _offload_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """嘗試 reflink（FICLONE）或 `os.copy_file_range` 由 kernel 完成複製。"""
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        pass
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+    copied = 0
+    try:
+        while copied < size:
+            n = copy_file_range(src_fd, dst_fd, size - copied)
+            if n == 0:
+                break
+            copied += n
+    except OSError:
+        return False
+    return copied == size
+
+
+def _fast_copy2(src: Path, dst: Path) -> None:
+    """等同 shutil.copy2；檔案系統支援時改走 reflink / copy_file_range。"""
+    try:
+        size = src.stat().st_size
+        src_fd = os.open(src, os.O_RDONLY)
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            offloaded = _offload_copy(src_fd, dst_fd, size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    if offloaded:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def _sync_one_file(src_file: Path, dst_file: Path) -> str | None:
+    """同步單一檔案，回傳 "added" / "updated"，內容相同時回傳 None。"""
+    try:
+        dst_st = dst_file.stat()
+    except FileNotFoundError:
+        dst_file.parent.mkdir(parents=True, exist_ok=True)
+        _fast_copy2(src_file, dst_file)
+        return "added"
+
+    src_size = src_file.stat().st_size
+    if src_size == dst_st.st_size and _contents_equal(src_file, dst_file, src_size):
+        return None
+    _fast_copy2(src_file, dst_file)
+    return "updated"
+
+
+def _sync_directory_parallel(
+    src: Path,
+    dst: Path,
+    excludes: list[str],
+    delete: bool = True,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """以 thread pool 並行比對與複製；統計結果與 `_sync_directory_shutil` 相同。"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    src_files = _collect_files(src, excludes)
+    dst_files = _collect_files(dst, excludes) if delete else {}
+
+    workers = max_workers or SYNC_MAX_WORKERS
+    jobs = [(src_file, dst / rel) for rel, src_file in src_files.items()]
+    if workers <= 1 or len(jobs) < PARALLEL_SYNC_MIN_FILES:
+        outcomes = [_sync_one_file(s, d) for s, d in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(lambda job: _sync_one_file(*job), jobs))
+
+    deleted = 0
+    if delete:
+        for rel, dst_file in dst_files.items():
+            if rel in src_files:
+                continue
+            dst_file.unlink(missing_ok=True)
+            deleted += 1
+        _cleanup_empty_dirs(dst)
+
+    return {
+        "added": outcomes.count("added"),
+        "updated": outcomes.count("updated"),
+        "deleted": deleted,
+        "files": len(src_files),
+        "method": "parallel",
+    }
+
+
 def sync_directory(
     src: Path | str,
     dst: Path | str,
@@ -560,7 +789,7 @@ def sync_directory(
     if get_os() != "windows" and check_command_exists("rsync"):
         return _sync_directory_rsync(src_path, dst_path, excludes, delete=delete)
 
-    return _sync_directory_shutil(src_path, dst_path, excludes, delete=delete)
+    return _sync_directory_parallel(src_path, dst_path, excludes, delete=delete)
 
 
 def _git_has_remote(repo_dir: Path, remote_name: str) -> bool:
@@ -809,24 +1038,178 @@ def now_iso8601() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def count_directory_changes(
-    source_dir: Path | str,
-    target_dir: Path | str,
-    excludes: list[str],
-) -> int:
-    source_files = _collect_files(Path(source_dir).expanduser(), excludes)
-    target_files = _collect_files(Path(target_dir).expanduser(), excludes)
+# ============================================================
+# 同步快照：上次同步後兩端每個檔案的 (size, mtime_ns, content hash)
+# ============================================================
+#
+# 變更偵測只讀取 stat 與快照不符的檔案；兩端 stat 都與快照相符時，
+# 直接比較快照中的 hash。快照寫入時間前 2 秒內的 mtime 不信任（racy 保護）。
+
+SYNC_SNAPSHOT_VERSION = 1
+_SNAPSHOT_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+
+def get_sync_snapshot_dir() -> Path:
+    return get_ai_dev_config_dir() / "cache" / "sync-snapshots"
+
+
+def _snapshot_path(source_dir: Path, target_dir: Path) -> Path:
+    key = f"{source_dir}\0{target_dir}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return get_sync_snapshot_dir() / f"{source_dir.name or 'root'}-{digest}.json"
+
+
+def _hash_file(path: Path) -> str | None:
+    sha256 = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(chunk)
+    except OSError:
+        return None
+    return sha256.hexdigest()
+
+
+def _load_sync_snapshot(source_dir: Path, target_dir: Path) -> dict[str, Any] | None:
+    try:
+        with open(_snapshot_path(source_dir, target_dir), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != SYNC_SNAPSHOT_VERSION:
+        return None
+    return data
+
+
+def _snapshot_hash(
+    snapshot: dict[str, Any] | None, side: str, rel: str, st: os.stat_result
+) -> str | None:
+    """stat 與快照相符（且不在 racy 視窗內）時回傳快照中的 hash。"""
+    if snapshot is None:
+        return None
+    entry = snapshot.get(side, {}).get(rel)
+    if not isinstance(entry, list) or len(entry) != 3:
+        return None
+    size, mtime_ns, digest = entry
+    if size != st.st_size or mtime_ns != st.st_mtime_ns:
+        return None
+    if mtime_ns >= int(snapshot.get("written_at_ns", 0)) - _SNAPSHOT_RACY_WINDOW_NS:
+        return None
+    return digest
+
+
+def _files_equal_with_snapshot(
+    rel: str,
+    source_file: Path,
+    target_file: Path,
+    snapshot: dict[str, Any] | None,
+) -> bool:
+    """比較兩端檔案內容；只讀取 stat 與快照不符的一端。"""
+    try:
+        source_st = source_file.stat()
+        target_st = target_file.stat()
+    except OSError:
+        return False
+    if source_st.st_size != target_st.st_size:
+        return False
+
+    source_hash = _snapshot_hash(snapshot, "source", rel, source_st)
+    target_hash = _snapshot_hash(snapshot, "target", rel, target_st)
+    if source_hash is None and target_hash is None:
+        return _files_equal(source_file, target_file)
+    if source_hash is None:
+        source_hash = _hash_file(source_file)
+    if target_hash is None:
+        target_hash = _hash_file(target_file)
+    return source_hash is not None and source_hash == target_hash
+
+
+def _diff_directories(
+    source_dir: Path, target_dir: Path, excludes: list[str]
+) -> tuple[list[str], list[str], list[str]]:
+    """回傳 (added, modified, deleted)：以 source 為基準與 target 比較。"""
+    source_files = _collect_files(source_dir, excludes)
+    target_files = _collect_files(target_dir, excludes)
+    snapshot = _load_sync_snapshot(source_dir, target_dir)
 
     source_set = set(source_files.keys())
     target_set = set(target_files.keys())
 
-    added_or_removed = len(source_set.symmetric_difference(target_set))
-    modified = 0
-    for rel in source_set.intersection(target_set):
-        if not _files_equal(source_files[rel], target_files[rel]):
-            modified += 1
+    added = sorted(source_set - target_set)
+    deleted = sorted(target_set - source_set)
+    modified = sorted(
+        rel
+        for rel in source_set.intersection(target_set)
+        if not _files_equal_with_snapshot(
+            rel, source_files[rel], target_files[rel], snapshot
+        )
+    )
+    return added, modified, deleted
+
+
+def write_sync_snapshot(
+    source_dir: Path | str, target_dir: Path | str, excludes: list[str]
+) -> None:
+    """同步完成後寫入兩端快照；stat 未變的檔案沿用舊快照的 hash 不重讀。"""
+    source_dir = Path(source_dir).expanduser()
+    target_dir = Path(target_dir).expanduser()
+    previous = _load_sync_snapshot(source_dir, target_dir)
+    written_at_ns = time.time_ns()
+
+    payload: dict[str, Any] = {
+        "version": SYNC_SNAPSHOT_VERSION,
+        "source_dir": str(source_dir),
+        "target_dir": str(target_dir),
+        "written_at_ns": written_at_ns,
+    }
+    for side, root in (("source", source_dir), ("target", target_dir)):
+        entries: dict[str, list] = {}
+        for rel, path in _collect_files(root, excludes).items():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            digest = _snapshot_hash(previous, side, rel, st) or _hash_file(path)
+            if digest is not None:
+                entries[rel] = [st.st_size, st.st_mtime_ns, digest]
+        payload[side] = entries
 
-    return added_or_removed + modified
+    path = _snapshot_path(source_dir, target_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        # 快照只是加速用，寫入失敗時下次退回逐檔比對
+        pass
+
+
+def write_sync_snapshots(config: dict[str, Any]) -> None:
+    """為 sync.yaml 中每個目錄寫入本機 ↔ sync repo 的快照。"""
+    repo_dir = get_sync_repo_dir()
+    for item in config.get("directories", []):
+        local_path = Path(str(item.get("path", ""))).expanduser()
+        repo_subdir = str(item.get("repo_subdir", "")).strip()
+        repo_path = repo_dir / repo_subdir if repo_subdir else repo_dir
+        if not local_path.exists() or not repo_path.exists():
+            continue
+        excludes = get_ignore_patterns(
+            str(item.get("ignore_profile", "custom")), item.get("custom_ignore", [])
+        )
+        write_sync_snapshot(local_path, repo_path, excludes)
+
+
+def count_directory_changes(
+    source_dir: Path | str,
+    target_dir: Path | str,
+    excludes: list[str],
+) -> int:
+    added, modified, deleted = _diff_directories(
+        Path(source_dir).expanduser(), Path(target_dir).expanduser(), excludes
+    )
+    return len(added) + len(modified) + len(deleted)
 
 
 def _prefixed_change_path(repo_subdir: str, rel_path: str) -> str:
@@ -855,19 +1238,7 @@ def detect_local_changes(config: dict[str, Any]) -> dict[str, Any]:
             str(item.get("ignore_profile", "custom")), item.get("custom_ignore", [])
         )
 
-        local_files = _collect_files(local_path, excludes)
-        repo_files = _collect_files(repo_path, excludes)
-
-        local_set = set(local_files.keys())
-        repo_set = set(repo_files.keys())
-
-        added = sorted(local_set - repo_set)
-        deleted = sorted(repo_set - local_set)
-        modified = sorted(
-            rel
-            for rel in local_set.intersection(repo_set)
-            if not _files_equal(local_files[rel], repo_files[rel])
-        )
+        added, modified, deleted = _diff_directories(local_path, repo_path, excludes)
 
         total = len(added) + len(modified) + len(deleted)
         if total == 0:
@@ -0,0 +1,123 @@
+# tests/test_session_index.py
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from wl_parser import session_index
+from wl_parser.session_index import SessionIndex, is_candidate_line
+from wl_parser.work_log_parser import parse_jsonl_file
+
+BASE = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _line(i: int, rec_type: str = "user") -> str:
+    ts = (BASE + timedelta(hours=i)).isoformat().replace("+00:00", "Z")
+    record = {"type": rec_type, "sessionId": "s", "uuid": f"u{i}", "timestamp": ts, "message": {"content": "x" * 40}}
+    return json.dumps(record) + "\n"
+
+
+def _write_session(path: Path, hours: range) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in hours:
+            f.write(_line(i, "user" if i % 2 else "assistant"))
+            f.write(json.dumps({"type": "progress", "timestamp": "2026-03-01T00:00:00Z"}) + "\n")
+
+
+@pytest.fixture(autouse=True)
+def small_segments(monkeypatch):
+    monkeypatch.setattr(session_index, "SEGMENT_BYTES", 512)
+
+
+def _window(first_hour: int, last_hour: int) -> tuple:
+    return BASE + timedelta(hours=first_hour), BASE + timedelta(hours=last_hour)
+
+
+def test_is_candidate_line_prefilters_without_decoding():
+    assert is_candidate_line(_line(1).encode())
+    assert is_candidate_line(b'{"type": "assistant", "timestamp": "t"}')
+    assert not is_candidate_line(b'{"type":"progress","timestamp":"t"}')
+    assert not is_candidate_line(b'{"type":"user"}')
+
+
+def test_indexed_parse_matches_full_parse(tmp_path):
+    path = tmp_path / "s.jsonl"
+    _write_session(path, range(0, 24 * 10))
+    index = SessionIndex()
+
+    for window in [(0, 5), (30, 54), (100, 100), (200, 400)]:
+        start, end = _window(*window)
+        expected = parse_jsonl_file(path, start, end)
+        assert parse_jsonl_file(path, start, end, index=index) == expected
+
+    entry = index._entries[str(path)]
+    assert len(entry["segments"]) > 10
+    start, end = _window(30, 31)
+    read = sum(hi - lo for lo, hi in index.ranges(path, start.timestamp(), end.timestamp()))
+    assert read < path.stat().st_size / 10
+
+
+def test_file_outside_window_is_skipped(tmp_path):
+    path = tmp_path / "s.jsonl"
+    _write_session(path, range(0, 10))
+    start, end = _window(100, 124)
+
+    assert SessionIndex().ranges(path, start.timestamp(), end.timestamp()) == []
+
+
+def test_appended_tail_is_indexed_incrementally(tmp_path, monkeypatch):
+    path = tmp_path / "s.jsonl"
+    _write_session(path, range(0, 50))
+    index = SessionIndex()
+    start, end = _window(60, 80)
+    assert parse_jsonl_file(path, start, end, index=index) == []
+    indexed_before = index._entries[str(path)]["indexed"]
+
+    scanned_from: list[int] = []
+    real_index_tail = SessionIndex._index_tail
+
+    def _spy(f, entry):
+        scanned_from.append(entry["indexed"])
+        real_index_tail(f, entry)
+
+    monkeypatch.setattr(SessionIndex, "_index_tail", staticmethod(_spy))
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(60, 70):
+            f.write(_line(i))
+        f.write(_line(70).rstrip("\n"))  # last line still being written
+
+    records = parse_jsonl_file(path, start, end, index=index)
+
+    assert scanned_from == [indexed_before]
+    assert [r["uuid"] for r in records] == [f"u{i}" for i in range(60, 71)]
+
+
+def test_rewritten_file_is_reindexed(tmp_path):
+    path = tmp_path / "s.jsonl"
+    _write_session(path, range(0, 50))
+    index = SessionIndex()
+    start, end = _window(0, 500)
+    parse_jsonl_file(path, start, end, index=index)
+
+    _write_session(path, range(300, 310))
+
+    records = parse_jsonl_file(path, start, end, index=index)
+    assert [r["uuid"] for r in records] == [f"u{i}" for i in range(300, 310)]
+
+
+def test_index_round_trips_through_disk(tmp_path, monkeypatch):
+    path = tmp_path / "s.jsonl"
+    _write_session(path, range(0, 30))
+    cache = tmp_path / "cache" / "session-index.json"
+    start, end = _window(5, 8)
+
+    index = SessionIndex(cache)
+    expected = parse_jsonl_file(path, start, end, index=index)
+    index.save()
+
+    def _fail(*_args):
+        raise AssertionError("should reuse persisted index")
+
+    monkeypatch.setattr(SessionIndex, "_index_tail", staticmethod(_fail))
+    assert parse_jsonl_file(path, start, end, index=SessionIndex(cache)) == expected
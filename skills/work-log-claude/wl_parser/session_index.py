@@ -0,0 +1,218 @@
+# wl_parser/session_index.py
+"""Incremental byte-offset index over Claude Code session JSONL files.
+
+Each indexed file is split into segments of roughly SEGMENT_BYTES, aligned to
+line boundaries. For every segment the index keeps the min/max timestamp of
+its user/assistant records, so a report can seek straight to the segments
+that overlap its window and skip whole files that fall outside it.
+
+Session transcripts are append-only: when a file grows, only the new tail is
+indexed. A file whose inode changes, shrinks, or whose last indexed bytes no
+longer match is re-indexed from scratch.
+"""
+
+import json
+import os
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+INDEX_VERSION = 1
+SEGMENT_BYTES = 128 * 1024
+_CRC_WINDOW = 256
+
+PROCESSABLE_TYPES = {"user", "assistant"}
+
+
+def default_index_path() -> Path:
+    """Return the on-disk index location (honours XDG_CACHE_HOME)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "work-log-claude" / "session-index.json"
+
+
+def is_candidate_line(line: bytes) -> bool:
+    """Cheap substring test run before json.loads.
+
+    A user/assistant record with a timestamp must contain both a
+    ``"timestamp"`` key and a ``"user"`` / ``"assistant"`` value; lines
+    without them (progress, system, summaries) are skipped undecoded.
+    """
+    return b'"timestamp"' in line and (b'"user"' in line or b'"assistant"' in line)
+
+
+def record_epoch(record: dict) -> float | None:
+    """Return the record's timestamp as epoch seconds if it is processable."""
+    if record.get("type") not in PROCESSABLE_TYPES:
+        return None
+    ts_str = record.get("timestamp")
+    if not ts_str or not isinstance(ts_str, str):
+        return None
+    try:
+        return datetime.fromisoformat(ts_str.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+class SessionIndex:
+    """Persistent (path -> segments) index; ``path=None`` keeps it in memory."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: dict = self._read() if path else {}
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def ranges(self, filepath: Path, start: float, end: float) -> list | None:
+        """Return byte ranges of ``filepath`` that may hold records in [start, end].
+
+        Each range is ``(offset, stop)`` where ``stop`` is ``None`` for
+        "until EOF". An empty list means the file can be skipped entirely;
+        ``None`` means the file could not be indexed and must be read whole.
+        """
+        entry = self._refresh(filepath)
+        if entry is None:
+            return None
+
+        merged: list = []
+        first, last = entry["first"], entry["last"]
+        if first is not None and first <= end and last >= start:
+            for lo, hi, seg_min, seg_max in entry["segments"]:
+                if seg_max < start or seg_min > end:
+                    continue
+                if merged and merged[-1][1] == lo:
+                    merged[-1] = (merged[-1][0], hi)
+                else:
+                    merged.append((lo, hi))
+
+        # Bytes after the last newline (a line still being written, or a
+        # final line without a trailing newline) are never indexed.
+        if entry["size"] > entry["indexed"]:
+            merged.append((entry["indexed"], None))
+        return merged
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _refresh(self, filepath: Path) -> dict | None:
+        key = os.path.abspath(filepath)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry["ino"] == st.st_ino
+            and entry["size"] == st.st_size
+            and entry["mtime_ns"] == st.st_mtime_ns
+        ):
+            return entry
+
+        try:
+            with open(key, "rb") as f:
+                if entry is None or not self._is_append_of(f, entry, st):
+                    entry = {
+                        "ino": st.st_ino,
+                        "indexed": 0,
+                        "crc": 0,
+                        "first": None,
+                        "last": None,
+                        "segments": [],
+                    }
+                self._index_tail(f, entry)
+        except OSError:
+            return None
+
+        entry["size"] = st.st_size
+        entry["mtime_ns"] = st.st_mtime_ns
+        self._entries[key] = entry
+        self._dirty = True
+        return entry
+
+    @staticmethod
+    def _is_append_of(f, entry: dict, st: os.stat_result) -> bool:
+        if entry["ino"] != st.st_ino or st.st_size < entry["indexed"]:
+            return False
+        return _tail_crc(f, entry["indexed"]) == entry["crc"]
+
+    @staticmethod
+    def _index_tail(f, entry: dict) -> None:
+        segments = entry["segments"]
+        offset = entry["indexed"]
+
+        # Keep filling a short trailing segment instead of fragmenting it.
+        if segments and segments[-1][1] == offset and offset - segments[-1][0] < SEGMENT_BYTES:
+            seg_lo, _, seg_min, seg_max = segments.pop()
+        else:
+            seg_lo, seg_min, seg_max = offset, None, None
+
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            if is_candidate_line(line):
+                try:
+                    ts = record_epoch(json.loads(line))
+                except (ValueError, AttributeError):
+                    ts = None
+                if ts is not None:
+                    seg_min = ts if seg_min is None else min(seg_min, ts)
+                    seg_max = ts if seg_max is None else max(seg_max, ts)
+            if offset - seg_lo >= SEGMENT_BYTES:
+                if seg_min is not None:
+                    segments.append([seg_lo, offset, seg_min, seg_max])
+                seg_lo, seg_min, seg_max = offset, None, None
+        if seg_min is not None:
+            segments.append([seg_lo, offset, seg_min, seg_max])
+
+        entry["indexed"] = offset
+        entry["crc"] = _tail_crc(f, offset)
+        if segments:
+            entry["first"] = min(s[2] for s in segments)
+            entry["last"] = max(s[3] for s in segments)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        entries = data.get("files")
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self) -> None:
+        """Write the index atomically, dropping entries for deleted files."""
+        if not self.path or not self._dirty:
+            return
+        entries = {k: v for k, v in self._entries.items() if os.path.exists(k)}
+        payload = {"version": INDEX_VERSION, "files": entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            # The index is only an accelerator; the report is still correct.
+            print(f"Warning: could not write session index {self.path}: {e}", file=sys.stderr)
+
+
+def _tail_crc(f, offset: int) -> int:
+    """CRC of the bytes just before ``offset``, used to detect rewritten files."""
+    lo = max(0, offset - _CRC_WINDOW)
+    f.seek(lo)
+    return zlib.crc32(f.read(offset - lo))
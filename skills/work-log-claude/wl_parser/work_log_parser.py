@@ -19,10 +19,14 @@ from wl_parser.extractors import (
     extract_tokens,
     detect_session_status,
 )
+from wl_parser.session_index import (
+    PROCESSABLE_TYPES,
+    SessionIndex,
+    default_index_path,
+    is_candidate_line,
+)
 
 
-PROCESSABLE_TYPES = {"user", "assistant"}
-
 # Project directory patterns to exclude (automated observer sessions, not real work)
 EXCLUDED_PROJECT_PATTERNS = {"observer", "mem-observer", "claude-mem"}
 
@@ -42,36 +46,57 @@ def parse_jsonl_file(
     filepath: Path,
     start: datetime,
     end: datetime,
+    index: SessionIndex | None = None,
 ) -> list:
-    """Read a JSONL file, return records of type user/assistant within [start, end]."""
-    records = []
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
-                    print(f"Warning: skipping malformed line {line_num} in {filepath}", file=sys.stderr)
-                    continue
-
-                rec_type = record.get("type")
-                if rec_type not in PROCESSABLE_TYPES:
-                    continue
-
-                ts_str = record.get("timestamp")
-                if not ts_str:
-                    continue
+    """Read a JSONL file, return records of type user/assistant within [start, end].
 
-                try:
-                    ts = parse_timestamp(ts_str)
-                except (ValueError, TypeError):
-                    continue
+    Lines are pre-filtered on raw substrings before any JSON decode. With an
+    ``index``, only the byte ranges whose timestamps overlap the window are
+    read, and files entirely outside it are skipped without opening them twice.
+    """
+    ranges = index.ranges(filepath, start.timestamp(), end.timestamp()) if index else None
+    if ranges is None:
+        ranges = [(0, None)]
+    if not ranges:
+        return []
 
-                if start <= ts <= end:
-                    records.append(record)
+    records = []
+    try:
+        with open(filepath, "rb") as f:
+            for lo, hi in ranges:
+                f.seek(lo)
+                offset = lo
+                while hi is None or offset < hi:
+                    line = f.readline()
+                    if not line:
+                        break
+                    line_offset = offset
+                    offset += len(line)
+                    if not is_candidate_line(line):
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        print(
+                            f"Warning: skipping malformed line at byte {line_offset} in {filepath}",
+                            file=sys.stderr,
+                        )
+                        continue
+
+                    if not isinstance(record, dict) or record.get("type") not in PROCESSABLE_TYPES:
+                        continue
+
+                    ts_str = record.get("timestamp")
+                    if not ts_str:
+                        continue
+
+                    try:
+                        ts = parse_timestamp(ts_str)
+                    except (ValueError, TypeError, AttributeError):
+                        continue
+
+                    if start <= ts <= end:
+                        records.append(record)
     except PermissionError:
         print(f"Warning: permission denied reading {filepath}", file=sys.stderr)
     except FileNotFoundError:
@@ -321,8 +346,13 @@ def build_report(
     claude_home: Path,
     codex_home: Path,
     project_filter: str | None = None,
+    index: SessionIndex | None = None,
 ) -> dict:
-    """Build complete work log report."""
+    """Build complete work log report.
+
+    ``index`` lets repeated reports seek past transcript regions outside the
+    requested window (see wl_parser.session_index).
+    """
     tz = _get_tz(timezone_name)
 
     # Scan and parse Claude Code sessions (skip excluded project dirs)
@@ -330,7 +360,7 @@ def build_report(
     for project_name, filepath in scan_session_files(claude_home, start, project_filter):
         if _is_excluded_project(project_name):
             continue
-        records = parse_jsonl_file(filepath, start, end)
+        records = parse_jsonl_file(filepath, start, end, index=index)
         for r in records:
             r["_project"] = project_name
         all_records.extend(records)
@@ -469,6 +499,12 @@ def parse_args(argv: list | None = None) -> argparse.Namespace:
     parser.add_argument("--project", default=None, help="Filter by project name substring")
     parser.add_argument("--claude-home", default=str(Path.home() / ".claude"), help="Path to ~/.claude")
     parser.add_argument("--codex-home", default=str(Path.home() / ".codex"), help="Path to ~/.codex")
+    parser.add_argument(
+        "--index-path",
+        default=None,
+        help="Session offset index file (default: $XDG_CACHE_HOME/work-log-claude/session-index.json)",
+    )
+    parser.add_argument("--no-index", action="store_true", help="Read every session file in full")
     return parser.parse_args(argv)
 
 
@@ -476,6 +512,9 @@ def main(argv: list | None = None) -> None:
     """CLI entry point. Outputs JSON to stdout."""
     args = parse_args(argv)
     start, end = parse_time_shortcut(args.time_range, args.timezone, args.end_date)
+    index = None
+    if not args.no_index:
+        index = SessionIndex(Path(args.index_path) if args.index_path else default_index_path())
 
     report = build_report(
         start=start,
@@ -484,7 +523,10 @@ def main(argv: list | None = None) -> None:
         claude_home=Path(args.claude_home),
         codex_home=Path(args.codex_home),
         project_filter=args.project,
+        index=index,
     )
+    if index is not None:
+        index.save()
 
     json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
     print()  # trailing newline
@@ -36,3 +36,10 @@ def test_load_missing_file_raises(tmp_path: Path):
     import pytest
     with pytest.raises(FileNotFoundError):
         NpxSkillsConfig.load(tmp_path / "missing.yaml")
+
+
+def test_load_honours_yes_false(tmp_path: Path):
+    yaml_file = tmp_path / "npx-skills.yaml"
+    yaml_file.write_text("defaults:\n  yes: false\npackages: []\n")
+
+    assert NpxSkillsConfig.load(yaml_file).defaults.yes is False
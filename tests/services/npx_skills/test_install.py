@@ -1,3 +1,4 @@
+import time
 from pathlib import Path
 
 from script.services.npx_skills import install as install_mod
@@ -7,6 +8,7 @@ from script.services.npx_skills.config import (
 )
 from script.services.npx_skills.install import (
     build_add_command,
+    build_batch_add_command,
     build_update_command,
     run_npx_skills_phase,
 )
@@ -70,3 +72,160 @@ def test_phase_skips_when_project_yaml_missing(tmp_path: Path, monkeypatch):
 
     # 未建立 user yaml、未拋例外即代表已優雅跳過
     assert not user.exists()
+
+
+def _write_yaml(path: Path, yes: bool = True, scope: str = "global") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"""version: 1
+defaults:
+  scope: {scope}
+  agents: "*"
+  yes: {str(yes).lower()}
+packages:
+  - repo: anthropics/skills
+    skills: [claude-api, skill-creator]
+  - repo: kepano/obsidian-skills
+    skills: [obsidian-markdown]
+  - repo: x/y
+    skills: [a, b, c]
+""",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _fake_npx(monkeypatch, fail: set[str] = frozenset()):
+    """記錄呼叫的命令；命令含 fail 中任一字串時回傳非 0。"""
+    calls: list[tuple[list[str], bool]] = []
+
+    def _run(cmd, capture):
+        calls.append((cmd, capture))
+        return (1 if any(token in cmd or f"x/y@{token}" in cmd for token in fail) else 0), ""
+
+    monkeypatch.setattr(install_mod, "check_command_exists", lambda _: True)
+    monkeypatch.setattr(install_mod, "_run_npx", _run)
+    monkeypatch.setattr(
+        "script.services.npx_skills.manifest_sync.cleanup_skills_from_manifests",
+        lambda names: {},
+    )
+    return calls
+
+
+def test_build_batch_add_command_lists_skills():
+    cmd = build_batch_add_command("x/y", ["a", "b"], NpxDefaults())
+
+    assert cmd == ["npx", "skills", "add", "x/y", "--skill", "a", "b", "-g", "-a", "*", "--yes"]
+
+
+def test_phase_batches_add_per_package(tmp_path: Path, monkeypatch):
+    calls = _fake_npx(monkeypatch)
+    project = _write_yaml(tmp_path / "project.yaml")
+
+    results = run_npx_skills_phase(
+        mode="add", project_yaml=project, user_yaml=tmp_path / "user.yaml", max_workers=3
+    )
+
+    # global scope 共用 ~/.agents/.skill-lock.json，即使指定 max_workers 也依序執行
+    cmds = [cmd[3] for cmd, _capture in calls]
+    assert cmds == ["anthropics/skills", "kepano/obsidian-skills@obsidian-markdown", "x/y"]
+    assert not any(capture for _cmd, capture in calls)
+    assert [r.entry.skill for r in results] == [
+        "claude-api", "skill-creator", "obsidian-markdown", "a", "b", "c"
+    ]
+    assert all(r.ok for r in results)
+    assert results[0].batched and not results[2].batched
+
+
+def test_phase_project_scope_warms_up_before_parallel(tmp_path: Path, monkeypatch):
+    calls = _fake_npx(monkeypatch)
+    started_with_first: list[int] = []
+    real_run = install_mod._run_npx
+
+    def _run(cmd, capture):
+        code, output = real_run(cmd, capture)
+        if cmd[3] == "anthropics/skills":
+            time.sleep(0.05)
+            started_with_first.append(len(calls))
+        return code, output
+
+    monkeypatch.setattr(install_mod, "_run_npx", _run)
+    project = _write_yaml(tmp_path / "project.yaml", scope="project")
+
+    results = run_npx_skills_phase(
+        mode="add", project_yaml=project, user_yaml=tmp_path / "user.yaml", max_workers=3
+    )
+
+    assert calls[0][0][3] == "anthropics/skills"
+    assert started_with_first == [1]
+    assert sorted(cmd[3] for cmd, _capture in calls[1:]) == [
+        "kepano/obsidian-skills@obsidian-markdown", "x/y"
+    ]
+    assert all(capture for _cmd, capture in calls)
+    assert all(r.ok for r in results)
+
+
+def test_phase_falls_back_to_single_add_when_batch_fails(tmp_path: Path, monkeypatch):
+    calls = _fake_npx(monkeypatch, fail={"b"})
+    project = _write_yaml(tmp_path / "project.yaml")
+
+    results = run_npx_skills_phase(
+        mode="add", project_yaml=project, user_yaml=tmp_path / "user.yaml"
+    )
+
+    xy_calls = [cmd[3] for cmd, _capture in calls if cmd[3].startswith("x/y")]
+    assert xy_calls == ["x/y", "x/y@a", "x/y@b", "x/y@c"]
+    assert {r.entry.skill: r.ok for r in results if r.entry.repo == "x/y"} == {
+        "a": True, "b": False, "c": True
+    }
+
+
+def test_phase_runs_sequentially_without_yes(tmp_path: Path, monkeypatch):
+    calls = _fake_npx(monkeypatch)
+    project = _write_yaml(tmp_path / "project.yaml", yes=False)
+
+    run_npx_skills_phase(mode="update", project_yaml=project, user_yaml=tmp_path / "user.yaml")
+
+    assert [cmd[3] for cmd, _capture in calls] == [
+        "claude-api", "skill-creator", "obsidian-markdown", "a", "b", "c"
+    ]
+    assert not any(capture for _cmd, capture in calls)
+
+
+def test_run_npx_detaches_stdin_when_capturing(monkeypatch):
+    captured: dict = {}
+
+    def _fake_run(cmd, **kwargs):
+        captured.update(kwargs)
+        return install_mod.subprocess.CompletedProcess(cmd, 0, "out\n", "")
+
+    monkeypatch.setattr(install_mod.subprocess, "run", _fake_run)
+
+    assert install_mod._run_npx(["npx", "skills", "add", "x/y"], capture=True) == (0, "out\n")
+    assert captured["stdin"] is install_mod.subprocess.DEVNULL
+    assert captured["capture_output"] is True
+
+
+def test_batch_failure_output_is_kept(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.setattr(install_mod, "check_command_exists", lambda _: True)
+    monkeypatch.setattr(
+        "script.services.npx_skills.manifest_sync.cleanup_skills_from_manifests",
+        lambda names: {},
+    )
+
+    def _run(cmd, capture):
+        if cmd[3] == "x/y":
+            return 1, "error: unknown option '--skill'\n"
+        return 0, ""
+
+    monkeypatch.setattr(install_mod, "_run_npx", _run)
+    project = _write_yaml(tmp_path / "project.yaml", scope="project")
+
+    results = run_npx_skills_phase(
+        mode="add", project_yaml=project, user_yaml=tmp_path / "user.yaml", max_workers=2
+    )
+
+    xy = [r for r in results if r.entry.repo == "x/y"]
+    assert all(r.ok and not r.batched for r in xy)
+    assert all("unknown option '--skill'" in r.batch_output for r in xy)
+    assert "unknown option '--skill'" in capsys.readouterr().out
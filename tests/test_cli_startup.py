@@ -0,0 +1,81 @@
+"""`ai-dev` 啟動成本：子命令延遲載入與 import 時間預算。"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import typer
+
+from script import main
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# `import script.main` 時 script 自身模組的 import 時間上限（不含 typer 本身）
+IMPORT_BUDGET_US = 50_000
+# 這些模組只應在執行對應子命令時載入
+HEAVY_MODULES = ("script.utils.shared", "script.commands", "yaml", "rich.console")
+
+
+def _importtime(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stderr
+
+
+def test_import_main_stays_within_budget_and_skips_subcommands():
+    report = _importtime("import script.main")
+
+    loaded: dict[str, int] = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = (part.strip() for part in line[12:].split("|"))
+        loaded[name] = int(self_us)
+
+    heavy = [
+        name for name in loaded if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES)
+    ]
+    assert heavy == []
+    own = sum(us for name, us in loaded.items() if name.startswith("script"))
+    assert own < IMPORT_BUDGET_US, f"script 模組 import 耗時 {own}us"
+
+
+def test_lazy_registry_help_matches_loaded_commands():
+    for name, (_module, _attr, help_text) in main.LAZY_COMMANDS.items():
+        command = main.load_lazy_command(name)
+        assert command.name == name
+        assert command.get_short_help_str(limit=1000) == help_text
+
+
+def test_root_group_loads_only_invoked_subcommand():
+    group = typer.main.get_command(main.app)
+    assert group.list_commands(None) == list(main.LAZY_COMMANDS)
+    assert group.commands == {}
+
+    assert group.get_command(None, "status").name == "status"
+    assert list(group.commands) == ["status"]
+    assert group.get_command(None, "missing") is None
+
+
+def test_shell_complete_lists_registry_without_importing_subcommands():
+    code = (
+        "import sys\n"
+        "import typer\n"
+        "from script import main\n"
+        "group = typer.main.get_command(main.app)\n"
+        "ctx = group.make_context('ai-dev', [], resilient_parsing=True)\n"
+        "names = [item.value for item in group.shell_complete(ctx, '')]\n"
+        "options = [item.value for item in group.shell_complete(ctx, '--')]\n"
+        "loaded = [m for m in sys.modules if m.startswith('script.commands')]\n"
+        "print(names == list(main.LAZY_COMMANDS), '--version' in options, loaded)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "True True []"
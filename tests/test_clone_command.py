@@ -53,4 +53,5 @@ def test_clone_builds_execution_plan_and_calls_pipeline(monkeypatch):
         "force": False,
         "skip_conflicts": False,
         "backup": False,
+        "incremental": False,
     }
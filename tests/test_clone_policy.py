@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 import script.utils.manifest as manifest
 from script.utils import shared
 from script.utils.manifest import ManifestTracker
@@ -197,7 +199,44 @@ def test_copy_skill_with_policy_force_overwrites_default_strategy(tmp_path: Path
     assert (dst / "SKILL.md").read_text(encoding="utf-8") == "upstream\n"
 
 
-def test_copy_with_log_passes_flags_to_policy_copy(tmp_path: Path, monkeypatch):
+def test_copy_skill_with_policy_backup_resolves_without_prompt(tmp_path: Path, monkeypatch):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir(parents=True)
+    dst.mkdir(parents=True)
+
+    (src / "SKILL.md").write_text("upstream\n", encoding="utf-8")
+    (dst / "SKILL.md").write_text("user custom\n", encoding="utf-8")
+
+    def _no_prompt(_prompt=""):
+        raise AssertionError("backup mode must not prompt")
+
+    monkeypatch.setattr("builtins.input", _no_prompt)
+    shared._copy_skill_with_policy(
+        src,
+        dst,
+        {"rules": []},
+        force=False,
+        skip_conflicts=False,
+        backup=True,
+    )
+
+    assert (dst / "SKILL.md").read_text(encoding="utf-8") == "upstream\n"
+    backups = list(dst.glob("SKILL.md.*.bak"))
+    assert [b.read_text(encoding="utf-8") for b in backups] == ["user custom\n"]
+
+
+@pytest.mark.parametrize(
+    ("force", "skip_conflicts", "backup"),
+    [
+        (True, False, False),
+        (False, True, False),
+        (False, False, True),
+    ],
+)
+def test_copy_with_log_passes_flags_to_policy_copy(
+    tmp_path: Path, monkeypatch, force: bool, skip_conflicts: bool, backup: bool
+):
     src_root = tmp_path / "src" / "skills"
     dst_root = tmp_path / "dst" / "skills"
     src_root.mkdir(parents=True)
@@ -210,10 +249,17 @@ def test_copy_with_log_passes_flags_to_policy_copy(tmp_path: Path, monkeypatch):
     called: dict[str, bool] = {}
 
     def _fake_copy(
-        src: Path, dst: Path, policy: dict, force: bool, skip_conflicts: bool
+        src: Path,
+        dst: Path,
+        policy: dict,
+        force: bool,
+        skip_conflicts: bool,
+        backup: bool,
+        out,
     ):
         called["force"] = force
         called["skip_conflicts"] = skip_conflicts
+        called["backup"] = backup
         dst.mkdir(parents=True, exist_ok=True)
 
     monkeypatch.setattr(shared, "_copy_skill_with_policy", _fake_copy)
@@ -225,11 +271,12 @@ def test_copy_with_log_passes_flags_to_policy_copy(tmp_path: Path, monkeypatch):
         "skills",
         "Claude Code",
         tracker=tracker,
-        force=True,
-        skip_conflicts=False,
+        force=force,
+        skip_conflicts=skip_conflicts,
+        backup=backup,
     )
 
-    assert called == {"force": True, "skip_conflicts": False}
+    assert called == {"force": force, "skip_conflicts": skip_conflicts, "backup": backup}
 
 
 def test_copy_with_log_without_policy_keeps_copytree_behavior(tmp_path: Path):
@@ -341,7 +388,7 @@ def test_conflict_prescan_skips_skill_with_valid_clone_policy(
     captured_skill_sets: list[set[str]] = []
 
     monkeypatch.setattr(
-        manifest, "read_manifest", lambda target: {"files": {"skills": {}}}
+        manifest, "read_manifest", lambda target, out=None: {"files": {"skills": {}}}
     )
     monkeypatch.setattr(manifest, "write_manifest", lambda target, data: None)
     monkeypatch.setattr(manifest, "display_conflicts", lambda conflicts: None)
@@ -359,9 +406,9 @@ def test_conflict_prescan_skips_skill_with_valid_clone_policy(
             "workflows": [],
         },
     )
-    monkeypatch.setattr(manifest, "cleanup_orphans", lambda target, orphans: None)
+    monkeypatch.setattr(manifest, "cleanup_orphans", lambda target, orphans, out=None: None)
     monkeypatch.setattr(
-        manifest, "backup_file", lambda target, resource_type, name: None
+        manifest, "backup_file", lambda target, resource_type, name, out=None: None
     )
     monkeypatch.setattr(manifest, "get_project_version", lambda: "1.0.0")
 
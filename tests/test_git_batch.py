@@ -0,0 +1,142 @@
+"""常駐 git cat-file reader 的測試。"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from script.utils import git_batch
+from script.utils import manifest as M
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def isolated_index_dir(tmp_path: Path, monkeypatch) -> Path:
+    index_dir = tmp_path / "index-cache"
+    monkeypatch.setattr(git_batch, "get_path_index_dir", lambda: index_dir)
+    yield index_dir
+    git_batch.clear_path_index_memo()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    tmp_path = tmp_path / "repo"
+    tmp_path.mkdir()
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    (tmp_path / "skills" / "demo").mkdir(parents=True)
+    (tmp_path / "skills" / "demo" / "SKILL.md").write_bytes(b"v1\n")
+    (tmp_path / "skills" / "demo" / "with space.md").write_bytes(b"\x00bin\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    yield tmp_path
+    git_batch.close_git_readers()
+
+
+def test_reader_resolves_head_and_reads_blobs(repo: Path):
+    head = _git(repo, "rev-parse", "HEAD")
+    reader = git_batch.get_git_reader(repo)
+
+    assert reader.resolve("HEAD") == head
+    assert reader.read_blob(head, "skills/demo/SKILL.md") == b"v1\n"
+    assert reader.read_blob(head, "skills/demo/with space.md") == b"\x00bin\n"
+    assert reader.read_blob(head, "skills/demo/missing.md") is None
+    # 不存在的物件後，同一行程仍可繼續使用
+    assert reader.read_blob(head, "skills/demo/SKILL.md") == b"v1\n"
+
+
+def test_reader_commit_exists(repo: Path):
+    head = _git(repo, "rev-parse", "HEAD")
+    reader = git_batch.get_git_reader(repo)
+    assert reader.commit_exists(head) is True
+    assert reader.commit_exists("0" * 40) is False
+
+
+def test_reader_is_shared_per_repo(repo: Path):
+    assert git_batch.get_git_reader(repo) is git_batch.get_git_reader(repo / ".")
+
+
+def test_read_blob_memoizes_full_sha(repo: Path, monkeypatch):
+    head = _git(repo, "rev-parse", "HEAD")
+    reader = git_batch.get_git_reader(repo)
+    assert reader.read_blob(head, "skills/demo/SKILL.md") == b"v1\n"
+
+    def _boom(*args, **kwargs):
+        raise AssertionError("should be served from memo")
+
+    monkeypatch.setattr(reader, "_read_object", _boom)
+    assert reader.read_blob(head, "skills/demo/SKILL.md") == b"v1\n"
+
+
+def test_manifest_git_helpers_use_reader(repo: Path, monkeypatch):
+    monkeypatch.setitem(M.SOURCE_REPO_PATHS, "fixture", repo)
+    head = _git(repo, "rev-parse", "HEAD")
+
+    assert M.get_repo_head("fixture") == head
+    assert M.is_commit_valid("fixture", head) is True
+    assert M.get_repo_blob("fixture", head, "skills/demo/SKILL.md") == b"v1\n"
+    assert M.get_file_commit("fixture", "skills/demo/SKILL.md") == head
+
+    (repo / "skills" / "demo" / "SKILL.md").write_bytes(b"v2\n")
+    _git(repo, "commit", "-q", "-am", "v2")
+    new_head = _git(repo, "rev-parse", "HEAD")
+    # HEAD 移動後 memo 失效
+    assert M.get_repo_head("fixture") == new_head
+    assert M.get_file_commit("fixture", "skills/demo/SKILL.md") == new_head
+    M.close_git_session()
+
+
+def test_path_commit_index_tracks_latest_commit(repo: Path):
+    first = _git(repo, "rev-parse", "HEAD")
+    (repo / "skills" / "demo" / "SKILL.md").write_bytes(b"v2\n")
+    _git(repo, "commit", "-q", "-am", "v2")
+    second = _git(repo, "rev-parse", "HEAD")
+
+    index = git_batch.get_path_commit_index(repo, second)
+    assert index["skills/demo/SKILL.md"][0] == second
+    assert index["skills/demo/with space.md"][0] == first
+
+
+def test_path_commit_index_persists_and_extends(repo: Path, isolated_index_dir: Path, monkeypatch):
+    first = _git(repo, "rev-parse", "HEAD")
+    git_batch.get_path_commit_index(repo, first)
+    assert list(isolated_index_dir.glob("*.json"))
+
+    (repo / "new.md").write_text("n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "add new")
+    second = _git(repo, "rev-parse", "HEAD")
+    git_batch.clear_path_index_memo()
+
+    walks: list[tuple[str, ...]] = []
+    real_walk = git_batch._walk_log
+
+    def _spy(repo_path, *rev_args):
+        walks.append(rev_args)
+        return real_walk(repo_path, *rev_args)
+
+    monkeypatch.setattr(git_batch, "_walk_log", _spy)
+    index = git_batch.get_path_commit_index(repo, second)
+    # 舊 HEAD 為祖先：只走增量區間
+    assert walks == [(f"{first}..{second}",)]
+    assert index["new.md"][0] == second
+    assert index["skills/demo/SKILL.md"][0] == first
+
+
+def test_get_file_commit_uses_index_without_per_file_log(repo: Path, monkeypatch):
+    monkeypatch.setitem(M.SOURCE_REPO_PATHS, "fixture", repo)
+    head = _git(repo, "rev-parse", "HEAD")
+
+    def _no_git(*args, **kwargs):
+        raise AssertionError("per-file git log should not run")
+
+    monkeypatch.setattr(M, "_git", _no_git)
+    assert M.get_file_commit("fixture", "skills/demo/SKILL.md") == head
+    assert M.get_file_commit("fixture", "skills/demo/untracked.md") is None
+    M.close_git_session()
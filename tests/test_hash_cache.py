@@ -0,0 +1,102 @@
+"""stat-keyed 檔案 hash 快取的單元測試。"""
+
+import os
+import time
+from pathlib import Path
+
+from script.utils import hash_cache as HC
+from script.utils import manifest as M
+
+
+def _write_old(path: Path, content: str) -> None:
+    """寫檔並把 mtime 拉到 racy 視窗之外。"""
+    path.write_text(content, encoding="utf-8")
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+
+def test_lookup_hits_after_store(tmp_path: Path):
+    cache = HC.FileHashCache(tmp_path / "cache.json")
+    f = tmp_path / "a.txt"
+    _write_old(f, "hello")
+    st = os.stat(f)
+    cache.store(f, st, "sha256:x")
+    assert cache.lookup(f, st) == "sha256:x"
+
+
+def test_lookup_misses_when_stat_changes(tmp_path: Path):
+    cache = HC.FileHashCache(tmp_path / "cache.json")
+    f = tmp_path / "a.txt"
+    _write_old(f, "hello")
+    cache.store(f, os.stat(f), "sha256:x")
+    _write_old(f, "hello world")
+    assert cache.lookup(f, os.stat(f)) is None
+    assert len(cache) == 0
+
+
+def test_store_skips_racy_mtime(tmp_path: Path):
+    cache = HC.FileHashCache(tmp_path / "cache.json")
+    f = tmp_path / "a.txt"
+    f.write_text("fresh", encoding="utf-8")
+    cache.store(f, os.stat(f), "sha256:x")
+    assert len(cache) == 0
+
+
+def test_save_and_reload_roundtrip(tmp_path: Path):
+    path = tmp_path / "cache.json"
+    cache = HC.FileHashCache(path)
+    f = tmp_path / "a.txt"
+    _write_old(f, "hello")
+    cache.store(f, os.stat(f), "sha256:x")
+    cache.save()
+    assert path.exists()
+
+    reloaded = HC.FileHashCache(path)
+    assert reloaded.lookup(f, os.stat(f)) == "sha256:x"
+
+
+def test_invalidate_directory_prefix(tmp_path: Path):
+    cache = HC.FileHashCache(tmp_path / "cache.json")
+    skill = tmp_path / "skill"
+    skill.mkdir()
+    for name in ("a.md", "b.md"):
+        _write_old(skill / name, name)
+        cache.store(skill / name, os.stat(skill / name), f"sha256:{name}")
+    other = tmp_path / "skill-other.md"
+    _write_old(other, "x")
+    cache.store(other, os.stat(other), "sha256:o")
+
+    cache.invalidate(skill)
+    assert len(cache) == 1
+    assert cache.lookup(other, os.stat(other)) == "sha256:o"
+
+
+def test_evict_drops_stale_and_caps_size(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(HC, "HASH_CACHE_MAX_ENTRIES", 2)
+    cache = HC.FileHashCache(tmp_path / "cache.json")
+    cache._loaded = True
+    now = int(time.time())
+    cache._entries = {
+        "/stale": [1, 1, 1, "sha256:s", now - HC.HASH_CACHE_MAX_AGE_SECONDS - 10],
+        "/a": [1, 1, 1, "sha256:a", now - 30],
+        "/b": [1, 1, 1, "sha256:b", now - 20],
+        "/c": [1, 1, 1, "sha256:c", now - 10],
+    }
+    cache._dirty = True
+    cache.save()
+    assert set(HC.FileHashCache(cache.path)._read()) == {"/b", "/c"}
+
+
+def test_compute_file_hash_uses_cache(tmp_path: Path, monkeypatch):
+    cache = HC.FileHashCache(tmp_path / "cache.json")
+    monkeypatch.setattr(M, "get_hash_cache", lambda: cache)
+    f = tmp_path / "a.txt"
+    _write_old(f, "hello")
+
+    first = M.compute_file_hash(f)
+    assert first == M.compute_file_hash(f, use_cache=False)
+
+    # 偽造快取內容：命中時不應重新讀檔
+    cache.store(f, os.stat(f), "sha256:cached")
+    assert M.compute_file_hash(f) == "sha256:cached"
+    assert M.compute_file_hash(f, use_cache=False) == first
@@ -0,0 +1,140 @@
+"""`ai-dev clone --incremental` 變動判定的測試。"""
+
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from script.utils import git_batch
+from script.utils import manifest as M
+from script.utils import shared
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def isolated_index_dir(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(git_batch, "get_path_index_dir", lambda: tmp_path / "index-cache")
+    yield
+    M.close_git_session()
+
+
+@pytest.fixture
+def source_repo(tmp_path: Path, monkeypatch) -> Path:
+    repo = tmp_path / "src"
+    (repo / "skills" / "alpha").mkdir(parents=True)
+    (repo / "skills" / "beta").mkdir(parents=True)
+    (repo / "skills" / "alpha" / "SKILL.md").write_text("a1")
+    (repo / "skills" / "beta" / "SKILL.md").write_text("b1")
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "init")
+    monkeypatch.setitem(M.SOURCE_REPO_PATHS, "fixture", repo)
+    return repo
+
+
+@pytest.fixture
+def target_dir(tmp_path: Path, monkeypatch) -> Path:
+    base = tmp_path / "target-skills"
+    for name in ("alpha", "beta"):
+        (base / name).mkdir(parents=True)
+        (base / name / "SKILL.md").write_text(name)
+    monkeypatch.setattr(
+        shared, "get_target_path", lambda _target, _rt: base
+    )
+    return base
+
+
+def _old_manifest(head: str, last_sync: float) -> dict:
+    from datetime import datetime
+
+    return {
+        "schema_version": 2,
+        "version": "1.0.0",
+        "last_sync": datetime.fromtimestamp(last_sync).astimezone().isoformat(),
+        "target": "claude",
+        "last_sync_commit_by_source": {"fixture": head},
+        "files": {
+            "skills": {
+                "alpha": {"hash": "h", "source": "fixture", "files": {}},
+                "beta": {"hash": "h", "source": "fixture", "files": {}},
+            },
+        },
+    }
+
+
+def test_list_dirty_files_reports_modified_untracked_and_renamed(source_repo: Path):
+    (source_repo / "skills" / "alpha" / "SKILL.md").write_text("a2")
+    (source_repo / "skills" / "alpha" / "new file.md").write_text("n")
+    _git(source_repo, "mv", "skills/beta/SKILL.md", "skills/beta/RENAMED.md")
+
+    dirty = set(M.list_dirty_files("fixture"))
+    assert "skills/alpha/SKILL.md" in dirty
+    assert "skills/alpha/new file.md" in dirty
+    assert {"skills/beta/RENAMED.md", "skills/beta/SKILL.md"} <= dirty
+
+
+def test_build_plan_requires_same_version_and_last_sync():
+    manifest = _old_manifest("abc", time.time())
+    assert shared._v2_build_incremental_plan("claude", manifest, "1.0.0") is not None
+    assert shared._v2_build_incremental_plan("claude", manifest, "2.0.0") is None
+    assert shared._v2_build_incremental_plan("claude", {**manifest, "last_sync": ""}, "1.0.0") is None
+    assert shared._v2_build_incremental_plan("claude", None, "1.0.0") is None
+
+
+def test_is_unchanged_detects_source_commits_and_dirty_tree(source_repo: Path, target_dir: Path):
+    head = _git(source_repo, "rev-parse", "HEAD")
+    (source_repo / "skills" / "beta" / "SKILL.md").write_text("b2")
+    _git(source_repo, "commit", "-q", "-am", "beta v2")
+    (source_repo / "skills" / "alpha" / "extra.md").write_text("dirty")
+
+    plan = shared._v2_build_incremental_plan(
+        "claude", _old_manifest(head, time.time()), "1.0.0"
+    )
+    alpha = source_repo / "skills" / "alpha"
+    beta = source_repo / "skills" / "beta"
+    assert shared._v2_is_unchanged(plan, "skills", "alpha", alpha, "fixture") is False
+    assert shared._v2_is_unchanged(plan, "skills", "beta", beta, "fixture") is False
+
+    (alpha / "extra.md").unlink()
+    plan = shared._v2_build_incremental_plan(
+        "claude", _old_manifest(head, time.time()), "1.0.0"
+    )
+    assert shared._v2_is_unchanged(plan, "skills", "alpha", alpha, "fixture") is True
+    assert plan["heads"]["fixture"] == _git(source_repo, "rev-parse", "HEAD")
+
+
+def test_is_unchanged_detects_target_edits_and_missing_target(
+    source_repo: Path, target_dir: Path
+):
+    head = _git(source_repo, "rev-parse", "HEAD")
+    plan = shared._v2_build_incremental_plan(
+        "claude", _old_manifest(head, time.time()), "1.0.0"
+    )
+    alpha = source_repo / "skills" / "alpha"
+    beta = source_repo / "skills" / "beta"
+
+    (target_dir / "alpha" / "SKILL.md").write_text("local edit")
+    assert shared._v2_is_unchanged(plan, "skills", "alpha", alpha, "fixture") is False
+
+    shutil.rmtree(target_dir / "beta")
+    assert shared._v2_is_unchanged(plan, "skills", "beta", beta, "fixture") is False
+
+
+def test_is_unchanged_falls_back_when_last_commit_invalid(
+    source_repo: Path, target_dir: Path
+):
+    plan = shared._v2_build_incremental_plan(
+        "claude", _old_manifest("0" * 40, time.time()), "1.0.0"
+    )
+    alpha = source_repo / "skills" / "alpha"
+    assert shared._v2_is_unchanged(plan, "skills", "alpha", alpha, "fixture") is False
+    assert plan["changes"]["fixture"] is None
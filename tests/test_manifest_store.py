@@ -0,0 +1,94 @@
+"""manifest 儲存後端（格式選擇、原子寫入、轉換）的測試。"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from script.utils import manifest as M
+from script.utils import manifest_store as S
+
+SAMPLE = {
+    "managed_by": "ai-dev",
+    "schema_version": 2,
+    "last_sync": "2026-03-01T12:00:00",
+    "files": {
+        "skills": {
+            "demo": {
+                "hash": "sha256:abc",
+                "source": "custom-skills",
+                "files": {"SKILL.md": {"src_hash": "sha256:1", "decision": "accepted"}},
+            }
+        },
+        "commands": {"說明": {"hash": "sha256:def"}},
+    },
+}
+
+
+@pytest.fixture
+def manifest_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "manifests"
+    monkeypatch.setattr(M, "get_manifest_dir", lambda: directory)
+    monkeypatch.delenv(S.MANIFEST_FORMAT_ENV, raising=False)
+    return directory
+
+
+def test_yaml_backend_output_matches_legacy_dump(manifest_dir: Path):
+    M.write_manifest("claude", SAMPLE)
+
+    legacy = yaml.dump(SAMPLE, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    assert (manifest_dir / "claude.yaml").read_text(encoding="utf-8") == legacy
+    assert M.read_manifest("claude") == SAMPLE
+
+
+def test_json_format_migrates_on_first_write(manifest_dir: Path, monkeypatch):
+    M.write_manifest("claude", SAMPLE)
+    monkeypatch.setenv(S.MANIFEST_FORMAT_ENV, "json")
+
+    # 尚未寫入 JSON 前仍讀得到既有 YAML
+    assert M.get_manifest_path("claude") == manifest_dir / "claude.yaml"
+    assert M.read_manifest("claude") == SAMPLE
+
+    M.write_manifest("claude", {**SAMPLE, "last_sync": "later"})
+
+    assert sorted(p.name for p in manifest_dir.iterdir()) == ["claude.json"]
+    assert M.read_manifest("claude")["last_sync"] == "later"
+
+
+def test_failed_write_keeps_previous_manifest(manifest_dir: Path, monkeypatch):
+    M.write_manifest("claude", SAMPLE)
+
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("interrupted")
+
+    monkeypatch.setattr(S.yaml, "dump", _boom)
+    with pytest.raises(RuntimeError):
+        M.write_manifest("claude", {"files": {}})
+
+    assert M.read_manifest("claude") == SAMPLE
+    assert sorted(p.name for p in manifest_dir.iterdir()) == ["claude.yaml"]
+
+
+def test_corrupt_json_manifest_is_treated_as_missing(manifest_dir: Path, monkeypatch):
+    monkeypatch.setenv(S.MANIFEST_FORMAT_ENV, "json")
+    manifest_dir.mkdir()
+    (manifest_dir / "claude.json").write_text("{not json", encoding="utf-8")
+
+    assert M.read_manifest("claude") is None
+
+
+def test_convert_manifests_round_trip(manifest_dir: Path):
+    M.write_manifest("claude", SAMPLE)
+    M.write_manifest("codex", {"files": {}})
+    (manifest_dir / "broken.yaml").write_text("a: [", encoding="utf-8")
+
+    converted = S.convert_manifests(manifest_dir, "json")
+
+    assert sorted(dst.name for _src, dst in converted) == ["claude.json", "codex.json"]
+    assert S.load_document(manifest_dir / "claude.json") == SAMPLE
+    assert (manifest_dir / "broken.yaml").exists()
+    assert S.list_manifest_stems(manifest_dir) == ["broken", "claude", "codex"]
+
+    S.convert_manifests(manifest_dir, "yaml")
+    assert S.load_document(manifest_dir / "claude.yaml") == SAMPLE
+    assert not (manifest_dir / "claude.json").exists()
@@ -1,5 +1,7 @@
 """manifest v2 schema 與 3-way 衝突分類的單元測試。"""
 
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -114,6 +116,56 @@ def test_compute_skill_file_map_excludes_pycache(tmp_path: Path):
     assert all("__pycache__" not in k for k in file_map)
 
 
+def test_scan_skill_dir_matches_rglob_hash(tmp_path: Path):
+    import hashlib
+
+    skill = tmp_path / "demo"
+    (skill / "refs" / "deep").mkdir(parents=True)
+    (skill / "SKILL.md").write_text("hi")
+    (skill / "refs" / "a.md").write_text("aaa")
+    (skill / "refs" / "deep" / "b.md").write_text("bbbb")
+    (skill / "refs-z.md").write_text("z")
+    (skill / "mod.pyc").write_text("x")
+
+    # 舊版 rglob 實作：排序所有路徑後逐檔組合
+    sha = hashlib.sha256()
+    for p in sorted(skill.rglob("*"), key=lambda p: str(p.relative_to(skill))):
+        if not p.is_file() or p.suffix == ".pyc":
+            continue
+        sha.update(str(p.relative_to(skill)).encode("utf-8"))
+        sha.update(M.compute_file_hash(p, use_cache=False).encode("utf-8"))
+
+    scan = M.scan_skill_dir(skill)
+    assert scan.hash == f"sha256:{sha.hexdigest()}"
+    assert scan.hash == M.compute_dir_hash(skill)
+    assert scan.files == M.compute_skill_file_map(skill)
+    assert set(scan.files) == {
+        "SKILL.md",
+        str(Path("refs") / "a.md"),
+        str(Path("refs") / "deep" / "b.md"),
+        "refs-z.md",
+    }
+    assert scan.sizes[str(Path("refs") / "deep" / "b.md")] == 4
+
+
+def test_record_skill_uses_single_scan(tmp_path: Path, monkeypatch):
+    skill = tmp_path / "demo"
+    skill.mkdir()
+    (skill / "SKILL.md").write_text("hi")
+    calls: list[Path] = []
+    real_scan = M.scan_skill_dir
+
+    def _spy(path):
+        calls.append(path)
+        return real_scan(path)
+
+    monkeypatch.setattr(M, "scan_skill_dir", _spy)
+    tracker = M.ManifestTracker(target="claude")
+    tracker.record_skill("demo", skill)
+    assert calls == [skill]
+    assert tracker.skills["demo"].files.keys() == {"SKILL.md"}
+
+
 def test_to_manifest_v2_shape(tmp_path: Path):
     skill = tmp_path / "demo"
     skill.mkdir()
@@ -210,3 +262,98 @@ def test_cleanup_orphans_leaves_retired_auto_skill_for_confirmed_cleanup(
 
     assert auto_skill.exists()
     assert not other.exists()
+
+
+def test_hash_files_parallel_matches_sequential(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(M, "PARALLEL_HASH_MIN_FILES", 2)
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"f{i}.md"
+        p.write_text("x" * i)
+        paths.append(p)
+    items = [(p, None) for p in paths]
+    assert M.hash_files(items, max_workers=4) == M.hash_files(items, max_workers=1)
+
+
+def test_scan_skill_dirs_matches_individual_scans(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(M, "PARALLEL_HASH_MIN_FILES", 2)
+    a = tmp_path / "a"
+    b = tmp_path / "b"
+    for d in (a, b):
+        (d / "sub").mkdir(parents=True)
+        (d / "SKILL.md").write_text(d.name)
+        (d / "sub" / "x.md").write_text("x" + d.name)
+    single = tmp_path / "cmd.md"
+    single.write_text("cmd")
+
+    scans = M.scan_skill_dirs([a, single, b], max_workers=4)
+    assert [s.hash for s in scans] == [
+        M.compute_dir_hash(a),
+        M.compute_file_hash(single),
+        M.compute_dir_hash(b),
+    ]
+    assert scans[1].files == {}
+    assert scans[2].files == M.compute_skill_file_map(b)
+
+
+def _age(path: Path) -> None:
+    """把 mtime 拉到 racy 視窗之外，讓 fingerprint 可被記錄。"""
+    past = time.time() - 60
+    for p in [path, *path.rglob("*")] if path.is_dir() else [path]:
+        os.utime(p, (past, past))
+
+
+def test_detect_conflicts_rehashes_only_changed_fingerprints(tmp_path: Path, monkeypatch):
+    skills_dir = tmp_path / "skills"
+    skill = skills_dir / "demo"
+    (skill / "refs").mkdir(parents=True)
+    (skill / "SKILL.md").write_text("hi")
+    (skill / "refs" / "a.md").write_text("aaa")
+    command = tmp_path / "commands" / "cmd.md"
+    command.parent.mkdir()
+    command.write_text("cmd")
+    _age(skill)
+    _age(command)
+
+    recorded = M.ManifestTracker(target="claude")
+    recorded.record_skill("demo", skill)
+    recorded.record_command("cmd", command)
+    old_manifest = recorded.to_manifest("1.0.0")
+    block = old_manifest["files"]["skills"]["demo"]
+    assert set(block["fingerprints"]) == {"SKILL.md", str(Path("refs") / "a.md")}
+    assert old_manifest["files"]["commands"]["cmd"]["fingerprint"][0] == 3
+
+    monkeypatch.setattr(
+        M,
+        "_get_target_resource_path",
+        lambda _t, rt, name: skill if rt == "skills" else command,
+    )
+    hashed: list[str] = []
+    real_hash_files = M.hash_files
+
+    def _spy(items, **kwargs):
+        hashed.extend(Path(path).name for path, _st in items)
+        return real_hash_files(items, **kwargs)
+
+    monkeypatch.setattr(M, "hash_files", _spy)
+
+    assert M.detect_conflicts("claude", old_manifest, recorded) == []
+    assert hashed == []
+
+    (skill / "refs" / "a.md").write_text("changed")
+    conflicts = M.detect_conflicts("claude", old_manifest, recorded)
+
+    assert hashed == ["a.md"]
+    assert [(c.resource_type, c.name) for c in conflicts] == [("skills", "demo")]
+    assert conflicts[0].current_hash == M.compute_dir_hash(skill)
+
+
+def test_racy_files_are_not_fingerprinted(tmp_path: Path):
+    skill = tmp_path / "demo"
+    skill.mkdir()
+    (skill / "SKILL.md").write_text("fresh")
+
+    assert M.scan_skill_dir(skill).fingerprints == {}
+    _age(skill)
+    fp = M.scan_skill_dir(skill).fingerprints["SKILL.md"]
+    assert fp[0] == 5 and fp[2] == M.compute_file_hash(skill / "SKILL.md")
@@ -273,3 +273,83 @@ def test_mem_auto_dry_run_without_config_uses_default_preview(monkeypatch):
     assert "未設定 sync server" in result.stdout
     assert "10 minutes" in result.stdout
     assert "FileNotFoundError" not in result.stdout
+
+
+def _paged_pull_fixture(monkeypatch, pages):
+    config = {
+        "last_pull_epoch": 0,
+        "auto_sync": False,
+        "server_url": "https://example.com",
+        "api_key": "token",
+    }
+    saved: list[int] = []
+    requested: list[str] = []
+    imported: list[dict] = []
+
+    monkeypatch.setattr(mem_cmd, "load_server_config", lambda: config)
+    monkeypatch.setattr(
+        mem_cmd,
+        "save_server_config",
+        lambda cfg: saved.append(cfg["last_pull_epoch"]),
+    )
+    monkeypatch.setattr(mem_cmd, "find_local_content_hashes", lambda _hashes: set())
+    monkeypatch.setattr(mem_cmd, "append_pulled_hashes", lambda *_args, **_kwargs: None)
+
+    def _fake_api_request(_config, _method, path, body=None, extra_headers=None):
+        requested.append(path)
+        return pages[len(requested) - 1]
+
+    def _fake_urlopen(*_args, **_kwargs):
+        raise mem_cmd.urllib.error.URLError("worker down")
+
+    def _fake_import(payload):
+        if payload["observations"] and payload["observations"][0]["title"] == "boom":
+            raise FileNotFoundError("db missing")
+        imported.append(payload)
+        return {"stats": {"observationsImported": len(payload["observations"])}}
+
+    monkeypatch.setattr(mem_cmd, "api_request", _fake_api_request)
+    monkeypatch.setattr(mem_cmd.urllib.request, "urlopen", _fake_urlopen)
+    monkeypatch.setattr(mem_cmd, "import_to_local_db", _fake_import)
+    return saved, requested, imported
+
+
+def _obs(title: str) -> dict:
+    return {"title": title, "narrative": "n", "project": "p", "type": "fact"}
+
+
+def test_mem_pull_imports_and_checkpoints_each_page(monkeypatch):
+    pages = [
+        {"observations": [_obs("a"), _obs("b")], "has_more": True, "next_since": 5},
+        {"observations": [_obs("a"), _obs("c")], "has_more": False, "server_epoch": 9},
+    ]
+    saved, requested, imported = _paged_pull_fixture(monkeypatch, pages)
+
+    result = runner.invoke(app, ["mem", "pull"])
+
+    assert result.exit_code == 0, result.stdout
+    assert requested == [
+        "/api/sync/pull?since=0&limit=500",
+        "/api/sync/pull?since=5&limit=500",
+    ]
+    # 每頁各自匯入；跨頁重複的 observation 只匯入一次
+    assert [[o["title"] for o in p["observations"]] for p in imported] == [
+        ["a", "b"],
+        ["c"],
+    ]
+    assert saved == [5, 9]
+    assert "imported: 0s 3o" in result.stdout
+
+
+def test_mem_pull_interrupted_keeps_last_completed_page_checkpoint(monkeypatch):
+    pages = [
+        {"observations": [_obs("a")], "has_more": True, "next_since": 5},
+        {"observations": [_obs("boom")], "has_more": False, "server_epoch": 9},
+    ]
+    saved, _requested, imported = _paged_pull_fixture(monkeypatch, pages)
+
+    result = runner.invoke(app, ["mem", "pull"])
+
+    assert result.exit_code == 1
+    assert len(imported) == 1
+    assert saved == [5]
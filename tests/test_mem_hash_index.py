@@ -0,0 +1,72 @@
+"""claude-mem observation content-hash sidecar 索引的測試。"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from script.utils import mem_sync
+
+
+@pytest.fixture
+def mem_db(tmp_path: Path, monkeypatch) -> Path:
+    db_path = tmp_path / "claude-mem.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE observations (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "title TEXT, narrative TEXT, text TEXT, facts TEXT, project TEXT, type TEXT)"
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(mem_sync, "CLAUDE_MEM_DB_PATH", db_path)
+    monkeypatch.setattr(
+        mem_sync, "get_hash_index_path", lambda: tmp_path / "cache" / "mem-hash-index.db"
+    )
+    return db_path
+
+
+def _insert(db_path: Path, *titles: str) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO observations (title, narrative, facts, project, type) "
+        "VALUES (?, 'n', NULL, 'p', 'fact')",
+        [(t,) for t in titles],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _expected(title: str) -> str:
+    return mem_sync.compute_content_hash(
+        {"title": title, "narrative": "n", "facts": None, "project": "p", "type": "fact"}
+    )
+
+
+def test_index_hashes_match_python_hash_and_update_incrementally(mem_db: Path):
+    _insert(mem_db, "a", "b")
+    assert mem_sync.get_observation_hashes([1, 2]) == {1: _expected("a"), 2: _expected("b")}
+
+    _insert(mem_db, "c")
+    assert mem_sync.get_observation_hashes([3]) == {3: _expected("c")}
+    assert mem_sync.find_local_content_hashes([_expected("c"), "missing"]) == {_expected("c")}
+
+
+def test_index_drops_deleted_rows_and_groups_duplicates(mem_db: Path):
+    _insert(mem_db, "a", "a", "b", "a")
+    assert mem_sync.get_duplicate_hash_groups() == [[1, 2, 4]]
+    assert mem_sync.get_hash_index_stats() == {"observations": 4, "duplicates": 2}
+
+    conn = sqlite3.connect(mem_db)
+    conn.execute("DELETE FROM observations WHERE id IN (2, 4)")
+    conn.commit()
+    conn.close()
+
+    assert mem_sync.get_duplicate_hash_groups() == []
+    assert mem_sync.get_hash_index_stats() == {"observations": 2, "duplicates": 0}
+
+
+def test_index_is_noop_without_local_db(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(mem_sync, "CLAUDE_MEM_DB_PATH", tmp_path / "missing.db")
+    assert mem_sync.get_observation_hashes([1]) == {}
+    assert mem_sync.find_local_content_hashes(["x"]) == set()
+    assert mem_sync.get_hash_index_stats() == {"observations": 0, "duplicates": 0}
@@ -0,0 +1,108 @@
+"""mem_sync.import_to_local_db 批次匯入的測試。"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from script.utils import mem_sync
+
+
+@pytest.fixture
+def mem_db(tmp_path: Path, monkeypatch) -> Path:
+    db_path = tmp_path / "claude-mem.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        f"""
+        CREATE TABLE sdk_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            {", ".join(c + (" TEXT UNIQUE" if c == "content_session_id" else "") for c in mem_sync._SESSION_COLS)}
+        );
+        CREATE TABLE observations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, {", ".join(mem_sync._OBSERVATION_COLS)}
+        );
+        CREATE TABLE session_summaries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, {", ".join(mem_sync._SUMMARY_COLS)}
+        );
+        CREATE TABLE user_prompts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, {", ".join(mem_sync._PROMPT_COLS)}
+        );
+        INSERT INTO sdk_sessions (content_session_id) VALUES ('c1');
+        INSERT INTO observations (memory_session_id, title, created_at_epoch)
+            VALUES ('m1', 'existing', 1);
+        INSERT INTO session_summaries (memory_session_id) VALUES ('m1');
+        INSERT INTO user_prompts (content_session_id, prompt_number) VALUES ('c1', 1);
+        """
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(mem_sync, "CLAUDE_MEM_DB_PATH", db_path)
+    return db_path
+
+
+def test_import_dedups_against_table_and_within_batch(mem_db: Path):
+    result = mem_sync.import_to_local_db(
+        {
+            "sessions": [
+                {"content_session_id": "c1"},
+                {"content_session_id": "c2"},
+                {"content_session_id": "c2"},
+            ],
+            "observations": [
+                {"memory_session_id": "m1", "title": "existing", "created_at_epoch": 1},
+                {"memory_session_id": "m1", "title": "new", "created_at_epoch": 2},
+                {"memory_session_id": "m1", "title": "new", "created_at_epoch": 2},
+                # key 含 NULL 時不視為重複（與逐筆 `=` 比對相同）
+                {"memory_session_id": "m1", "title": None, "created_at_epoch": 3},
+                {"memory_session_id": "m1", "title": None, "created_at_epoch": 3},
+            ],
+            "summaries": [
+                {"session_id": "m1"},
+                {"memory_session_id": "m2"},
+                {"request": "no session id"},
+            ],
+            "prompts": [
+                {"content_session_id": "c1", "prompt_number": 1},
+                {"content_session_id": "c1", "prompt_number": 2},
+            ],
+        }
+    )
+
+    assert result["stats"] == {
+        "sessionsImported": 1,
+        "sessionsSkipped": 2,
+        "observationsImported": 3,
+        "observationsSkipped": 2,
+        "summariesImported": 1,
+        "summariesSkipped": 2,
+        "promptsImported": 1,
+        "promptsSkipped": 1,
+    }
+    conn = sqlite3.connect(mem_db)
+    titles = [r[0] for r in conn.execute("SELECT title FROM observations ORDER BY id")]
+    journal = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    assert titles == ["existing", "new", None, None]
+    assert journal == "wal"
+
+
+def test_import_rolls_back_whole_batch_on_error(mem_db: Path):
+    conn = sqlite3.connect(mem_db)
+    conn.execute("DROP TABLE session_summaries")  # 讓匯入在 sessions 之後失敗
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(sqlite3.Error):
+        mem_sync.import_to_local_db(
+            {
+                "sessions": [{"content_session_id": "c9"}],
+                "summaries": [{"session_id": "m9"}],
+            }
+        )
+
+    conn = sqlite3.connect(mem_db)
+    count = conn.execute(
+        "SELECT COUNT(*) FROM sdk_sessions WHERE content_session_id = 'c9'"
+    ).fetchone()[0]
+    conn.close()
+    assert count == 0
@@ -0,0 +1,73 @@
+"""多平台並行分發排程的測試。"""
+
+import io
+import threading
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from script.utils import manifest as M
+from script.utils import shared
+
+
+def _configs(tmp_path: Path, **dsts: str) -> dict:
+    return {
+        target: {"name": target, "resources": [("skills", tmp_path / "src", tmp_path / dst)]}
+        for target, dst in dsts.items()
+    }
+
+
+def test_target_lanes_groups_overlapping_destinations(tmp_path: Path):
+    configs = _configs(tmp_path, a="one", b="two", c="one/skills", d="three")
+    assert shared._target_lanes(("a", "b", "c", "d"), configs) == [
+        ["a", "c"],
+        ["b"],
+        ["d"],
+    ]
+
+
+def test_run_targets_concurrently_buffers_output_per_target(tmp_path: Path, monkeypatch):
+    out = io.StringIO()
+    base = Console(file=out, width=80)
+    monkeypatch.setattr(shared, "console", base)
+    configs = _configs(tmp_path, a="one", b="two")
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _run(target: str, target_out: Console) -> bool:
+        assert target_out is not base
+        target_out.print(f"{target}: start")
+        barrier.wait()  # 兩個平台必須同時執行才能通過
+        M.cleanup_orphans(target, {"skills": [f"gone-{target}"]}, out=target_out)
+        return True
+
+    monkeypatch.setattr(M, "_get_target_resource_path", lambda *args: tmp_path / "missing")
+    results = shared._run_targets_concurrently(("a", "b"), configs, _run)
+
+    assert results == [True, True]
+    lines = [line for line in out.getvalue().splitlines() if line]
+    assert lines == [
+        "a: start",
+        "清理孤兒檔案 (1 個)...",
+        "  跳過（不存在）: skills/gone-a",
+        "b: start",
+        "清理孤兒檔案 (1 個)...",
+        "  跳過（不存在）: skills/gone-b",
+    ]
+    assert shared.console is base
+
+
+def test_run_targets_concurrently_reraises_after_flushing(tmp_path: Path, monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(shared, "console", Console(file=out, width=80))
+    configs = _configs(tmp_path, a="one", b="two")
+
+    def _run(target: str, target_out: Console) -> bool:
+        target_out.print(f"{target}: log")
+        if target == "a":
+            raise RuntimeError("boom")
+        return True
+
+    with pytest.raises(RuntimeError, match="boom"):
+        shared._run_targets_concurrently(("a", "b"), configs, _run)
+    assert out.getvalue() == "a: log\nb: log\n"
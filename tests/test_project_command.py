@@ -1,5 +1,6 @@
 """project 命令的整合測試。"""
 
+import json
 from pathlib import Path
 import subprocess
 from unittest.mock import patch
@@ -569,3 +570,54 @@ def test_project_init_force_does_not_bypass_auto_skill_confirmation(
     assert result.exit_code == 0, result.stdout
     assert (legacy_skill / "SKILL.md").read_text(encoding="utf-8") == "legacy"
     assert "非互動模式不會自動刪除" in result.stdout
+
+
+def test_project_reconcile_all_updates_every_tracked_project(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from script.utils import project_projection
+
+    template_dir = _make_template(tmp_path)
+    manifest_dir = tmp_path / "manifests" / "projects"
+    monkeypatch.setattr(project_command, "get_project_template_dir", lambda: template_dir)
+    monkeypatch.setattr(ppm, "get_project_manifest_dir", lambda: manifest_dir)
+
+    roots = {}
+    for project_id in ("alpha", "beta", "gone"):
+        project_root = tmp_path / project_id
+        (project_root / ".git" / "info").mkdir(parents=True)
+        _seed_project_intent(project_root, project_id=project_id)
+        hydrate_result = runner.invoke(app, ["project", "hydrate", str(project_root)])
+        assert hydrate_result.exit_code == 0, hydrate_result.stdout
+        roots[project_id] = project_root
+    (roots["gone"] / ".ai-dev-project.yaml").unlink()
+
+    _write(template_dir / ".claude" / "commands" / "review.md", "review v2\n")
+    versions: list[object] = []
+    real_version = project_projection.compute_template_version
+
+    def _spy(entries):
+        versions.append(entries)
+        return real_version(entries)
+
+    monkeypatch.setattr(project_projection, "compute_template_version", _spy)
+
+    result = runner.invoke(app, ["project", "reconcile", "--all", "--json", "-j", "2"])
+
+    assert result.exit_code == 0, result.stdout
+    summary = json.loads(result.stdout)
+    assert summary["totals"] == {
+        "projects": 3, "ok": 2, "conflict": 0, "missing": 1, "error": 0
+    }
+    assert [p["project_id"] for p in summary["projects"]] == ["alpha", "beta", "gone"]
+    assert summary["projects"][0]["generated"] == [".claude"]
+    assert len(versions) == 1
+    for project_id in ("alpha", "beta"):
+        review = roots[project_id] / ".claude" / "commands" / "review.md"
+        assert review.read_text(encoding="utf-8") == "review v2\n"
+
+
+def test_project_reconcile_all_rejects_target(tmp_path: Path):
+    result = runner.invoke(app, ["project", "reconcile", str(tmp_path), "--all"])
+
+    assert result.exit_code == 2
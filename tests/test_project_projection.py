@@ -1,9 +1,13 @@
 """project_projection.py 的單元測試。"""
 
+import os
+import time
 from pathlib import Path
 
 import pytest
 
+from script.utils import manifest as M
+from script.utils import project_projection as pp
 from script.utils import project_projection_manifest as ppm
 from script.utils.project_blocks import (
     get_block_markers,
@@ -229,3 +233,87 @@ def test_hydrate_project_respects_disabled_git_exclude(
 
     assert result.generated
     assert not (project_root / ".git" / "info" / "exclude").exists()
+
+
+def _age_tree(root: Path) -> None:
+    """把 mtime 拉到 racy 視窗之外，讓 fingerprint / 模板快取可被記錄。"""
+    past = time.time() - 60
+    for path in root.rglob("*"):
+        os.utime(path, (past, past))
+
+
+@pytest.fixture
+def projection_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict:
+    manifest_dir = tmp_path / "manifests" / "projects"
+    monkeypatch.setattr(ppm, "get_project_manifest_dir", lambda: manifest_dir)
+    cache_path = tmp_path / "cache" / "project-template-hashes.json"
+    monkeypatch.setattr(pp, "get_template_hash_cache_path", lambda: cache_path)
+    monkeypatch.setattr(pp, "_template_memo", {})
+    template_dir = _make_template(tmp_path)
+    _age_tree(template_dir)
+    return {"template": template_dir, "project": _make_project(tmp_path), "cache": cache_path}
+
+
+def test_hydrate_unchanged_project_skips_content_reads(projection_env, monkeypatch):
+    template_dir, project_root = projection_env["template"], projection_env["project"]
+    hydrate_project(project_root, template_dir=template_dir, max_workers=4)
+    _age_tree(project_root)
+    # managed block 首輪寫入時為 racy，第二輪補記 fingerprint
+    hydrate_project(project_root, template_dir=template_dir, max_workers=4)
+
+    hashed: list[str] = []
+    real_hash_files = M.hash_files
+
+    def _spy(items, **kwargs):
+        hashed.extend(str(path) for path, _st in items)
+        return real_hash_files(items, **kwargs)
+
+    def _no_block_read(*_args, **_kwargs):
+        raise AssertionError("managed block should not be re-read")
+
+    monkeypatch.setattr(M, "hash_files", _spy)
+    monkeypatch.setattr(pp, "read_managed_block", _no_block_read)
+
+    result = hydrate_project(project_root, template_dir=template_dir, max_workers=4)
+
+    assert result.generated == [] and result.conflicts == []
+    assert hashed == []
+    files = ppm.read_project_manifest("demo-project")["files"]
+    assert "fingerprints" in files[".claude"]
+    assert "fingerprint" in files["AGENTS.md"]
+
+
+def test_hydrate_detects_edit_behind_fingerprint(projection_env):
+    template_dir, project_root = projection_env["template"], projection_env["project"]
+    hydrate_project(project_root, template_dir=template_dir)
+    _age_tree(project_root)
+    hydrate_project(project_root, template_dir=template_dir)
+
+    _write(project_root / ".claude" / "commands" / "review.md", "locally edited\n")
+    result = hydrate_project(project_root, template_dir=template_dir)
+
+    assert result.conflicts == [".claude"]
+    assert (project_root / ".claude" / "commands" / "review.md").read_text(
+        encoding="utf-8"
+    ) == "locally edited\n"
+
+
+def test_template_hashes_are_reused_across_processes(projection_env, monkeypatch):
+    template_dir = projection_env["template"]
+    entries = pp._collect_projection_entries(template_dir)
+    first = pp.get_template_hashes(template_dir, entries)
+    assert projection_env["cache"].exists()
+
+    monkeypatch.setattr(pp, "_template_memo", {})
+
+    def _no_rehash(*_args):
+        raise AssertionError("template should not be re-hashed")
+
+    monkeypatch.setattr(pp, "_compute_template_hashes", _no_rehash)
+    assert pp.get_template_hashes(template_dir, entries).hashes == first.hashes
+
+    # 模板內容變動 → 內容版本不同 → 重新計算
+    _write(template_dir / ".claude" / "commands" / "review.md", "new review\n")
+    _age_tree(template_dir)
+    with pytest.raises(AssertionError, match="re-hashed"):
+        pp.get_template_hashes(template_dir, entries)
@@ -0,0 +1,152 @@
+"""`ai-dev update` 並行儲存庫更新的測試。"""
+
+import subprocess
+import threading
+from pathlib import Path
+
+from script.services.repos import refresh
+from script.utils import repo_probe
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _make_clone(tmp_path: Path, name: str) -> tuple[Path, Path]:
+    """建立 origin（含一個 commit）與其 clone，回傳 (作者工作目錄, clone)。"""
+    author = tmp_path / f"{name}-author"
+    author.mkdir()
+    _git(author, "init", "-q", "-b", "main")
+    _git(author, "config", "user.email", "test@example.com")
+    _git(author, "config", "user.name", "Test User")
+    (author / "README.md").write_text("v1")
+    _git(author, "add", ".")
+    _git(author, "commit", "-q", "-m", "v1")
+    clone = tmp_path / name
+    _git(tmp_path, "clone", "-q", str(author), str(clone))
+    return author, clone
+
+
+def test_refresh_repos_concurrently_fetches_and_resets(tmp_path: Path):
+    author, clone = _make_clone(tmp_path, "alpha")
+    _, idle = _make_clone(tmp_path, "beta")
+    (author / "README.md").write_text("v2")
+    _git(author, "commit", "-q", "-am", "v2")
+
+    jobs = [
+        refresh.RepoRefreshJob(name="alpha", path=clone, branch="main"),
+        refresh.RepoRefreshJob(name="beta", path=idle, branch="main"),
+    ]
+    refresh.refresh_repos_concurrently(jobs, tmp_path / "backups", max_workers=2)
+
+    assert [job.updated for job in jobs] == [True, False]
+    assert not any(job.failed for job in jobs)
+    assert (clone / "README.md").read_text() == "v2"
+    assert jobs[0].output.startswith("正在更新 ")
+    assert "HEAD is now at" in jobs[0].output
+
+
+def test_refresh_repos_concurrently_overlaps_repos_and_keeps_order(
+    tmp_path: Path, monkeypatch
+):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _fake_refresh(job, _backup_root, _timeout):
+        barrier.wait()  # 三個儲存庫必須同時執行才能通過
+        job._buffer.write(f"{job.name}\n")
+
+    monkeypatch.setattr(refresh, "_refresh_repo", _fake_refresh)
+    jobs = [
+        refresh.RepoRefreshJob(name=name, path=tmp_path / name, branch="main")
+        for name in ("a", "b", "c")
+    ]
+
+    refresh.refresh_repos_concurrently(jobs, tmp_path, max_workers=3)
+
+    assert [job.output for job in jobs] == ["a\n", "b\n", "c\n"]
+
+
+def test_refresh_repo_skips_reset_when_fetch_times_out(tmp_path: Path, monkeypatch):
+    calls: list[list[str]] = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(refresh.subprocess, "run", _fake_run)
+    job = refresh.RepoRefreshJob(name="slow", path=tmp_path, branch="main")
+
+    refresh.refresh_repos_concurrently([job], tmp_path, timeout=0.5)
+
+    assert ["git", "fetch", "--all"] in calls
+    assert not any("reset" in cmd for cmd in calls)
+    assert job.failed is True
+    assert "超過 0.5 秒未完成" in job.output
+
+
+def test_update_repos_phase_summarizes_failed_repos(
+    tmp_path: Path, monkeypatch, capsys
+):
+    for name in ("uds", "ecc"):
+        (tmp_path / name / ".git").mkdir(parents=True)
+
+    def _fake_refresh(jobs, _backup_root, *, max_workers=None):
+        for job in jobs:
+            job.failed = job.name == "ecc"
+            job.output = f"{job.name} output\n"
+        return jobs
+
+    monkeypatch.setattr(refresh, "migrate_opencode_superpowers", lambda: None)
+    monkeypatch.setattr(refresh, "refresh_codex_superpowers_symlinks", lambda _path: None)
+    monkeypatch.setattr(refresh, "refresh_repos_concurrently", _fake_refresh)
+    monkeypatch.setattr(refresh, "load_custom_repos", lambda: {})
+    for getter in (
+        "get_custom_skills_dir",
+        "get_superpowers_dir",
+        "get_codex_superpowers_dir",
+        "get_obsidian_skills_dir",
+        "get_anthropic_skills_dir",
+    ):
+        monkeypatch.setattr(refresh, getter, lambda: tmp_path / "missing")
+    monkeypatch.setattr(refresh, "get_uds_dir", lambda: tmp_path / "uds")
+    monkeypatch.setattr(refresh, "get_ecc_dir", lambda: tmp_path / "ecc")
+    monkeypatch.setattr(
+        "script.utils.paths.get_npx_skills_project_yaml", lambda: tmp_path / "none.yaml"
+    )
+
+    refresh._run_update_repos_phase()
+
+    out = capsys.readouterr().out
+    summary = out.split("1 個儲存庫更新失敗", 1)[1].splitlines()
+    assert summary[1].strip() == "• ecc"
+    assert out.index("ecc output") < out.index("1 個儲存庫更新失敗")
+
+
+def test_probe_repo_reports_branch_upstream_and_dirty(tmp_path: Path):
+    author, clone = _make_clone(tmp_path, "gamma")
+    (author / "README.md").write_text("v2")
+    _git(author, "commit", "-q", "-am", "v2")
+    _git(clone, "fetch", "-q")
+    (clone / "README.md").write_text("local edit")
+
+    probe = repo_probe.probe_repo(clone)
+
+    assert probe.ok is True
+    assert probe.head == _git(clone, "rev-parse", "HEAD")
+    assert (probe.branch, probe.upstream) == ("main", "origin/main")
+    assert (probe.ahead, probe.behind) == (0, 1)
+    assert probe.dirty is True
+    assert probe.has_upstream_updates is True
+    assert repo_probe.probe_repo(tmp_path / "missing").ok is False
+
+
+def test_parse_porcelain_v2_handles_detached_and_initial():
+    probe = repo_probe.parse_porcelain_v2(
+        Path("."),
+        "# branch.oid (initial)\n# branch.head (detached)\n? untracked.txt\n",
+    )
+    assert (probe.head, probe.branch, probe.upstream) == (None, None, None)
+    assert probe.in_sync_with_upstream is None
+    assert probe.dirty is False
@@ -0,0 +1,121 @@
+"""資源清單索引（`list_installed_resources` / TUI 共用）的測試。"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from script.utils import shared
+
+
+def _age(*paths: Path) -> None:
+    """把目錄 mtime 拉到過去，避開 racy 視窗。"""
+    past = time.time() - 60
+    for path in paths:
+        os.utime(path, (past, past))
+
+
+@pytest.fixture
+def layout(tmp_path: Path, monkeypatch) -> Path:
+    for rel in (
+        "uds/skills/claude-code/testing-guide",
+        "ecc/skills/tdd-workflow",
+        "ecc/commands",
+        "custom/skills/git-helper",
+        "custom/skills/uds/commit-standards",
+        "custom/commands/claude",
+        "targets/claude/skills/testing-guide",
+        "targets/claude/skills/git-helper",
+        "targets/claude/skills/mine",
+        "targets/claude/skills/.system",
+        "targets/claude/commands",
+        "custom/disabled/claude/skills/tdd-workflow",
+    ):
+        (tmp_path / rel).mkdir(parents=True)
+    (tmp_path / "ecc/commands/plan.md").write_text("x")
+    (tmp_path / "custom/commands/claude/review.md").write_text("x")
+    (tmp_path / "targets/claude/commands/plan.md").write_text("x")
+    (tmp_path / "targets/claude/commands/review.md").write_text("x")
+
+    monkeypatch.setattr(shared, "get_uds_dir", lambda: tmp_path / "uds")
+    monkeypatch.setattr(shared, "get_obsidian_skills_dir", lambda: tmp_path / "obsidian")
+    monkeypatch.setattr(shared, "get_anthropic_skills_dir", lambda: tmp_path / "anthropic")
+    monkeypatch.setattr(shared, "get_ecc_dir", lambda: tmp_path / "ecc")
+    monkeypatch.setattr(shared, "get_custom_skills_dir", lambda: tmp_path / "custom")
+    monkeypatch.setattr(
+        shared, "get_target_path", lambda t, rt: tmp_path / "targets" / t / rt
+    )
+    monkeypatch.setattr(
+        shared, "_resource_inventory", shared.ResourceInventory(tmp_path / "inventory.json")
+    )
+    _age(*(p for p in tmp_path.rglob("*") if p.is_dir()), tmp_path)
+    return tmp_path
+
+
+def _forbid_rescans(monkeypatch) -> None:
+    def _boom(*_args, **_kwargs):
+        raise AssertionError("should be served from the inventory")
+
+    monkeypatch.setattr(shared, "_SOURCE_SCANNERS", dict.fromkeys(shared._SOURCE_SCANNERS, _boom))
+    monkeypatch.setattr(shared, "_scan_target_resources", _boom)
+
+
+def test_list_installed_resources_reports_sources_and_disabled(layout: Path):
+    result = shared.list_installed_resources("claude")
+
+    assert result["claude"]["skills"] == [
+        {"name": "git-helper", "source": "custom-skills", "disabled": False},
+        {"name": "mine", "source": "user", "disabled": False},
+        {"name": "testing-guide", "source": "universal-dev-standards", "disabled": False},
+        {"name": "tdd-workflow", "source": "everything-claude-code", "disabled": True},
+    ]
+    assert [(i["name"], i["source"]) for i in result["claude"]["commands"]] == [
+        ("plan", "everything-claude-code"),
+        ("review", "custom-skills"),
+    ]
+    assert shared.get_all_skill_names() == [
+        "commit-standards",
+        "git-helper",
+        "tdd-workflow",
+        "testing-guide",
+    ]
+
+
+def test_inventory_is_reused_across_processes_until_a_directory_changes(
+    layout: Path, monkeypatch
+):
+    first = shared.list_installed_resources("claude", "skills")
+    assert (layout / "inventory.json").exists()
+
+    # 新的行程：只讀索引檔，不重掃任何目錄
+    monkeypatch.setattr(
+        shared, "_resource_inventory", shared.ResourceInventory(layout / "inventory.json")
+    )
+    scan_target = shared._scan_target_resources
+    _forbid_rescans(monkeypatch)
+    assert shared.list_installed_resources("claude", "skills") == first
+
+    # target 目錄新增 skill → 只重掃該 target 元件，來源集合仍走索引
+    (layout / "targets/claude/skills/new-skill").mkdir()
+    monkeypatch.setattr(shared, "_scan_target_resources", scan_target)
+    result = shared.list_installed_resources("claude", "skills")
+    names = [i["name"] for i in result["claude"]["skills"]]
+    assert "new-skill" in names
+
+
+def test_recently_modified_directories_are_not_trusted(layout: Path, monkeypatch):
+    inventory = shared.get_resource_inventory()
+    inventory.target_resources("claude", "skills")
+
+    # mtime 在 racy 視窗內：即使指紋相同也要重掃
+    os.utime(layout / "targets/claude/skills", None)
+    inventory.target_resources("claude", "skills")
+    calls: list[str] = []
+    monkeypatch.setattr(
+        shared,
+        "_scan_target_resources",
+        lambda t, rt: calls.append(t) or {"enabled": [], "disabled": []},
+    )
+    assert inventory.target_resources("claude", "skills") == ([], [])
+    assert calls == ["claude"]
@@ -36,3 +36,34 @@ def test_status_invalid_section_exit_1():
 
     assert result.exit_code == 1
     assert "無效的 section" in result.stdout
+
+
+def test_status_repos_section_uses_batched_probe(tmp_path: Path, monkeypatch):
+    from script.utils.repo_probe import RepoProbe
+
+    stale = tmp_path / "stale"
+    fresh = tmp_path / "fresh"
+    for path in (stale, fresh):
+        (path / ".git").mkdir(parents=True)
+    probed: list[list[Path]] = []
+
+    def _fake_probe_repos(paths):
+        probed.append(list(paths))
+        return [
+            RepoProbe(path=p, ok=True, ahead=0, behind=2 if p == stale else 0)
+            for p in paths
+        ]
+
+    monkeypatch.setattr(status_cmd, "probe_repos", _fake_probe_repos)
+    monkeypatch.setattr(
+        status_cmd,
+        "REPOS",
+        {"stale_repo": ("", lambda: stale), "fresh_repo": ("", lambda: fresh)},
+    )
+
+    result = runner.invoke(app, ["status", "--section", "repos"])
+
+    assert result.exit_code == 0
+    assert probed == [[stale, fresh]]
+    assert "有可用更新" in result.stdout
+    assert "最新" in result.stdout
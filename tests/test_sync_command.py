@@ -56,6 +56,7 @@ def test_sync_init_writes_default_config(tmp_path: Path, monkeypatch):
     monkeypatch.setattr(sync_cmd, "git_add_commit", lambda *_args, **_kwargs: False)
     monkeypatch.setattr(sync_cmd, "git_pull_rebase", lambda *_args, **_kwargs: True)
     monkeypatch.setattr(sync_cmd, "git_push", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(sync_cmd, "write_sync_snapshots", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
         sync_cmd, "save_sync_config", lambda data: captured.update({"cfg": data})
     )
@@ -113,6 +114,7 @@ def test_sync_init_existing_repo_runs_lfs_migrate(tmp_path: Path, monkeypatch):
     monkeypatch.setattr(sync_cmd, "git_add_commit", lambda *_args, **_kwargs: False)
     monkeypatch.setattr(sync_cmd, "git_pull_rebase", lambda *_args, **_kwargs: True)
     monkeypatch.setattr(sync_cmd, "git_push", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(sync_cmd, "write_sync_snapshots", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(sync_cmd, "save_sync_config", lambda *_args, **_kwargs: None)
 
     result = runner.invoke(
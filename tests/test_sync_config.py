@@ -372,3 +372,52 @@ def test_expand_paths_in_local_processes_multiple_directories(
     )
 
     assert changed_files == [str(changed_settings)]
+
+
+def test_sync_snapshot_skips_reading_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    import os
+
+    local = tmp_path / "local"
+    repo = tmp_path / "repo"
+    for root in (local, repo):
+        root.mkdir()
+        (root / "same.md").write_text("same", encoding="utf-8")
+        (root / "edited.md").write_text("v1", encoding="utf-8")
+    past = 1_600_000_000
+    for path in [*local.iterdir(), *repo.iterdir()]:
+        os.utime(path, (past, past))
+    monkeypatch.setattr(sync_config, "get_sync_snapshot_dir", lambda: tmp_path / "snapshots")
+
+    sync_config.write_sync_snapshot(local, repo, [])
+    (local / "edited.md").write_text("v2", encoding="utf-8")
+
+    read_paths: list[str] = []
+    real_hash = sync_config._hash_file
+
+    def _spy_hash(path):
+        read_paths.append(Path(path).name)
+        return real_hash(path)
+
+    def _no_filecmp(*_args, **_kwargs):
+        raise AssertionError("full compare should not run when a snapshot exists")
+
+    monkeypatch.setattr(sync_config, "_hash_file", _spy_hash)
+    monkeypatch.setattr(sync_config, "_files_equal", _no_filecmp)
+
+    assert sync_config.count_directory_changes(local, repo, []) == 1
+    assert read_paths == ["edited.md"]
+
+
+def test_sync_snapshot_without_snapshot_falls_back_to_full_compare(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    local = tmp_path / "local"
+    repo = tmp_path / "repo"
+    for root, text in ((local, "a"), (repo, "b")):
+        root.mkdir()
+        (root / "file.md").write_text(text, encoding="utf-8")
+    monkeypatch.setattr(sync_config, "get_sync_snapshot_dir", lambda: tmp_path / "snapshots")
+
+    assert sync_config.count_directory_changes(local, repo, []) == 1
@@ -103,3 +103,130 @@ def test_generate_sync_commit_message_has_required_format(
     assert (
         sync_config.generate_sync_commit_message() == "sync: test-host 2026-02-13-2115"
     )
+
+
+def test_collect_files_matches_per_file_exclude_semantics(tmp_path: Path):
+    root = tmp_path / "claude"
+    for rel in [
+        "settings.json",
+        "stats-cache.json",
+        "debug/log.txt",
+        "plugins/cache/x/y.json",
+        "plugins/config.json",
+        "projects/a/session.jsonl",
+        "projects/a/.DS_Store",
+        "node_modules/pkg/index.js",
+        "build-cache/tmp/blob.bin",
+        "notes/debug/keep.md",
+    ]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel, encoding="utf-8")
+    (root / "linked").symlink_to(root / "projects", target_is_directory=True)
+    (root / "settings-link.json").symlink_to(root / "settings.json")
+
+    excludes = [*sync_config.CLAUDE_IGNORE_PATTERNS, "build-*", "*.jsonl"]
+    expected = {
+        path.relative_to(root).as_posix()
+        for path in root.rglob("*")
+        if path.is_file()
+        and not sync_config._is_excluded(path.relative_to(root).as_posix(), excludes)
+    }
+
+    files = sync_config._collect_files(root, excludes)
+
+    assert set(files) == expected
+    assert "notes/debug/keep.md" in files
+    assert "settings-link.json" in files
+    assert all(not rel.startswith("linked/") for rel in files)
+
+
+def test_collect_files_prunes_excluded_directories(tmp_path: Path, monkeypatch):
+    root = tmp_path / "claude"
+    (root / "cache" / "deep").mkdir(parents=True)
+    (root / "cache" / "deep" / "blob").write_text("x", encoding="utf-8")
+    (root / "keep.md").write_text("k", encoding="utf-8")
+
+    scanned: list[str] = []
+    real_scandir = sync_config.os.scandir
+
+    def _spy(path):
+        scanned.append(Path(path).name)
+        return real_scandir(path)
+
+    monkeypatch.setattr(sync_config.os, "scandir", _spy)
+
+    assert set(sync_config._collect_files(root, ["cache/"])) == {"keep.md"}
+    assert "cache" not in scanned and "deep" not in scanned
+
+
+def _seed_sync_pair(root: Path) -> tuple[Path, Path]:
+    src = root / "src"
+    dst = root / "dst"
+    for i in range(40):
+        sub = src / f"d{i % 4}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"f{i}.md").write_text(f"content {i}\n", encoding="utf-8")
+    (dst / "d0").mkdir(parents=True)
+    (dst / "d0" / "f0.md").write_text("content 0\n", encoding="utf-8")
+    (dst / "d0" / "f4.md").write_text("CONTENT 4\n", encoding="utf-8")
+    (dst / "d1").mkdir()
+    (dst / "d1" / "f1.md").write_text("stale and longer\n", encoding="utf-8")
+    (dst / "gone").mkdir()
+    (dst / "gone" / "old.md").write_text("old\n", encoding="utf-8")
+    return src, dst
+
+
+def test_sync_directory_parallel_matches_shutil_stats(tmp_path: Path):
+    legacy_src, legacy_dst = _seed_sync_pair(tmp_path / "legacy")
+    src, dst = _seed_sync_pair(tmp_path / "parallel")
+
+    expected = sync_config._sync_directory_shutil(legacy_src, legacy_dst, [], delete=True)
+    result = sync_config._sync_directory_parallel(src, dst, [], delete=True, max_workers=4)
+
+    for key in ("added", "updated", "deleted", "files"):
+        assert result[key] == expected[key]
+    assert (result["added"], result["updated"], result["deleted"]) == (37, 2, 1)
+    assert result["method"] == "parallel"
+    assert (dst / "d0" / "f4.md").read_text(encoding="utf-8") == "content 4\n"
+    assert not (dst / "gone").exists()
+
+    again = sync_config._sync_directory_parallel(src, dst, [], delete=True, max_workers=4)
+    assert (again["added"], again["updated"], again["deleted"]) == (0, 0, 0)
+
+
+def test_fast_copy2_falls_back_without_copy_offload(tmp_path: Path, monkeypatch):
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(b"x" * 5000)
+    dst.write_bytes(b"previous longer content" * 500)
+    monkeypatch.setattr(sync_config, "_offload_copy", lambda *_args: False)
+
+    sync_config._fast_copy2(src, dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_parse_rsync_itemized_counts_added_updated_deleted():
+    output = "\n".join(
+        [
+            "sending incremental file list",
+            "*deleting   old/stale.md",
+            "*deleting   old/",
+            ".d..t...... ./",
+            "cd+++++++++ new/",
+            ">f+++++++++ new/a.md",
+            ">f+++++++++ new/b.md",
+            ">f.st...... keep.md",
+            ".f...p..... perms-only.md",
+            "",
+            "Number of files: 1,204 (reg: 1,100, dir: 104)",
+        ]
+    )
+    assert sync_config._parse_rsync_itemized(output) == {
+        "added": 2,
+        "updated": 1,
+        "deleted": 1,
+    }
+    assert sync_config._parse_rsync_stat(output, "Number of files") == 1204
@@ -0,0 +1,154 @@
+"""批次啟用 / 停用交易 API 的測試。"""
+
+from pathlib import Path
+
+import pytest
+
+from script.utils import shared
+from script.utils.shared import ToggleChange
+
+
+@pytest.fixture
+def toggle_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict:
+    targets = {
+        ("claude", "skills"): tmp_path / "claude" / "skills",
+        ("claude", "commands"): tmp_path / "claude" / "commands",
+    }
+    for path in targets.values():
+        path.mkdir(parents=True)
+    env = {"root": tmp_path, "config": {}, "saves": 0}
+
+    def _save(config):
+        env["config"] = config
+        env["saves"] += 1
+
+    monkeypatch.setattr(shared, "get_target_path", lambda t, rt: targets.get((t, rt)))
+    monkeypatch.setattr(shared, "get_disabled_base_dir", lambda: tmp_path / "disabled")
+    monkeypatch.setattr(shared, "load_toggle_config", lambda: env["config"])
+    monkeypatch.setattr(shared, "save_toggle_config", _save)
+    return env
+
+
+def _skill(root: Path, name: str) -> Path:
+    path = root / "claude" / "skills" / name
+    path.mkdir(parents=True)
+    (path / "SKILL.md").write_text(name, encoding="utf-8")
+    return path
+
+
+def test_apply_toggle_batch_moves_all_and_writes_config_once(toggle_env):
+    root = toggle_env["root"]
+    for name in ("a", "b", "c"):
+        _skill(root, name)
+    (root / "claude" / "commands" / "cmd.md").write_text("cmd", encoding="utf-8")
+    progress: list[int] = []
+
+    result = shared.apply_toggle_batch(
+        [
+            ToggleChange("claude", "skills", "a", False),
+            ToggleChange("claude", "skills", "b", False),
+            ToggleChange("claude", "commands", "cmd", False),
+            ToggleChange("claude", "skills", "c", True),
+        ],
+        max_workers=4,
+        on_progress=lambda done, _total: progress.append(done),
+    )
+
+    assert result.ok and not result.rolled_back
+    assert len(result.applied) == 3
+    assert [c.name for c in result.skipped] == ["c"]
+    assert sorted(progress) == [1, 2, 3]
+    assert toggle_env["saves"] == 1
+    assert sorted(toggle_env["config"]["claude"]["skills"]["disabled"]) == ["a", "b"]
+    assert toggle_env["config"]["claude"]["commands"]["disabled"] == ["cmd"]
+    assert (root / "disabled" / "claude" / "skills" / "a" / "SKILL.md").exists()
+    assert (root / "disabled" / "claude" / "commands" / "cmd.md").exists()
+    assert not (root / "claude" / "skills" / "a").exists()
+
+    again = shared.apply_toggle_batch([ToggleChange("claude", "skills", "a", True)])
+    assert [c.name for c in again.applied] == ["a"]
+    assert toggle_env["config"]["claude"]["skills"]["disabled"] == ["b"]
+    assert (root / "claude" / "skills" / "a" / "SKILL.md").read_text(encoding="utf-8") == "a"
+
+
+def test_apply_toggle_batch_rolls_back_when_one_move_fails(toggle_env, monkeypatch):
+    root = toggle_env["root"]
+    for name in ("a", "b", "c"):
+        _skill(root, name)
+    # 停用目錄已有舊版 a，失敗時必須原樣保留
+    stale = root / "disabled" / "claude" / "skills" / "a"
+    stale.mkdir(parents=True)
+    (stale / "SKILL.md").write_text("stale", encoding="utf-8")
+
+    real_move = shared._move_path
+
+    def _flaky_move(src: Path, dst: Path) -> None:
+        if src.name == "b":
+            raise OSError("disk full")
+        real_move(src, dst)
+
+    monkeypatch.setattr(shared, "_move_path", _flaky_move)
+
+    result = shared.apply_toggle_batch(
+        [ToggleChange("claude", "skills", name, False) for name in ("a", "b", "c")],
+        max_workers=1,
+    )
+
+    assert result.rolled_back and not result.applied
+    assert [(c.name, reason) for c, reason in result.failed] == [("b", "disk full")]
+    assert toggle_env["saves"] == 0
+    for name in ("a", "b", "c"):
+        assert (root / "claude" / "skills" / name / "SKILL.md").read_text(encoding="utf-8") == name
+    assert (stale / "SKILL.md").read_text(encoding="utf-8") == "stale"
+    assert not (root / "disabled" / "claude" / "skills" / "c").exists()
+    assert sorted(p.name for p in stale.parent.iterdir()) == ["a"]
+
+
+def test_apply_toggle_batch_reports_missing_without_aborting(toggle_env):
+    root = toggle_env["root"]
+    _skill(root, "a")
+
+    result = shared.apply_toggle_batch(
+        [
+            ToggleChange("claude", "skills", "ghost", False),
+            ToggleChange("claude", "skills", "a", True),
+            ToggleChange("claude", "skills", "a", False),
+            ToggleChange("codex", "skills", "x", False),
+        ]
+    )
+
+    assert not result.ok and not result.rolled_back
+    assert [c.name for c in result.applied] == ["a"]
+    assert sorted(c.name for c, _ in result.failed) == ["ghost", "x"]
+    assert toggle_env["config"]["claude"]["skills"]["disabled"] == ["a"]
+
+
+def test_apply_toggle_batch_enable_without_source_fails_alone(toggle_env, monkeypatch):
+    root = toggle_env["root"]
+    _skill(root, "a")
+    upstream = root / "upstream" / "fresh"
+    upstream.mkdir(parents=True)
+    (upstream / "SKILL.md").write_text("fresh", encoding="utf-8")
+    toggle_env["config"] = {"claude": {"skills": {"disabled": ["fresh", "orphan"]}}}
+    monkeypatch.setattr(
+        shared,
+        "find_resource_source",
+        lambda rt, name: upstream if name == "fresh" else None,
+    )
+
+    result = shared.apply_toggle_batch(
+        [
+            ToggleChange("claude", "skills", "orphan", True),
+            ToggleChange("claude", "skills", "fresh", True),
+            ToggleChange("claude", "skills", "a", False),
+        ]
+    )
+
+    assert not result.ok and not result.rolled_back
+    assert sorted(c.name for c in result.applied) == ["a", "fresh"]
+    assert [c.name for c, _ in result.failed] == ["orphan"]
+    assert toggle_env["saves"] == 1
+    assert toggle_env["config"]["claude"]["skills"]["disabled"] == ["orphan", "a"]
+    assert (root / "claude" / "skills" / "fresh" / "SKILL.md").read_text(encoding="utf-8") == "fresh"
+    assert (upstream / "SKILL.md").exists()
+    assert (root / "disabled" / "claude" / "skills" / "a" / "SKILL.md").exists()
@@ -29,3 +29,90 @@ def test_clone_button_no_longer_passes_sync_project_args(monkeypatch):
     app.on_button_pressed(SimpleNamespace(button=SimpleNamespace(id="btn-clone")))
 
     assert calls == [("clone", None)]
+
+
+def test_plan_stable_rows_moves_only_the_toggled_row():
+    from script.tui.app import plan_stable_rows
+
+    current = ["a", "b", "c", "d"]
+    # 停用 b 後它會移到清單尾端：只有 b 需要移動
+    assert plan_stable_rows(current, ["a", "c", "d", "b"]) == {"a", "c", "d"}
+    assert plan_stable_rows(current, ["new", "a", "b"]) == {"a", "b"}
+    assert plan_stable_rows([], ["a"]) == set()
+
+
+def test_resource_list_patches_rows_and_toggles_in_background(monkeypatch):
+    import asyncio
+
+    from textual.widgets import Checkbox
+
+    from script.tui import app as tui_app
+    from script.utils import shared
+
+    state = {"a": True, "b": True, "c": False}
+    calls: list[tuple[str, str]] = []
+
+    def fake_list(target, resource_type):
+        items = sorted(
+            ({"name": n, "source": "custom-skills", "disabled": not on} for n, on in state.items()),
+            key=lambda x: (x["disabled"], x["name"]),
+        )
+        return {target: {resource_type: items}}
+
+    def fake_toggle(action, value):
+        def _run(_target, _rt, name, quiet=False):
+            calls.append((action, name))
+            state[name] = value
+            return True
+
+        return _run
+
+    monkeypatch.setattr(tui_app, "list_installed_resources", fake_list)
+    monkeypatch.setattr(tui_app, "enable_resource", fake_toggle("enable", True))
+    monkeypatch.setattr(tui_app, "disable_resource", fake_toggle("disable", False))
+    def fake_batch(changes, on_progress=None, **_kwargs):
+        for done, change in enumerate(changes, start=1):
+            action = "enable" if change.enabled else "disable"
+            fake_toggle(action, change.enabled)(change.target, change.resource_type, change.name)
+            if on_progress is not None:
+                on_progress(done, len(changes))
+        return shared.ToggleBatchResult(applied=list(changes))
+
+    monkeypatch.setattr(tui_app, "apply_toggle_batch", fake_batch)
+    monkeypatch.setattr(tui_app, "load_toggle_config", lambda: {})
+    for method in (
+        "update_mcp_config_display",
+        "update_standards_profile_display",
+        "update_hooks_status_display",
+    ):
+        monkeypatch.setattr(SkillManagerApp, method, lambda self: None)
+
+    def order(app):
+        return [child.resource_name for child in app.query_one("#resource-list").children]
+
+    async def settle(pilot, condition):
+        for _ in range(200):
+            await pilot.pause(0.01)
+            if condition():
+                return
+        raise AssertionError(f"TUI did not settle: {order(pilot.app)} {calls}")
+
+    async def scenario():
+        app = SkillManagerApp()
+        async with app.run_test() as pilot:
+            await settle(pilot, lambda: order(app) == ["a", "b", "c"])
+            rows = dict(app._resource_rows)
+
+            rows["a"].query_one(Checkbox).value = False
+            await settle(pilot, lambda: order(app) == ["b", "a", "c"])
+            assert calls == [("disable", "a")]
+            # 同一批 widget 被重用，只是重新排序
+            assert app._resource_rows == rows
+
+            app.action_select_all()
+            await settle(pilot, lambda: order(app) == ["a", "b", "c"] and len(calls) == 3)
+            assert sorted(calls[1:]) == [("enable", "a"), ("enable", "c")]
+            assert all(state.values())
+            assert app._resource_rows == rows
+
+    asyncio.run(scenario())
@@ -37,7 +37,9 @@ def test_update_builds_execution_plan_and_calls_pipeline(monkeypatch):
     monkeypatch.setattr(
         update_command,
         "execute_update_plan",
-        lambda incoming_plan: captured.update({"plan": incoming_plan}),
+        lambda incoming_plan, **kwargs: captured.update(
+            {"plan": incoming_plan, "extra": kwargs}
+        ),
     )
 
     result = runner.invoke(app, ["update", "--dry-run"])
@@ -50,6 +52,7 @@ def test_update_builds_execution_plan_and_calls_pipeline(monkeypatch):
         "dry_run": True,
     }
     assert captured["plan"] == plan
+    assert captured["extra"] == {"repo_jobs": None}
 
 
 def test_update_reports_invalid_phase_without_traceback():